@@ -0,0 +1,77 @@
+"""Time and peak memory of the fused ATR kernel against the original Series-based calculate_atr
+
+    python benchmarks/atr.py                  # 1M bars
+    python benchmarks/atr.py --bars 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.pipeline import measure, synthetic_bars  # noqa: E402
+from swing_core.indicators import AtrState, atr_kernel, calculate_atr  # noqa: E402
+
+
+def series_atr(high, low, close, period=14):
+    """calculate_atr as it was before the kernel: three Series, two maximum temporaries and a rolling mean"""
+    high_low = high - low
+    high_close = np.abs(high - close.shift())
+    low_close = np.abs(low - close.shift())
+
+    true_range = np.maximum(high_low, np.maximum(high_close, low_close))
+    return true_range.rolling(window=period).mean()
+
+
+def stream_us(high, low, close, smoothing: str, n_bars: int) -> float:
+    """Microseconds per AtrState.push over the last n_bars, seeded from the bars before them"""
+    state = AtrState.from_bars(high[:-n_bars], low[:-n_bars], close[:-n_bars], smoothing=smoothing)
+    bars = list(zip(high[-n_bars:].tolist(), low[-n_bars:].tolist(), close[-n_bars:].tolist()))
+    start = time.perf_counter()
+    for bar in bars:
+        state.push(*bar)
+    return (time.perf_counter() - start) / n_bars * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    bars = synthetic_bars(args.bars, args.seed)
+    high, low, close = bars['High'], bars['Low'], bars['Close']
+    arrays = tuple(column.to_numpy(dtype=np.float64) for column in (high, low, close))
+    reference = series_atr(high, low, close).to_numpy()
+    assert np.array_equal(atr_kernel(*arrays), reference, equal_nan=True), 'kernel differs from the Series ATR'
+
+    cases = [
+        ('series (before)', lambda: None, lambda _: series_atr(high, low, close)),
+        ('calculate_atr', lambda: None, lambda _: calculate_atr(high, low, close)),
+        ('kernel sma', lambda: None, lambda _: atr_kernel(*arrays)),
+        # A caller refreshing the same window reuses its output buffer
+        ('kernel sma, reused out', lambda: np.empty(args.bars), lambda out: atr_kernel(*arrays, out=out)),
+        ('kernel wilder', lambda: None, lambda _: atr_kernel(*arrays, smoothing='wilder')),
+    ]
+    print(f'{args.bars:,} bars')
+    print(f"{'case':<26}{'best ms':>10}{'median ms':>11}{'peak MB':>10}")
+    results = {}
+    for name, setup, run in cases:
+        result = results[name] = measure(setup, run, args.repeat)
+        print(f"{name:<26}{result['best_ms']:>10.1f}{result['median_ms']:>11.1f}{result['peak_kb'] / 1024:>10.1f}")
+
+    before, after = results['series (before)'], results['calculate_atr']
+    print(f"calculate_atr: {before['best_ms'] / after['best_ms']:.1f}x faster, "
+          f"{before['peak_kb'] / max(after['peak_kb'], 1):.1f}x less peak memory")
+
+    n_stream = min(args.bars // 2, 100_000)
+    for smoothing in ('sma', 'wilder'):
+        print(f'AtrState.push ({smoothing}): {stream_us(*arrays, smoothing, n_stream):.2f} us/bar')
+
+
+if __name__ == '__main__':
+    main()
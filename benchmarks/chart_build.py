@@ -0,0 +1,64 @@
+"""Build time and serialized JSON size of the dashboard figures
+
+    python benchmarks/chart_build.py --bars 5040
+    python benchmarks/chart_build.py --bars 6700 --max-points 0   # no downsampling
+"""
+import argparse
+import os
+import sys
+import time
+
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import random_walk_bars  # noqa: E402
+from swing_core.backtest import match_trades  # noqa: E402
+from swing_core.charts import InteractiveCharts  # noqa: E402
+from swing_core.config import TradeConfig  # noqa: E402
+from swing_core.indicators import add_indicators  # noqa: E402
+from swing_core.signals import calculate_signal_frame  # noqa: E402
+
+
+def measure(build, repeat: int):
+    """Best-of-repeat build and serialize times in ms, plus the JSON size in bytes"""
+    build_ms, json_ms = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig = build()
+        build_ms.append((time.perf_counter() - start) * 1000)
+        # st.plotly_chart serializes the figure the same way
+        start = time.perf_counter()
+        spec = pio.to_json(fig.to_dict(), validate=False)
+        json_ms.append((time.perf_counter() - start) * 1000)
+    return min(build_ms), min(json_ms), len(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=int, default=5040, help='daily bars (5040 = 20 years)')
+    parser.add_argument('--max-points', type=int, default=TradeConfig.chart_max_points,
+                        help='price chart point cap per trace, 0 disables downsampling')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    config = TradeConfig(chart_period='all', chart_max_points=args.max_points)
+    data = add_indicators(random_walk_bars(args.bars, args.seed))
+    signals_df = calculate_signal_frame(data)
+    trades_df = match_trades(signals_df, config)
+    signals = {'entry_level': data['EMA_21'].iloc[-1]}
+
+    rows = [
+        ('price chart', lambda: InteractiveCharts.create_enhanced_price_chart(data, signals, config)),
+        (f'trade chart ({len(trades_df)} trades)',
+         lambda: InteractiveCharts.create_trade_chart(signals_df, trades_df, config.symbol)),
+    ]
+    print(f"{'figure':<28}{'build ms':>10}{'json ms':>10}{'json KB':>10}")
+    for name, build in rows:
+        build_ms, json_ms, size = measure(build, args.repeat)
+        print(f'{name:<28}{build_ms:>10.1f}{json_ms:>10.1f}{size / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Cold-start time of the headless core in fresh interpreters
+
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --repeat 10
+
+Each case runs in a new process, so nothing is warm except the OS file
+cache; the best of --repeat runs is reported. `import streamlit` is
+listed for comparison with what a dashboard start pays before any
+strategy code runs.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ('interpreter', ['-c', 'pass']),
+    ('import swing_core', ['-c', 'import swing_core']),
+    ('cli --help', ['-m', 'swing_core', '--help']),
+    ('config', ['-c', 'from swing_core import TradeConfig; TradeConfig()']),
+    ('numpy', ['-c', 'import numpy']),
+    ('pandas', ['-c', 'import pandas']),
+    ('signals + backtest', ['-c', 'import swing_core.signals, swing_core.backtest']),
+    ('scanner', ['-c', 'import swing_core.scanner']),
+    ('charts (plotly)', ['-c', 'import swing_core.charts']),
+    ('streamlit', ['-c', 'import streamlit']),
+]
+
+# Modules a bare `import swing_core` must not pull in
+HEAVY_MODULES = ('numpy', 'pandas', 'plotly', 'yfinance', 'streamlit', 'multiprocessing')
+
+
+def best_ms(args, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def heavy_imports() -> list:
+    probe = f'import sys, swing_core; print(" ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, check=True, capture_output=True, text=True)
+    return out.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<22}{'best ms':>10}")
+    for name, case in CASES:
+        try:
+            print(f'{name:<22}{best_ms(case, args.repeat):>10.0f}')
+        except subprocess.CalledProcessError:
+            print(f"{name:<22}{'n/a':>10}")
+
+    loaded = heavy_imports()
+    if loaded:
+        print(f"import swing_core loaded {', '.join(loaded)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
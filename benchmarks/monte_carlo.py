@@ -0,0 +1,79 @@
+"""Time and peak memory of Monte Carlo trade resampling against a per-path Python loop
+
+    python benchmarks/monte_carlo.py                       # 100k paths x 500 trades
+    python benchmarks/monte_carlo.py --paths 20000 --workers 4
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.pipeline import measure  # noqa: E402
+from swing_core.monte_carlo import run_monte_carlo  # noqa: E402
+
+
+def loop_paths(r_multiples, risk_percent, n_paths, n_trades, seed):
+    """One path and one trade at a time, the way a hand-rolled simulation would do it"""
+    rng = np.random.default_rng(seed)
+    growth = np.maximum(1 + r_multiples * risk_percent / 100, 0.0).tolist()
+    finals, drawdowns = [], []
+    for _ in range(n_paths):
+        equity = peak = 1.0
+        drawdown = 0.0
+        for k in rng.integers(0, len(growth), n_trades).tolist():
+            equity *= growth[k]
+            peak = max(peak, equity)
+            drawdown = max(drawdown, 1 - equity / peak)
+        finals.append(equity)
+        drawdowns.append(drawdown)
+    return finals, drawdowns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paths', type=int, default=100_000)
+    parser.add_argument('--trades', type=int, default=500)
+    parser.add_argument('--risk-percent', type=float, default=1.0)
+    parser.add_argument('--workers', type=int, default=1, help='pool size for the chunked run')
+    parser.add_argument('--loop-paths', type=int, default=1000, help='paths timed for the loop, then scaled')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    # Backtest-like R-multiples: frequent small losses, fewer larger wins
+    rng = np.random.default_rng(args.seed)
+    r_multiples = np.where(rng.random(200) < 0.4, rng.gamma(2.0, 0.75, 200), -rng.uniform(0.3, 1.1, 200))
+    kwargs = dict(risk_percent=args.risk_percent, n_paths=args.paths, n_trades=args.trades, seed=args.seed)
+
+    cases = [
+        ('numpy, in-process', lambda: None,
+         lambda _: run_monte_carlo(r_multiples, max_workers=1, **kwargs)),
+        ('numpy, one block', lambda: None,
+         lambda _: run_monte_carlo(r_multiples, max_workers=1, chunk_cells=args.paths * args.trades, **kwargs)),
+    ]
+    if args.workers > 1:
+        cases.append((f'numpy, {args.workers} workers', lambda: None,
+                      lambda _: run_monte_carlo(r_multiples, max_workers=args.workers, **kwargs)))
+
+    print(f'{args.paths:,} paths x {args.trades} trades')
+    print(f"{'case':<24}{'best ms':>10}{'median ms':>11}{'peak MB':>10}")
+    results = {}
+    for name, setup, run in cases:
+        result = results[name] = measure(setup, run, args.repeat)
+        print(f"{name:<24}{result['best_ms']:>10.1f}{result['median_ms']:>11.1f}{result['peak_kb'] / 1024:>10.1f}")
+
+    loop = measure(lambda: None, lambda _: loop_paths(r_multiples, args.risk_percent, args.loop_paths, args.trades, args.seed), 1)
+    loop_ms = loop['best_ms'] * args.paths / args.loop_paths
+    print(f"{'python loop (scaled)':<24}{loop_ms:>10.1f}")
+    print(f"in-process numpy: {loop_ms / results['numpy, in-process']['best_ms']:.0f}x faster than the loop")
+
+    summary = run_monte_carlo(r_multiples, max_workers=1, **kwargs)
+    print(summary.percentiles().round(1).to_string())
+    print(f'Risk of ruin (equity 50% below start): {summary.risk_of_ruin_pct:.2f}%')
+
+
+if __name__ == '__main__':
+    main()
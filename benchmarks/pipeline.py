@@ -0,0 +1,218 @@
+"""Wall time, peak memory and allocations of the indicator, signal, backtest and chart pipeline
+
+    python benchmarks/pipeline.py                          # compare with benchmarks/baseline.json
+    python benchmarks/pipeline.py --sizes 1000 10000       # a subset of the sizes
+    python benchmarks/pipeline.py --save-baseline          # record this machine's numbers
+
+Runs headless on synthetic bars - no Streamlit, no network. Exits with
+status 1 when a case is slower or uses more memory than the baseline
+allows.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import random_walk_bars  # noqa: E402
+from swing_core.backtest import match_trades  # noqa: E402
+from swing_core.charts import InteractiveCharts  # noqa: E402
+from swing_core.config import TradeConfig  # noqa: E402
+from swing_core.indicators import IndicatorState, add_indicators, calculate_atr  # noqa: E402
+from swing_core.signals import calculate_signal_frame, entry_criteria  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Re-measurements of a case that looks slower before it counts as a regression
+RETRIES = 2
+
+# Business days run out of nanosecond timestamps past ~60k bars, longer series use hourly bars
+DAILY_LIMIT = 60_000
+
+
+def synthetic_bars(n_bars: int, seed: int) -> pd.DataFrame:
+    if n_bars <= DAILY_LIMIT:
+        return random_walk_bars(n_bars, seed)
+    return random_walk_bars(n_bars, seed, start='1900-01-01', freq='h')
+
+
+def latest_signal(data: pd.DataFrame, vix_value: float = 18.0, vix_threshold: float = 30.0):
+    """The dashboard's evaluate_signals on the latest bar, without the Streamlit alert side effects"""
+    latest = data.iloc[-1]
+    return entry_criteria(
+        latest['Close'], latest['Low'], latest['Volume'],
+        latest['EMA_5'], latest['EMA_10'], latest['EMA_21'], latest['EMA_50'],
+        latest['ATR'], latest['Volume_Avg'], data['Close'].iloc[-6], vix_value < vix_threshold
+    )
+
+
+def pipeline_cases(bars: pd.DataFrame, config: TradeConfig):
+    """(name, setup, run) per stage; setup output is passed to run and is not timed"""
+    data = add_indicators(bars.copy())
+    signals_df = calculate_signal_frame(data, config.atr_entry_multiplier)
+    chart_signals = {'entry_level': data['EMA_21'].iloc[-1]}
+
+    def warm_state():
+        state = IndicatorState(config.ema_periods, config.atr_period, config.volume_period)
+        state.update(bars.iloc[:-1])
+        return state
+
+    return [
+        ('calculate_atr', lambda: None, lambda _: calculate_atr(bars['High'], bars['Low'], bars['Close'])),
+        # fetch_enhanced_data's EMA/ATR/volume pass: batch on a cold start, one bar per live tick after
+        ('indicators_batch', bars.copy, add_indicators),
+        ('indicators_tick', warm_state, lambda state: state.update(bars)),
+        ('evaluate_signals', lambda: None, lambda _: latest_signal(data)),
+        ('historical_signals', lambda: None, lambda _: calculate_signal_frame(data, config.atr_entry_multiplier)),
+        ('match_trades', lambda: None, lambda _: match_trades(signals_df, config)),
+        ('price_chart', lambda: None,
+         lambda _: InteractiveCharts.create_enhanced_price_chart(data, chart_signals, config)),
+    ]
+
+
+def measure(setup, run, repeat: int) -> dict:
+    """Best and median wall time over repeat runs, then one traced run for memory
+
+    peak_kb is the high-water mark above the starting heap during the call;
+    blocks counts allocations still live when it returns (its result).
+    """
+    times = []
+    for _ in range(repeat + 1):
+        arg = setup()
+        # Like timeit, keep collector pauses out of the timings
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(arg)
+            times.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    # The first run pays for imports and lazy caches
+    times = times[1:]
+
+    arg = setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    result = run(arg)
+    peak = tracemalloc.get_traced_memory()[1] - baseline_bytes
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'filename')
+    blocks = sum(stat.count_diff for stat in diff)
+    del result
+
+    return {
+        'best_ms': round(min(times), 3),
+        'median_ms': round(statistics.median(times), 3),
+        'peak_kb': round(peak / 1024, 1),
+        'blocks': int(blocks),
+    }
+
+
+def regressions(result: dict, base: dict, time_tolerance: float, memory_tolerance: float):
+    """Reasons result regressed against its baseline entry
+
+    Differences below a small absolute floor are timer and allocator noise.
+    """
+    reasons = []
+    if result['best_ms'] > base['best_ms'] * (1 + time_tolerance) and result['best_ms'] - base['best_ms'] > 0.5:
+        reasons.append(f"time {base['best_ms']:.2f} -> {result['best_ms']:.2f} ms")
+    if result['peak_kb'] > base['peak_kb'] * (1 + memory_tolerance) and result['peak_kb'] - base['peak_kb'] > 64:
+        reasons.append(f"peak {base['peak_kb']:.0f} -> {result['peak_kb']:.0f} KB")
+    return reasons
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='bar counts to run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--baseline', default=BASELINE, help='baseline JSON to compare with or save to')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    parser.add_argument('--time-tolerance', type=float, default=0.5, help='allowed slowdown, 0.5 = 50%%')
+    parser.add_argument('--memory-tolerance', type=float, default=0.10, help='allowed peak memory growth')
+    args = parser.parse_args()
+
+    stored = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        if stored.get('environment') != environment():
+            print(f"Baseline recorded on {stored.get('environment')}, comparing anyway")
+
+    config = TradeConfig(chart_period='all')
+    results, failed = {}, []
+    print(f"{'case':<28}{'best ms':>11}{'median ms':>11}{'peak KB':>11}{'blocks':>9}")
+    for size in args.sizes:
+        bars = synthetic_bars(size, args.seed)
+        for name, setup, run in pipeline_cases(bars, config):
+            case = f'{name}@{size}'
+            # Large series are slow enough that a few runs give a stable best time
+            repeat = args.repeat if size < 1_000_000 else min(args.repeat, 3)
+            result = measure(setup, run, repeat)
+            base = stored['results'].get(case) if stored else None
+            reasons = regressions(result, base, args.time_tolerance, args.memory_tolerance) if base else []
+            for _ in range(RETRIES):
+                if not any(reason.startswith('time') for reason in reasons):
+                    break
+                # A slow sample is usually a busy machine - confirm before failing
+                retry = measure(setup, run, repeat * 2)
+                result['best_ms'] = min(result['best_ms'], retry['best_ms'])
+                reasons = regressions(result, base, args.time_tolerance, args.memory_tolerance)
+            results[case] = result
+            failed += [(case, reason) for reason in reasons]
+            print(f"{case:<28}{result['best_ms']:>11.2f}{result['median_ms']:>11.2f}"
+                  f"{result['peak_kb']:>11.0f}{result['blocks']:>9}")
+
+    # The whole run must stay headless
+    assert 'streamlit' not in sys.modules, 'benchmark imported streamlit'
+
+    if args.save_baseline:
+        saved = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                saved = json.load(f).get('results', {})
+        saved.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump({'environment': environment(), 'results': saved}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+
+    if stored is None:
+        print(f'No baseline at {args.baseline} - run with --save-baseline first')
+        return 0
+    for case, reason in failed:
+        print(f'REGRESSION {case}: {reason}')
+    if not failed:
+        print('No regressions against the baseline')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
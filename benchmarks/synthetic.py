@@ -0,0 +1,24 @@
+"""Synthetic daily OHLCV bars for offline benchmarks"""
+import numpy as np
+import pandas as pd
+
+
+def random_walk_bars(n_bars: int, seed: int = 0, start: str = '2000-01-03', freq: str = 'B') -> pd.DataFrame:
+    """Business-day OHLCV random walk with occasional long lower wicks, shaped like yfinance history
+
+    Pass a finer freq (e.g. 'h') for series longer than business days can
+    span in nanosecond timestamps.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=n_bars, freq=freq, tz='America/New_York', name='Date')
+    # The trend reverses every 10k bars so very long series stay in float range
+    drift = np.where(np.arange(n_bars) // 10_000 % 2 == 0, 0.0012, -0.0012)
+    close = 100 * np.exp(np.cumsum(rng.normal(drift, 0.012, n_bars)))
+    open_ = close * (1 + rng.normal(0, 0.004, n_bars))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.008, n_bars)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.008, n_bars)))
+    # Pullbacks deep enough to touch the entry level now and then
+    wick = rng.random(n_bars) < 0.08
+    low = np.where(wick, low * (1 - np.abs(rng.normal(0.03, 0.01, n_bars))), low)
+    volume = rng.integers(1_000_000, 5_000_000, n_bars)
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, index=index)
@@ -1,28 +1,42 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-from datetime import datetime, timedelta, time
-import json
-import io
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Tuple
-import time as time_module
+from datetime import datetime, time
+import html
+import os
+from typing import Dict, Optional
+import uuid
 import streamlit.components.v1 as components
 
-# Enhanced Configuration
-st.set_page_config(
-    page_title="🚀 Interactive QQQ Trading Dashboard",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
+from swing_core.alerts import AlertStore, TradingAlert, edge_alerts
+from swing_core.bar_store import BarStore
+from swing_core.charts import FigureCache, InteractiveCharts
+from swing_core.config import TradeConfig
+from swing_core.indicators import calculate_atr
+from swing_core.intraday import IntradayFeed, with_live_bar
+from swing_core.journal import TradeJournal
+from swing_core.monte_carlo import METHODS as MONTE_CARLO_METHODS, run_monte_carlo, trade_r_multiples
+from swing_core.optimizer import DEFAULT_GRID, grid_configs, run_sweep
+from swing_core.portfolio import run_portfolio_trades
+from swing_core.refresh import RefreshWorker
+from swing_core.scanner import scan_watchlist
+from swing_core.snapshots import SharedSnapshot, SnapshotRegistry
+from swing_core.spans import SpanMetrics, SpanRecorder, enable_metrics, recording, span, traced
+from swing_core.signal_index import SignalIndex
+from swing_core.signals import (
+    CRITERIA_KEYS,
+    INPUT_COLUMNS,
+    MOMENTUM_LOOKBACK,
+    WARMUP_BARS,
+    align_vix,
+    compute_signals,
+    entry_criteria,
+    vix_below,
 )
+from swing_core.walk_forward import run_walk_forward
 
 # Custom CSS for enhanced interactivity
-st.markdown("""
+PAGE_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
@@ -164,35 +178,18 @@ st.markdown("""
         border-radius: 15px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Auto-refresh using JavaScript
-auto_refresh_js = """
-<script>
-let refreshInterval = null;
 
-window.startAutoRefresh = function(intervalSeconds) {
-    if (refreshInterval) {
-        clearInterval(refreshInterval);
-    }
-    
-    refreshInterval = setInterval(function() {
-        // Trigger Streamlit rerun
-        window.parent.postMessage({
-            type: 'streamlit:setComponentValue',
-            value: Date.now()
-        }, '*');
-    }, intervalSeconds * 1000);
-};
-
-window.stopAutoRefresh = function() {
-    if (refreshInterval) {
-        clearInterval(refreshInterval);
-        refreshInterval = null;
-    }
-};
-</script>
-"""
+def configure_page():
+    """Page setup - only when run as the Streamlit app, so importing this module has no UI side effects"""
+    st.set_page_config(
+        page_title="🚀 Interactive Swing Trading Dashboard",
+        page_icon="📈",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 interactive_js = """
 <script>
@@ -289,305 +286,72 @@ if ('Notification' in window) {
 </script>
 """
 
-@dataclass
-class TradeConfig:
-    """Enhanced configuration with interactive features"""
-    # Technical Analysis
-    ema_5_period: int = 5
-    ema_10_period: int = 10
-    ema_21_period: int = 21
-    ema_50_period: int = 50
-    atr_period: int = 14
-    volume_period: int = 20
-    
-    # Entry/Exit Criteria
-    atr_entry_multiplier: float = 1.5
-    atr_target1_multiplier: float = 2.0
-    atr_target2_multiplier: float = 3.0
-    atr_stop_multiplier: float = 2.0
-    
-    # Risk Management
-    risk_percent: float = 1.0
-    max_positions: int = 3
-    daily_loss_limit: float = 3.0
-    vix_threshold: float = 30.0
-    account_value: float = 100000.0
-    stop_loss_percent: float = 2.0
-    
-    # Data Settings
-    data_period: str = "2y"  # Default to 2 years
-    chart_period: str = "6mo"  # What to display on chart
-    
-    # Interactive Features (removed voice_commands and mobile_mode)
-    auto_refresh: bool = False
-    refresh_interval: int = 60
-    enable_sounds: bool = True
-    enable_notifications: bool = True
+# Prometheus textfile-collector target; when set, span counters are rewritten after every rerun
+METRICS_FILE = os.environ.get('SWING_METRICS_FILE')
 
-@dataclass
-class TradingAlert:
-    """Trading alert structure"""
-    timestamp: str
-    type: str  # 'entry', 'exit', 'warning', 'info'
-    message: str
-    price: float
-    priority: str = 'normal'  # 'low', 'normal', 'high', 'critical'
+@st.cache_resource
+def get_bar_store() -> BarStore:
+    """Process-wide bar store shared by every session"""
+    return BarStore()
 
-@dataclass
-class Trade:
-    """Enhanced trade record"""
-    entry_date: str
-    entry_time: str
-    entry_price: float
-    position_size: int
-    stop_loss: float
-    target1: float
-    target2: float
-    notes: str = ""
-    tags: List[str] = None
-    exit_date: Optional[str] = None
-    exit_time: Optional[str] = None
-    exit_price: Optional[float] = None
-    pnl: Optional[float] = None
-    pnl_percent: Optional[float] = None
-    exit_reason: Optional[str] = None
-    is_active: bool = True
+@st.cache_resource
+def get_intraday_feed(symbol: str, interval: str, sessions: int) -> IntradayFeed:
+    """Process-wide intraday ring buffer for a symbol, shared by every session"""
+    return IntradayFeed(symbol, interval, sessions)
 
-class InteractiveCharts:
-    """Enhanced chart creation with interactive features"""
-    
-    @staticmethod
-    def create_enhanced_price_chart(data: pd.DataFrame, signals: Dict, config: TradeConfig) -> go.Figure:
-        """Create an enhanced interactive price chart"""
-        
-        # Create subplots with custom spacing
-        fig = make_subplots(
-            rows=3, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.02,
-            subplot_titles=('QQQ Price with EMAs & Signals', 'Volume Analysis', 'Technical Indicators'),
-            row_heights=[0.6, 0.25, 0.15]
-        )
-        
-        # Candlestick chart with enhanced styling
-        fig.add_trace(
-            go.Candlestick(
-                x=data.index,
-                open=data['Open'],
-                high=data['High'],
-                low=data['Low'],
-                close=data['Close'],
-                name='QQQ Price',
-                increasing_line_color='#00ff88',
-                decreasing_line_color='#ff4757',
-                increasing_fillcolor='rgba(0, 255, 136, 0.3)',
-                decreasing_fillcolor='rgba(255, 71, 87, 0.3)'
-            ),
-            row=1, col=1
-        )
-        
-        # Enhanced EMAs with custom styling
-        ema_configs = [
-            ('EMA_5', '#ff6b6b', 3),
-            ('EMA_10', '#4ecdc4', 2),
-            ('EMA_21', '#45b7d1', 2),
-            ('EMA_50', '#96ceb4', 3)
-        ]
-        
-        for ema, color, width in ema_configs:
-            fig.add_trace(
-                go.Scatter(
-                    x=data.index,
-                    y=data[ema],
-                    mode='lines',
-                    name=ema,
-                    line=dict(color=color, width=width),
-                    opacity=0.8
-                ),
-                row=1, col=1
-            )
-        
-        # Entry level with interactive annotation
-        if 'entry_level' in signals:
-            fig.add_hline(
-                y=signals['entry_level'],
-                line_dash="dash",
-                line_color="#feca57",
-                line_width=2,
-                annotation_text="Entry Zone",
-                annotation_position="right",
-                row=1, col=1
-            )
-        
-        # Volume analysis with color coding
-        volume_colors = []
-        for i in range(len(data)):
-            if i == 0:
-                volume_colors.append('#808080')  # gray
-            elif data['Close'].iloc[i] > data['Close'].iloc[i-1]:
-                volume_colors.append('#00ff88')
-            else:
-                volume_colors.append('#ff4757')
-        
-        fig.add_trace(
-            go.Bar(
-                x=data.index,
-                y=data['Volume'],
-                name='Volume',
-                marker_color=volume_colors,
-                opacity=0.7
-            ),
-            row=2, col=1
-        )
-        
-        # Volume average line
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['Volume_Avg'],
-                mode='lines',
-                name='Volume Average',
-                line=dict(color='#ffa502', width=2)
-            ),
-            row=2, col=1
-        )
-        
-        # ATR indicator
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['ATR'],
-                mode='lines',
-                name='ATR',
-                line=dict(color='#a55eea', width=2),
-                fill='tonexty',
-                fillcolor='rgba(165, 94, 234, 0.1)'
-            ),
-            row=3, col=1
-        )
-        
-        # Enhanced layout with dark theme
-        fig.update_layout(
-            title={
-                'text': "🚀 Interactive QQQ Analysis Dashboard",
-                'x': 0.5,
-                'xanchor': 'center',
-                'font': {'size': 24, 'color': '#2c3e50'}
-            },
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            height=900,
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            hovermode='x unified',
-            dragmode='zoom'
-        )
-        
-        # Enhanced interactivity
-        fig.update_xaxes(
-            showspikes=True,
-            spikecolor="white",
-            spikesnap="cursor",
-            spikemode="across",
-            rangeslider_visible=False
-        )
-        
-        fig.update_yaxes(
-            showspikes=True,
-            spikecolor="white",
-            spikesnap="cursor",
-            spikemode="across"
-        )
-        
-        # Add range selector buttons
-        fig.update_layout(
-            xaxis=dict(
-                rangeselector=dict(
-                    buttons=list([
-                        dict(count=1, label="1D", step="day", stepmode="backward"),
-                        dict(count=5, label="5D", step="day", stepmode="backward"),
-                        dict(count=1, label="1M", step="month", stepmode="backward"),
-                        dict(count=3, label="3M", step="month", stepmode="backward"),
-                        dict(count=6, label="6M", step="month", stepmode="backward"),
-                        dict(step="all")
-                    ])
-                ),
-                rangeslider=dict(visible=False),
-                type="date"
-            )
-        )
-        
-        return fig
-    
-    @staticmethod
-    def create_risk_reward_chart(entry_price: float, stop_loss: float, target1: float, target2: float) -> go.Figure:
-        """Create interactive risk/reward visualization"""
-        
-        levels = ['Stop Loss', 'Entry', 'Target 1', 'Target 2']
-        prices = [stop_loss, entry_price, target1, target2]
-        colors = ['#ff4757', '#74b9ff', '#00b894', '#fdcb6e']
-        
-        fig = go.Figure()
-        
-        # Add horizontal lines for each level
-        for i, (level, price, color) in enumerate(zip(levels, prices, colors)):
-            fig.add_hline(
-                y=price,
-                line_color=color,
-                line_width=3,
-                annotation_text=f"{level}: ${price:.2f}",
-                annotation_position="right"
-            )
-        
-        # Add risk/reward zones
-        fig.add_shape(
-            type="rect",
-            x0=0, x1=1, y0=stop_loss, y1=entry_price,
-            fillcolor="rgba(255, 71, 87, 0.2)",
-            line=dict(width=0),
-            name="Risk Zone"
-        )
-        
-        fig.add_shape(
-            type="rect",
-            x0=0, x1=1, y0=entry_price, y1=target2,
-            fillcolor="rgba(0, 184, 148, 0.2)",
-            line=dict(width=0),
-            name="Reward Zone"
-        )
-        
-        fig.update_layout(
-            title="Risk/Reward Analysis",
-            yaxis_title="Price ($)",
-            height=400,
-            showlegend=False,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        fig.update_xaxes(visible=False)
-        
-        return fig
+@st.cache_resource
+def get_refresh_worker() -> RefreshWorker:
+    """Process-wide background refresh, so live sessions read bars instead of fetching them"""
+    return RefreshWorker(get_bar_store())
+
+@st.cache_resource
+def get_snapshot_registry() -> SnapshotRegistry:
+    """Process-wide bars with indicators - one copy per symbol/interval/period however many sessions watch it"""
+    worker = get_refresh_worker()
+    # Live keys ("1d" and "1d+<intraday>") all read the worker's daily subscription for the symbol and period
+    return SnapshotRegistry(on_evict=worker.unsubscribe, subscription=lambda key: (key[0], "1d", key[2]))
+
+@st.cache_resource
+def get_span_metrics() -> SpanMetrics:
+    """Process-wide span counters, collecting from the first time anyone asks for them"""
+    metrics = SpanMetrics()
+    enable_metrics(metrics)
+    return metrics
+
+@st.cache_resource
+def get_signal_index() -> SignalIndex:
+    """Process-wide signal history results, extended as new bars arrive"""
+    return SignalIndex()
+
+@st.cache_resource
+def get_trade_journal() -> TradeJournal:
+    """Process-wide trade journal on disk, shared by every session"""
+    return TradeJournal()
+
+# Set to a JSON-lines file to keep alerts across restarts
+ALERTS_FILE = os.environ.get('SWING_ALERTS_FILE')
+
+@st.cache_resource
+def get_alert_store() -> AlertStore:
+    """Process-wide alert ring, so a signal transition alerts once however many sessions are open"""
+    return AlertStore(path=ALERTS_FILE)
 
 class InteractiveDashboard:
     """Enhanced interactive dashboard"""
     
     def __init__(self):
         self.config = self.load_config()
-        self.trades = self.load_trades()
-        self.alerts = self.load_alerts()
+        self.journal = get_trade_journal()
+        self.alerts = get_alert_store()
         
         # Initialize session state for interactivity
         if 'last_refresh' not in st.session_state:
             st.session_state.last_refresh = datetime.now()
         if 'chart_annotations' not in st.session_state:
             st.session_state.chart_annotations = []
+        
+        # Signal state last drawn by the live fragment, None until its first run
+        self.live_signal_state = None
     
     def load_config(self) -> TradeConfig:
         """Load configuration from session state"""
@@ -595,50 +359,35 @@ class InteractiveDashboard:
             st.session_state.config = TradeConfig()
         return st.session_state.config
     
-    def load_trades(self) -> List[Trade]:
-        """Load trades from session state"""
-        if 'trades' not in st.session_state:
-            st.session_state.trades = []
-        return st.session_state.trades
-    
-    def load_alerts(self) -> List[TradingAlert]:
-        """Load alerts from session state"""
-        if 'alerts' not in st.session_state:
-            st.session_state.alerts = []
-        return st.session_state.alerts
-    
     def add_alert(self, alert_type: str, message: str, price: float, priority: str = 'normal'):
         """Add a new trading alert"""
-        alert = TradingAlert(
-            timestamp=datetime.now().strftime('%H:%M:%S'),
+        self.alerts.add(TradingAlert(
+            timestamp=datetime.now().astimezone(),
             type=alert_type,
             message=message,
             price=price,
-            priority=priority
-        )
-        self.alerts.insert(0, alert)  # Add to beginning
-        if len(self.alerts) > 50:  # Keep only last 50 alerts
-            self.alerts = self.alerts[:50]
-        st.session_state.alerts = self.alerts
+            priority=priority,
+            symbol=self.config.symbol
+        ))
     
     def display_enhanced_header(self):
         """Display enhanced header with live indicators"""
-        st.markdown("""
+        st.markdown(f"""
         <div class="main-header">
-            <h1>🚀 Interactive QQQ Trading Dashboard</h1>
+            <h1>🚀 Interactive {html.escape(self.config.symbol)} Trading Dashboard</h1>
             <p><span class="streaming-indicator"></span>Live Market Data & Analysis</p>
         </div>
         """, unsafe_allow_html=True)
     
     def display_live_alerts(self):
         """Display live alerts panel"""
-        if not self.alerts:
+        if not len(self.alerts):
             return
         
         st.subheader("🔔 Live Alerts")
         
         # Show last 5 alerts
-        for alert in self.alerts[:5]:
+        for alert in self.alerts.latest(5):
             alert_class = {
                 'entry': 'alert-success',
                 'exit': 'alert-warning',
@@ -648,7 +397,7 @@ class InteractiveDashboard:
             
             st.markdown(f"""
             <div class="{alert_class}">
-                <strong>{alert.timestamp}</strong> - {alert.message} (${alert.price:.2f})
+                <strong>{alert.timestamp:%H:%M:%S}</strong> - {alert.symbol} {alert.message} (${alert.price:.2f})
             </div>
             """, unsafe_allow_html=True)
     
@@ -656,11 +405,11 @@ class InteractiveDashboard:
         """Display interactive control panel"""
         st.subheader("🎮 Interactive Controls")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             if st.button("🔄 Force Refresh", key="force_refresh"):
-                st.cache_data.clear()
+                st.session_state.force_data_refresh = True
                 st.rerun()
         
         with col2:
@@ -670,6 +419,10 @@ class InteractiveDashboard:
         with col3:
             if st.button("📈 Signal History", key="signal_history"):
                 st.session_state.show_signal_history = True
+        
+        with col4:
+            if st.button("🔍 Watchlist Scan", key="watchlist_scan"):
+                st.session_state.show_watchlist_scan = True
     
     def display_strategy_explanation(self):
         """Display detailed strategy explanation and entry criteria"""
@@ -747,197 +500,7 @@ class InteractiveDashboard:
                 st.session_state.show_strategy_stats = False
                 st.rerun()
     
-    def calculate_historical_signals(self, data: pd.DataFrame, vix_data=None):
-        """Calculate entry and exit signals for historical data - EXACT STRATEGY IMPLEMENTATION"""
-        signals_history = []
-        
-        for i in range(50, len(data)):
-            current_data = data.iloc[:i+1]
-            latest = current_data.iloc[-1]
-            
-            # EXACT ENTRY CRITERIA - ALL MUST BE MET
-            # 1. EMA Stack: 10 EMA > 21 EMA > 50 EMA (bullish momentum)
-            ema_alignment = latest['EMA_10'] > latest['EMA_21'] > latest['EMA_50']
-            
-            # 2. Price Position: Current price must be above 50 EMA (trend confirmation)
-            price_above_50ema = latest['Close'] > latest['EMA_50']
-            
-            # 3. Entry Trigger: Price touches or dips below (5 EMA - 1.5×ATR)
-            entry_level = latest['EMA_5'] - (1.5 * latest['ATR'])
-            price_touch_entry = latest['Close'] <= entry_level or latest['Low'] <= entry_level
-            
-            # 4. Volume Confirmation: Entry day volume > 20-day average volume
-            volume_above_avg = latest['Volume'] > latest['Volume_Avg']
-            
-            # 5. Market Environment: VIX < 30 (simplified - assume good environment for historical)
-            vix_below_threshold = True  # You can enhance this with actual VIX data
-            
-            # 6. Momentum Filter: Price must be higher than 5 days ago
-            if i >= 55:  # Need at least 5 more days
-                momentum_positive = latest['Close'] > current_data['Close'].iloc[-6]
-            else:
-                momentum_positive = True
-            
-            # ENTRY SIGNAL: ALL 6 CRITERIA MUST BE MET
-            entry_signal = all([
-                ema_alignment,
-                price_above_50ema,
-                price_touch_entry,
-                volume_above_avg,
-                vix_below_threshold,
-                momentum_positive
-            ])
-            
-            # EXIT CRITERIA - Following exact strategy rules
-            exit_signal = False
-            if i > 0:
-                prev_close = data['Close'].iloc[i-1]
-                current_close = latest['Close']
-                
-                # Exit conditions:
-                # 1. Stop Loss: Entry - (2.0 × ATR) OR 2% below entry (whichever gives smaller loss)
-                # 2. Target 1: 5 EMA + (2.0 × ATR) - Scale out 50%
-                # 3. Target 2: 5 EMA + (3.0 × ATR) - Exit remaining
-                # 4. Time-based: 10 day maximum hold
-                
-                # For historical analysis, we'll use simplified exit:
-                # Exit if price breaks below 21 EMA significantly (strategy breakdown)
-                if current_close < latest['EMA_21'] * 0.97:  # 3% below 21 EMA indicates trend break
-                    exit_signal = True
-                
-                # Or if we have a significant down day (> 3% drop from previous close)
-                daily_return = (current_close - prev_close) / prev_close
-                if daily_return < -0.03:
-                    exit_signal = True
-            
-            signals_history.append({
-                'Date': data.index[i],
-                'Close': latest['Close'],
-                'Entry_Signal': entry_signal,
-                'Exit_Signal': exit_signal,
-                'EMA_Alignment': ema_alignment,
-                'Price_Above_50EMA': price_above_50ema,
-                'Entry_Level_Touch': price_touch_entry,
-                'Volume_Above_Avg': volume_above_avg,
-                'Momentum_Positive': momentum_positive,
-                'Entry_Level': entry_level,
-                'EMA_5': latest['EMA_5'],
-                'EMA_10': latest['EMA_10'],
-                'EMA_21': latest['EMA_21'],
-                'EMA_50': latest['EMA_50'],
-                'ATR': latest['ATR'],
-                'Volume': latest['Volume'],
-                'Volume_Avg': latest['Volume_Avg']
-            })
-        
-        return pd.DataFrame(signals_history)
-    
-    def match_entry_exit_signals(self, signals_df: pd.DataFrame):
-        """Match entry signals with exits using EXACT STRATEGY RULES"""
-        trades = []
-        
-        entry_signals = signals_df[signals_df['Entry_Signal'] == True].copy()
-        exit_signals = signals_df[signals_df['Exit_Signal'] == True].copy()
-        
-        if entry_signals.empty:
-            return pd.DataFrame()
-        
-        for _, entry in entry_signals.iterrows():
-            entry_date = entry['Date']
-            entry_price = entry['Close']
-            entry_ema5 = entry['EMA_5']
-            entry_atr = entry['ATR']
-            
-            # EXACT STRATEGY CALCULATIONS
-            
-            # Stop Loss: Entry - (2.0 × ATR) OR 2% below entry (whichever gives smaller loss)
-            stop_loss_atr = entry_price - (2.0 * entry_atr)
-            stop_loss_pct = entry_price * 0.98  # 2% below entry
-            stop_loss = max(stop_loss_atr, stop_loss_pct)  # Use whichever gives smaller loss
-            
-            # Targets: 
-            # Target 1: 5 EMA + (2.0 × ATR)
-            # Target 2: 5 EMA + (3.0 × ATR)
-            target1 = entry_ema5 + (2.0 * entry_atr)
-            target2 = entry_ema5 + (3.0 * entry_atr)
-            
-            # Position Sizing: Risk 1-2% of account per trade
-            account_value = 100000  # Default account value
-            risk_percent = 0.01  # 1% risk
-            risk_amount = account_value * risk_percent
-            risk_per_share = entry_price - stop_loss
-            shares = int(risk_amount / risk_per_share) if risk_per_share > 0 else 100
-            
-            # Find the next exit signal after this entry (max 10 days per strategy)
-            future_exits = exit_signals[exit_signals['Date'] > entry_date]
-            
-            # Add 10-day time limit per strategy rules
-            ten_days_later = entry_date + pd.Timedelta(days=10)
-            future_exits_within_limit = future_exits[future_exits['Date'] <= ten_days_later]
-            
-            if not future_exits_within_limit.empty:
-                # Take the first exit signal after entry (within 10 days)
-                exit_row = future_exits_within_limit.iloc[0]
-                exit_date = exit_row['Date']
-                exit_price = exit_row['Close']
-                exit_reason = "Exit Signal"
-            else:
-                # Time-based exit after 10 days if no exit signal
-                time_exit_data = signals_df[signals_df['Date'] >= ten_days_later]
-                if not time_exit_data.empty:
-                    exit_row = time_exit_data.iloc[0]
-                    exit_date = exit_row['Date']
-                    exit_price = exit_row['Close']
-                    exit_reason = "10-Day Time Limit"
-                else:
-                    continue  # Skip this trade if we can't find an exit
-            
-            # Calculate trade metrics
-            hold_days = (exit_date - entry_date).days
-            profit_loss = exit_price - entry_price
-            profit_pct = (profit_loss / entry_price) * 100
-            total_profit = profit_loss * shares
-            
-            # Determine if target levels were hit during the trade
-            trade_data = signals_df[(signals_df['Date'] >= entry_date) & (signals_df['Date'] <= exit_date)]
-            max_price_during_trade = trade_data['Close'].max()
-            
-            target1_hit = max_price_during_trade >= target1
-            target2_hit = max_price_during_trade >= target2
-            
-            # Calculate actual exit reason based on strategy rules
-            if exit_price <= stop_loss * 1.01:  # Within 1% of stop loss
-                actual_exit_reason = "🚨 Stop Loss"
-            elif target2_hit:
-                actual_exit_reason = "🎯 Target 2 Hit"
-            elif target1_hit:
-                actual_exit_reason = "🎯 Target 1 Hit"
-            elif hold_days >= 10:
-                actual_exit_reason = "⏰ 10-Day Limit"
-            else:
-                actual_exit_reason = exit_reason
-            
-            trades.append({
-                'Entry_Date': entry_date.strftime('%Y-%m-%d'),
-                'Entry_Price': round(entry_price, 2),
-                'Exit_Date': exit_date.strftime('%Y-%m-%d'),
-                'Exit_Price': round(exit_price, 2),
-                'Hold_Days': hold_days,
-                'Stop_Loss': round(stop_loss, 2),
-                'Target_1': round(target1, 2),
-                'Target_2': round(target2, 2),
-                'T1_Hit': '✅' if target1_hit else '❌',
-                'T2_Hit': '✅' if target2_hit else '❌',
-                'Price_Change': round(profit_loss, 2),
-                'Profit_Pct': round(profit_pct, 2),
-                'Shares': shares,
-                'Total_Profit': round(total_profit, 0),
-                'Exit_Reason': actual_exit_reason,
-                'Trade_Result': '✅ WIN' if profit_loss > 0 else '❌ LOSS'
-            })
-        
-        return pd.DataFrame(trades)
-    
+    @traced('display_signal_history')
     def display_signal_history(self, data: pd.DataFrame):
         """Display historical entry/exit signals for selected timeframe"""
         if 'show_signal_history' not in st.session_state or not st.session_state.show_signal_history:
@@ -947,16 +510,18 @@ class InteractiveDashboard:
         st.subheader("📈 Swing Trading Signal Analysis")
         
         with st.expander("Complete Swing Trading Analysis for Selected Timeframe", expanded=True):
-            # Calculate historical signals
+            # Signals and trades from the shared index - only bars past the last closed trade are recomputed
             with st.spinner("Calculating swing trading signals..."):
-                signals_df = self.calculate_historical_signals(data)
+                vix_data = st.session_state.get('vix_data')
+                indexed = get_signal_index().lookup(self.snapshot_key(self.config.symbol), data, self.config, vix_data)
+                signals_df = indexed.signals
             
             if signals_df.empty:
                 st.warning("No historical signals calculated")
                 return
             
             # Match entry/exit signals to create swing trades
-            trades_df = self.match_entry_exit_signals(signals_df)
+            trades_df = indexed.trade_table
             
             if trades_df.empty:
                 st.warning("No complete swing trades found in selected timeframe")
@@ -995,6 +560,9 @@ class InteractiveDashboard:
             with col5:
                 st.metric("Avg Hold Time", f"{avg_hold_days:.1f} days")
             
+            self.display_portfolio_summary(data, indexed)
+            self.display_monte_carlo(indexed)
+            
             # Main swing trades table with EXACT STRATEGY columns
             st.markdown("#### 🔄 **Complete Swing Trades Following Exact Strategy**")
             
@@ -1064,74 +632,9 @@ class InteractiveDashboard:
             # Visualization of trades
             st.markdown("#### 📈 **Swing Trades Visualization**")
             
-            fig = go.Figure()
-            
-            # Add price line
-            fig.add_trace(go.Scatter(
-                x=signals_df['Date'],
-                y=signals_df['Close'],
-                mode='lines',
-                name='QQQ Price',
-                line=dict(color='#74b9ff', width=2)
-            ))
-            
-            # Add entry points
-            entry_dates = pd.to_datetime(trades_df['Entry_Date'])
-            entry_prices = trades_df['Entry_Price']
-            
-            fig.add_trace(go.Scatter(
-                x=entry_dates,
-                y=entry_prices,
-                mode='markers',
-                name='Entry Points',
-                marker=dict(
-                    color='#00b894',
-                    size=10,
-                    symbol='triangle-up',
-                    line=dict(width=2, color='white')
-                ),
-                hovertemplate='<b>Entry</b><br>Date: %{x}<br>Price: $%{y:.2f}<extra></extra>'
-            ))
-            
-            # Add exit points
-            exit_dates = pd.to_datetime(trades_df['Exit_Date'])
-            exit_prices = trades_df['Exit_Price']
-            
-            fig.add_trace(go.Scatter(
-                x=exit_dates,
-                y=exit_prices,
-                mode='markers',
-                name='Exit Points',
-                marker=dict(
-                    color='#e17055',
-                    size=10,
-                    symbol='triangle-down',
-                    line=dict(width=2, color='white')
-                ),
-                hovertemplate='<b>Exit</b><br>Date: %{x}<br>Price: $%{y:.2f}<extra></extra>'
-            ))
-            
-            # Connect entry/exit pairs with lines
-            for _, trade in trades_df.iterrows():
-                color = '#00b894' if trade['Profit_Pct'] > 0 else '#e17055'
-                fig.add_trace(go.Scatter(
-                    x=[pd.to_datetime(trade['Entry_Date']), pd.to_datetime(trade['Exit_Date'])],
-                    y=[trade['Entry_Price'], trade['Exit_Price']],
-                    mode='lines',
-                    line=dict(color=color, width=2, dash='dot'),
-                    showlegend=False,
-                    hoverinfo='skip'
-                ))
-            
-            fig.update_layout(
-                title="Swing Trading Entry/Exit Points with P&L",
-                xaxis_title="Date",
-                yaxis_title="Price ($)",
-                height=600,
-                hovermode='x unified'
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            fig = InteractiveCharts.create_trade_chart(signals_df, trades_df, self.config.symbol)
+            with span('plotly_chart.trade'):
+                st.plotly_chart(fig, use_container_width=True)
             
             # Profit distribution
             st.markdown("#### 💰 **Profit Distribution**")
@@ -1154,11 +657,172 @@ class InteractiveDashboard:
             
             st.plotly_chart(fig_hist, use_container_width=True)
             
+            # Parameter sweep over the ATR multipliers
+            st.markdown("#### 🧪 **Parameter Sweep**")
+            sweep_configs = grid_configs(self.config, DEFAULT_GRID)
+            st.caption(f"Grid search over {len(sweep_configs)} entry/target/stop multiplier combinations")
+            
+            if st.button("🚀 Run Parameter Sweep", key="run_sweep"):
+                with st.spinner("Backtesting parameter grid..."):
+                    st.session_state.sweep_results = run_sweep(data, sweep_configs, vix=vix_data, indicators=self.config)
+            
+            if 'sweep_results' in st.session_state and not st.session_state.sweep_results.empty:
+                st.dataframe(st.session_state.sweep_results, use_container_width=True, height=300)
+
+            # Walk-forward analysis
+            st.markdown("#### 🔁 **Walk-Forward Analysis**")
+            st.caption("Pick the best grid config on each training window, then trade it on the following unseen window")
+
+            wf_col1, wf_col2 = st.columns(2)
+            with wf_col1:
+                train_bars = st.number_input("Training Window (bars)", 60, 2000, 252, step=21, key="wf_train_bars")
+            with wf_col2:
+                test_bars = st.number_input("Test Window (bars)", 10, 500, 63, step=21, key="wf_test_bars")
+
+            if st.button("🔁 Run Walk-Forward", key="run_walk_forward"):
+                with st.spinner("Running walk-forward windows..."):
+                    st.session_state.walk_forward_result = run_walk_forward(
+                        data, sweep_configs, train_bars=int(train_bars), test_bars=int(test_bars), vix=vix_data,
+                        indicators=self.config
+                    )
+                    if st.session_state.walk_forward_result is None:
+                        st.warning("Not enough history for one training and test window")
+
+            wf_result = st.session_state.get('walk_forward_result')
+            if wf_result is not None:
+                wf_col1, wf_col2, wf_col3 = st.columns(3)
+                with wf_col1:
+                    st.metric("Windows", len(wf_result.windows))
+                with wf_col2:
+                    st.metric("Out-of-Sample Trades", int(wf_result.windows['Test_Trades'].sum()))
+                with wf_col3:
+                    st.metric("Out-of-Sample P&L", f"${wf_result.equity.iloc[-1]:,.0f}")
+
+                equity_fig = go.Figure(go.Scatter(
+                    x=wf_result.equity.index, y=wf_result.equity.values,
+                    mode='lines', name='OOS Equity', line=dict(color='#00ff88', width=2)
+                ))
+                equity_fig.update_layout(
+                    title="Stitched Out-of-Sample Equity",
+                    template='plotly_dark', height=300, yaxis_title="Cumulative P&L ($)"
+                )
+                st.plotly_chart(equity_fig, use_container_width=True)
+                st.dataframe(wf_result.windows, use_container_width=True)
+
             # Close button
             if st.button("❌ Close Swing Trading Analysis"):
                 st.session_state.show_signal_history = False
                 st.rerun()
     
+    def display_portfolio_summary(self, data: pd.DataFrame, indexed):
+        """The same signals traded as one account under the portfolio limits"""
+        result = run_portfolio_trades({self.config.symbol: (data.index[WARMUP_BARS:], indexed.trades)}, self.config)
+        summary = result.summary
+        
+        st.markdown("#### 💼 **Portfolio Rules Applied**")
+        st.caption(
+            f"${self.config.account_value:,.0f} account, {self.config.risk_percent:g}% risk per trade, "
+            f"at most {self.config.max_positions} open positions, no entries after a "
+            f"{self.config.daily_loss_limit:g}% daily loss"
+        )
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Trades Taken", f"{summary['Trades']}/{summary['Candidates']}")
+        with col2:
+            color = "normal" if summary['Return_Pct'] > 0 else "inverse"
+            st.metric("Final Equity", f"${summary['Final_Equity']:,.0f}", f"{summary['Return_Pct']:+.1f}%", delta_color=color)
+        with col3:
+            st.metric("Max Drawdown", f"{summary['Max_Drawdown_Pct']:.1f}%")
+        with col4:
+            skipped = {reason: count for reason, count in result.skipped.items() if count}
+            st.metric("Skipped Signals", sum(skipped.values()),
+                      help=", ".join(f"{reason.replace('_', ' ')}: {count}" for reason, count in skipped.items()) or None)
+    
+    def display_monte_carlo(self, indexed):
+        """Distribution of outcomes when the same trades come in a different order or mix"""
+        r_multiples = trade_r_multiples(
+            indexed.trades['entry_price'], indexed.trades['exit_price'], indexed.trades['stop_loss']
+        )
+        if len(r_multiples) < 2:
+            return
+        
+        st.markdown("#### 🎲 **Monte Carlo Resampling**")
+        mc_col1, mc_col2, mc_col3 = st.columns(3)
+        with mc_col1:
+            n_paths = st.number_input("Paths", 1000, 100000, 10000, step=1000, key="mc_paths")
+        with mc_col2:
+            method = st.selectbox("Method", MONTE_CARLO_METHODS, key="mc_method",
+                                  help="bootstrap draws trades with replacement; shuffle reorders the historical trades")
+        with mc_col3:
+            ruin_percent = st.slider("Ruin at Drawdown (%)", 10, 90, 50, 5, key="mc_ruin")
+        
+        # Fixed seed so reruns show the same distribution; in-process, a pool isn't worth it per rerun
+        result = run_monte_carlo(
+            r_multiples, self.config.risk_percent, self.config.account_value, n_paths=int(n_paths),
+            method=method, ruin_percent=ruin_percent, seed=0, max_workers=1
+        )
+        st.caption(
+            f"{int(n_paths):,} paths of {len(r_multiples)} trades at {self.config.risk_percent:g}% risk of equity; "
+            f"ruin is equity {ruin_percent}% below ${self.config.account_value:,.0f}"
+        )
+        
+        percentiles = result.percentiles()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Median Final Equity", f"${percentiles.loc['P50', 'Final_Equity']:,.0f}",
+                      f"{percentiles.loc['P50', 'Return_Pct']:+.1f}%")
+        with col2:
+            st.metric("5th Pct Final Equity", f"${percentiles.loc['P5', 'Final_Equity']:,.0f}",
+                      f"{percentiles.loc['P5', 'Return_Pct']:+.1f}%")
+        with col3:
+            st.metric("95th Pct Max Drawdown", f"{percentiles.loc['P95', 'Max_Drawdown_Pct']:.1f}%")
+        with col4:
+            st.metric("Risk of Ruin", f"{result.risk_of_ruin_pct:.2f}%")
+        st.dataframe(percentiles.round(2), use_container_width=True)
+    
+    @traced('watchlist_scanner')
+    def display_watchlist_scanner(self, vix_value: float):
+        """Scan a watchlist with the six-criteria strategy and rank by signal strength"""
+        if 'show_watchlist_scan' not in st.session_state or not st.session_state.show_watchlist_scan:
+            return
+        
+        st.markdown("---")
+        st.subheader("🔍 Watchlist Scanner")
+        
+        with st.expander("Six-Criteria Scan Across the Watchlist", expanded=True):
+            self.config.watchlist = st.text_area(
+                "Tickers (comma or space separated)",
+                self.config.watchlist,
+                help="Every ticker is evaluated with the same entry criteria as the main dashboard"
+            )
+            symbols = self.config.watchlist.replace(',', ' ').split()
+            
+            with st.spinner(f"Scanning {len(symbols)} symbols..."):
+                ranked = scan_watchlist(
+                    get_bar_store(),
+                    symbols,
+                    vix_value,
+                    period=self.config.data_period,
+                    vix_threshold=self.config.vix_threshold,
+                    entry_multiplier=self.config.atr_entry_multiplier,
+                    ema_periods=self.config.ema_periods,
+                    atr_period=self.config.atr_period,
+                    volume_period=self.config.volume_period
+                )
+            
+            if ranked.empty:
+                st.warning("No watchlist data available")
+            else:
+                signals_found = (ranked['Strength'] == 6).sum()
+                st.metric("Full Entry Signals", f"{signals_found}/{len(ranked)}")
+                st.dataframe(ranked, use_container_width=True, height=400)
+            
+            if st.button("❌ Close Watchlist Scanner"):
+                st.session_state.show_watchlist_scan = False
+                st.rerun()
+    
+    @traced('entry_criteria_panel')
     def display_entry_criteria_panel(self, signals: Dict, vix_value: float, data: pd.DataFrame):
         """Display detailed entry criteria analysis"""
         st.subheader("🎯 Entry Signal Analysis")
@@ -1253,19 +917,19 @@ class InteractiveDashboard:
             atr = latest['ATR']
             
             # Stop Loss: Entry - (2.0 × ATR) OR 2% below entry (whichever gives smaller loss)
-            stop_loss_atr = signals['current_price'] - (2.0 * atr)
-            stop_loss_pct = signals['current_price'] * 0.98  # 2% below entry
+            stop_loss_atr = signals['current_price'] - (self.config.atr_stop_multiplier * atr)
+            stop_loss_pct = signals['current_price'] * (1 - self.config.stop_loss_percent / 100)  # 2% below entry
             stop_loss = max(stop_loss_atr, stop_loss_pct)  # Use whichever gives smaller loss
             
             # Targets following exact strategy:
             # Target 1: 5 EMA + (2.0 × ATR)
             # Target 2: 5 EMA + (3.0 × ATR)
-            target1 = latest['EMA_5'] + (2.0 * atr)
-            target2 = latest['EMA_5'] + (3.0 * atr)
+            target1 = latest['EMA_5'] + (self.config.atr_target1_multiplier * atr)
+            target2 = latest['EMA_5'] + (self.config.atr_target2_multiplier * atr)
             
             # Position sizing: Risk 1-2% of account per trade
-            account_value = 100000  # You can make this configurable
-            risk_percent = 0.01  # 1% risk per strategy
+            account_value = self.config.account_value
+            risk_percent = self.config.risk_percent / 100  # 1% risk per strategy
             risk_amount = account_value * risk_percent
             price_risk = signals['current_price'] - stop_loss
             shares = int(risk_amount / price_risk) if price_risk > 0 else 0
@@ -1343,6 +1007,9 @@ class InteractiveDashboard:
         
         # Data & Display Settings
         with st.sidebar.expander("📊 Data & Display Settings", expanded=False):
+            symbol = st.text_input("Symbol", self.config.symbol, help="Ticker analyzed on the main chart")
+            self.config.symbol = symbol.strip().upper() or self.config.symbol
+            
             # Historical data period for calculations
             data_options = {
                 "6 months": "6mo",
@@ -1377,6 +1044,54 @@ class InteractiveDashboard:
                 help="How much data to show on the chart"
             )
             self.config.chart_period = chart_options[selected_chart]
+            
+            intraday_options = {"Off": "off", "1 minute": "1m", "5 minutes": "5m"}
+            selected_intraday = st.selectbox(
+                "Live Intraday Bars",
+                options=list(intraday_options.keys()),
+                index=list(intraday_options.values()).index(self.config.intraday_interval),
+                help="Build today's bar from intraday bars so signals track the live session"
+            )
+            self.config.intraday_interval = intraday_options[selected_intraday]
+            
+            self.config.chart_max_points = st.number_input(
+                "Max Chart Points",
+                min_value=200,
+                max_value=10000,
+                value=self.config.chart_max_points,
+                step=100,
+                help="Longer ranges are downsampled to this many points per trace; narrow the visible range for full detail"
+            )
+        
+        # Account and portfolio limits used by the portfolio backtest
+        with st.sidebar.expander("💼 Risk & Portfolio", expanded=False):
+            self.config.account_value = st.number_input(
+                "Account Value ($)", min_value=1000.0, value=float(self.config.account_value), step=5000.0
+            )
+            self.config.risk_percent = st.slider("Risk per Trade (%)", 0.25, 5.0, float(self.config.risk_percent), 0.25)
+            self.config.max_positions = st.number_input(
+                "Max Open Positions", min_value=1, max_value=20, value=self.config.max_positions
+            )
+            self.config.daily_loss_limit = st.slider(
+                "Daily Loss Limit (%)", 0.0, 10.0, float(self.config.daily_loss_limit), 0.5,
+                help="No new entries on a day whose realized losses reach this share of equity (0 = off)"
+            )
+            self.config.scale_out_percent = st.slider(
+                "Scale Out at Target 1 (%)", 0.0, 100.0, float(self.config.scale_out_percent), 5.0,
+                help="Share of the position sold when Target 1 is touched; the rest rides to Target 2"
+            )
+            self.config.breakeven_after_target1 = st.checkbox(
+                "Breakeven Stop after Target 1", self.config.breakeven_after_target1
+            )
+
+        # Diagnostics
+        with st.sidebar.expander("🧪 Diagnostics", expanded=False):
+            self.config.timing_panel = st.checkbox(
+                "Timing Panel",
+                self.config.timing_panel,
+                key="timing_panel",
+                help="Break each rerun down by data fetch, indicators, signals and chart time"
+            )
         
         # Save config
         st.session_state.config = self.config
@@ -1393,29 +1108,36 @@ class InteractiveDashboard:
         # Data period info
         st.sidebar.info(f"📈 Data Period: {self.config.data_period.upper()}")
         st.sidebar.info(f"📊 Chart Shows: {self.config.chart_period.upper()}")
-        
-        st.sidebar.caption(f"Last Update: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
     
+    @traced('fetch_enhanced_data')
     def fetch_enhanced_data(self):
         """Fetch data with enhanced error handling and configurable timeframes"""
         try:
-            # QQQ data - fetch more historical data for better indicators
-            ticker = yf.Ticker("QQQ")
-            
-            # Fetch full historical data for calculations
-            full_data = ticker.history(period=self.config.data_period, interval="1d")
+            # Symbol data - served from the local bar store, only missing bars are downloaded
+            symbol = self.config.symbol
+            force = st.session_state.pop('force_data_refresh', False)
+            if self.config.auto_refresh:
+                # Live mode - the background worker fetches, this session only reads its latest snapshot
+                history, vix_history = self.read_live_snapshot(symbol, force)
+            else:
+                history = get_bar_store().load_history(symbol, interval="1d", period=self.config.data_period, force=force)
+                # VIX data - daily closes kept in the same bar store, the last bar is today's live value
+                vix_history = get_bar_store().load_history("^VIX", interval="1d", period=self.config.data_period, force=force)
+                vix_history = None if vix_history.empty else vix_history['Close']
+                st.session_state.last_refresh = datetime.now()
+
+            if history.empty:
+                st.error(f"❌ Failed to fetch {symbol} data")
+                return None, None, None
             
-            if full_data.empty:
-                st.error("❌ Failed to fetch QQQ data")
-                return None, None
+            # Live intraday bars resampled into the forming daily bar
+            if self.config.intraday_interval != "off":
+                feed = get_intraday_feed(symbol, self.config.intraday_interval, self.config.intraday_sessions)
+                history = with_live_bar(history, feed.poll(force=force))
             
-            # Calculate indicators on full dataset
-            full_data['EMA_5'] = full_data['Close'].ewm(span=5).mean()
-            full_data['EMA_10'] = full_data['Close'].ewm(span=10).mean()
-            full_data['EMA_21'] = full_data['Close'].ewm(span=21).mean()
-            full_data['EMA_50'] = full_data['Close'].ewm(span=50).mean()
-            full_data['ATR'] = self.calculate_atr(full_data['High'], full_data['Low'], full_data['Close'])
-            full_data['Volume_Avg'] = full_data['Volume'].rolling(20).mean()
+            # Indicators are computed once per process for this key and shared read-only by every session
+            snapshot = self.get_shared_snapshot(symbol, history, vix_history)
+            full_data = snapshot.data
             
             # Filter data for chart display based on chart_period
             if self.config.chart_period == "1mo":
@@ -1429,31 +1151,68 @@ class InteractiveDashboard:
             else:
                 chart_data = full_data  # Show all data
             
-            # VIX data
-            vix_ticker = yf.Ticker("^VIX")
-            vix_data = vix_ticker.history(period="1d", interval="1m")
-            vix_value = vix_data['Close'].iloc[-1] if not vix_data.empty else 20.0
-            
-            st.session_state.last_refresh = datetime.now()
-            
-            # Store both full data and chart data
-            st.session_state.full_data = full_data
+            # VIX data - daily closes kept in the same bar store, the last bar is today's live value
+            vix_value = vix_history.iloc[-1] if vix_history is not None else 20.0
+
+            # Only a reference to the shared VIX closes is kept per session
+            st.session_state.vix_data = vix_history
             
-            return chart_data, vix_value
+            return chart_data, full_data, vix_value
             
         except Exception as e:
             st.error(f"❌ Data fetch error: {str(e)}")
-            return None, None
+            return None, None, None
+    
+    def read_live_snapshot(self, symbol: str, force: bool = False):
+        """Latest bars and VIX closes from the background refresh worker"""
+        worker = get_refresh_worker()
+        key = worker.subscribe(symbol, "1d", self.config.data_period, self.config.refresh_interval,
+                               subscriber=st.session_state.setdefault('session_id', uuid.uuid4().hex))
+        snapshot = worker.snapshot(key)
+        if snapshot is None or force:
+            # First subscriber (or a manual refresh) waits for one fetch, everyone after reads
+            snapshot = worker.refresh(key)
+        st.session_state.last_refresh = snapshot.fetched_at.to_pydatetime()
+        return snapshot.history, snapshot.vix
+
+    def snapshot_key(self, symbol: str):
+        """Shared snapshot key and indicator periods for a symbol under the current settings"""
+        interval = "1d" if self.config.intraday_interval == "off" else f"1d+{self.config.intraday_interval}"
+        periods = (self.config.ema_periods, self.config.atr_period, self.config.volume_period)
+        return (symbol, interval, self.config.data_period), periods
+    
+    def get_shared_snapshot(self, symbol: str, history: pd.DataFrame, vix: Optional[pd.Series]) -> SharedSnapshot:
+        """This session's hold on the process-wide snapshot for its symbol and settings"""
+        key, periods = self.snapshot_key(symbol)
+        registry = get_snapshot_registry()
+        registry.acquire(st.session_state.setdefault('session_id', uuid.uuid4().hex), key)
+        return registry.snapshot(key, periods, history, vix)
+    
+    def select_visible_range(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Date-range slider for long charts; ranges within the point cap render at full detail"""
+        if len(data) <= self.config.chart_max_points:
+            return data
+        
+        first, last = data.index[0].date(), data.index[-1].date()
+        start, end = st.slider(
+            "Visible Range",
+            min_value=first,
+            max_value=last,
+            value=(first, last),
+            format="YYYY-MM-DD",
+            key=f"visible_range_{self.config.symbol}_{self.config.chart_period}_{first}"
+        )
+        return data.loc[str(start):str(end)]
+    
+    def get_figure_cache(self) -> FigureCache:
+        """Per-session price chart cache, so reruns only patch in new bars"""
+        return st.session_state.setdefault('figure_cache', FigureCache())
     
     def calculate_atr(self, high, low, close, period=14):
         """Calculate Average True Range"""
-        high_low = high - low
-        high_close = np.abs(high - close.shift())
-        low_close = np.abs(low - close.shift())
-        
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        return true_range.rolling(window=period).mean()
+        return calculate_atr(high, low, close, period)
     
+    @traced('evaluate_signals')
     def evaluate_signals(self, data, vix_value):
         """EXACT STRATEGY SIGNAL EVALUATION - Following documented rules precisely"""
         if len(data) < 50:
@@ -1461,90 +1220,45 @@ class InteractiveDashboard:
         
         latest = data.iloc[-1]
         
-        # EXACT ENTRY CRITERIA - ALL 6 MUST BE MET
-        
-        # 1. EMA Stack: 10 EMA > 21 EMA > 50 EMA (bullish momentum)
-        ema_alignment = latest['EMA_10'] > latest['EMA_21'] > latest['EMA_50']
-        
-        # 2. Price Position: Current price must be above 50 EMA (trend confirmation)
-        price_above_50ema = latest['Close'] > latest['EMA_50']
-        
-        # 3. Entry Trigger: Price touches or dips below (5 EMA - 1.5×ATR)
-        entry_level = latest['EMA_5'] - (1.5 * latest['ATR'])
-        price_touch_entry = latest['Close'] <= entry_level or latest['Low'] <= entry_level
-        
-        # 4. Volume Confirmation: Entry day volume > 20-day average volume
-        volume_above_avg = latest['Volume'] > latest['Volume_Avg']
-        
-        # 5. Market Environment: VIX < 30 (Low fear/volatility environment)
-        vix_below_threshold = vix_value < 30.0
-        
-        # 6. Momentum Filter: Price must be higher than 5 days ago
-        momentum_positive = latest['Close'] > data['Close'].iloc[-6]
+        # EXACT ENTRY CRITERIA - ALL 6 MUST BE MET (shared with the historical engine)
+        criteria = entry_criteria(
+            latest['Close'], latest['Low'], latest['Volume'],
+            latest['EMA_5'], latest['EMA_10'], latest['EMA_21'], latest['EMA_50'],
+            latest['ATR'], latest['Volume_Avg'], data['Close'].iloc[-6],
+            # 5. Market Environment: VIX below threshold (Low fear/volatility environment)
+            vix_value < self.config.vix_threshold
+        )
         
         # FINAL SIGNAL: ALL 6 CRITERIA MUST BE TRUE
-        signal = all([
-            ema_alignment,
-            price_above_50ema,
-            price_touch_entry,
-            volume_above_avg,
-            vix_below_threshold,
-            momentum_positive
-        ])
-        
-        # Generate alerts for strong signals
-        if signal and not hasattr(st.session_state, 'last_signal_price'):
-            self.add_alert('entry', 'EXACT STRATEGY ENTRY SIGNAL - All 6 criteria met!', latest['Close'], 'high')
-            st.session_state.last_signal_price = latest['Close']
+        signal = all(criteria[key] for key in CRITERIA_KEYS)
+        
+        # Alert on signals turning on or off at the latest bar - the store keeps one alert per transition
+        tail = data.iloc[-(MOMENTUM_LOOKBACK + 2):]
+        vix_ok = vix_below(align_vix(tail.index, st.session_state.get('vix_data')), self.config.vix_threshold)
+        vix_ok[-1] = vix_value < self.config.vix_threshold
+        columns = {name: tail[name].to_numpy(dtype=float) for name in INPUT_COLUMNS}
+        series = compute_signals(columns, self.config.atr_entry_multiplier, vix_ok, first_bar=len(data) - len(tail))
+        for alert in edge_alerts(self.config.symbol, tail.index, columns['Close'],
+                                 series['entry_signal'], series['exit_signal']):
+            self.alerts.add(alert)
         
         return {
             'signal': signal,
-            'ema_alignment': ema_alignment,
-            'price_above_50ema': price_above_50ema,
-            'price_touch_entry': price_touch_entry,
-            'volume_above_avg': volume_above_avg,
-            'vix_below_threshold': vix_below_threshold,
-            'momentum_positive': momentum_positive,
-            'entry_level': entry_level,
+            **{key: bool(criteria[key]) for key in CRITERIA_KEYS},
+            'entry_level': criteria['entry_level'],
             'current_price': latest['Close'],
-            'strength': sum([ema_alignment, price_above_50ema, price_touch_entry, 
-                           volume_above_avg, vix_below_threshold, momentum_positive])
+            'strength': sum(bool(criteria[key]) for key in CRITERIA_KEYS)
         }
     
-    def run(self):
-        """Main enhanced dashboard execution"""
-        # Inject JavaScript for interactivity
-        components.html(auto_refresh_js + interactive_js, height=0)
-        
-        # Enhanced header
-        self.display_enhanced_header()
-        
-        # Enhanced sidebar
-        self.display_enhanced_sidebar()
-        
-        # Auto-refresh logic using native Streamlit
-        if self.config.auto_refresh:
-            # Use a simple counter to trigger refresh
-            if 'refresh_counter' not in st.session_state:
-                st.session_state.refresh_counter = 0
-            
-            # Auto-refresh using meta refresh or JavaScript
-            if st.session_state.refresh_counter == 0 or (datetime.now() - st.session_state.last_refresh).seconds >= self.config.refresh_interval:
-                components.html(f"""
-                <script>
-                setTimeout(function() {{
-                    window.location.reload();
-                }}, {self.config.refresh_interval * 1000});
-                </script>
-                """, height=0)
-                st.session_state.refresh_counter += 1
-        
+    @traced('live_market')
+    def display_live_market(self):
+        """Chart, price and VIX cards - the part of the page that follows the refresh worker"""
         # Fetch data
         with st.spinner("🔄 Fetching real-time data..."):
-            data, vix_value = self.fetch_enhanced_data()
+            data, full_data, vix_value = self.fetch_enhanced_data()
         
         if data is None:
-            st.stop()
+            return None
         
         # Evaluate signals
         signals = self.evaluate_signals(data, vix_value)
@@ -1554,8 +1268,13 @@ class InteractiveDashboard:
         
         with col1:
             # Enhanced price chart
-            chart = InteractiveCharts.create_enhanced_price_chart(data, signals, self.config)
-            st.plotly_chart(chart, use_container_width=True)
+            visible = self.select_visible_range(data)
+            chart = self.get_figure_cache().price_chart(visible, signals, self.config)
+            with span('plotly_chart.price'):
+                st.plotly_chart(chart, use_container_width=True)
+            if len(visible) > self.config.chart_max_points:
+                st.caption(f"🔎 {len(visible):,} bars shown at {self.config.chart_max_points:,} points per trace - "
+                           "narrow the visible range for full detail")
         
         with col2:
             # Current price with enhanced styling
@@ -1570,7 +1289,7 @@ class InteractiveDashboard:
             
             st.markdown(f"""
             <div class="signal-card">
-                <h3>QQQ Live Price</h3>
+                <h3>{self.config.symbol} Live Price</h3>
                 <h2>${current_price:.2f}</h2>
                 <p style="color: {'#00ff88' if price_change >= 0 else '#ff4757'}">
                     {price_change:+.2f} ({price_change_pct:+.2f}%)
@@ -1593,6 +1312,73 @@ class InteractiveDashboard:
             </div>
             """, unsafe_allow_html=True)
         
+        st.caption(f"Last Update: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
+        
+        # The panels below only redraw on a full run - rerun the app when a timed update changes the signal
+        signal_state = (signals['signal'], signals.get('strength'))
+        if self.live_signal_state is not None and signal_state != self.live_signal_state:
+            st.rerun()
+        self.live_signal_state = signal_state
+        
+        return data, full_data, vix_value, signals
+    
+    def run(self):
+        """Main enhanced dashboard execution, timed span by span when diagnostics are on"""
+        # A keyed checkbox already holds its new value before the sidebar draws it
+        timing = st.session_state.get('timing_panel', self.config.timing_panel)
+        if not (timing or METRICS_FILE):
+            self.display_dashboard()
+            return
+        
+        metrics = get_span_metrics()
+        with recording() as recorder:
+            with span('run'):
+                self.display_dashboard()
+        
+        recorder.log(symbol=self.config.symbol)
+        if METRICS_FILE:
+            # Write then rename, so a scraper never reads a half-written file
+            with open(METRICS_FILE + '.tmp', 'w') as f:
+                f.write(metrics.exposition())
+            os.replace(METRICS_FILE + '.tmp', METRICS_FILE)
+        if timing:
+            self.display_timing_panel(recorder, metrics)
+    
+    def display_timing_panel(self, recorder: SpanRecorder, metrics: SpanMetrics):
+        """Sidebar breakdown of where the last rerun spent its time"""
+        with st.sidebar.expander("⏱️ Rerun Timing", expanded=True):
+            total = next((r.duration_ms for r in recorder.records if r.name == 'run'), 0.0) or 1.0
+            st.dataframe(pd.DataFrame({
+                'Span': ['\u2003' * r.depth + r.name for r in recorder.records],
+                'ms': [round(r.duration_ms, 1) for r in recorder.records],
+                '% of run': [round(100 * r.duration_ms / total, 1) for r in recorder.records],
+            }), hide_index=True, use_container_width=True)
+            st.caption("Last full rerun - the live section also refreshes on its own timer")
+            st.download_button(
+                "📥 Prometheus Metrics",
+                metrics.exposition(),
+                file_name="swing_metrics.prom",
+                mime="text/plain"
+            )
+    
+    def display_dashboard(self):
+        """Render the whole page"""
+        # Inject JavaScript for interactivity
+        components.html(interactive_js, height=0)
+        
+        # Enhanced sidebar - first, so the header shows the symbol chosen on this rerun
+        self.display_enhanced_sidebar()
+        
+        # Enhanced header
+        self.display_enhanced_header()
+        
+        # Live section - in live mode it reruns on its own every interval, without reloading the page
+        run_every = self.config.refresh_interval if self.config.auto_refresh else None
+        live = st.fragment(self.display_live_market, run_every=run_every)()
+        if live is None:
+            st.stop()
+        data, full_data, vix_value, signals = live
+        
         # Interactive controls
         self.display_interactive_controls()
         
@@ -1605,9 +1391,11 @@ class InteractiveDashboard:
         # Detailed entry criteria analysis
         self.display_entry_criteria_panel(signals, vix_value, data)
         
-        # Historical signal analysis - use full dataset if available
-        display_data = st.session_state.get('full_data', data)
-        self.display_signal_history(display_data)
+        # Historical signal analysis over the full shared dataset
+        self.display_signal_history(full_data)
+        
+        # Multi-symbol watchlist scan
+        self.display_watchlist_scanner(vix_value)
         
         # Enhanced signal display
         if signals['signal']:
@@ -1632,19 +1420,16 @@ class InteractiveDashboard:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            active_trades = len([t for t in self.trades if t.is_active])
-            st.metric("Active Trades", active_trades)
+            st.metric("Active Trades", self.journal.count(active=True))
         
         with col2:
-            # Show total strategy signals detected today
-            today_alerts = [a for a in self.alerts if a.type == 'entry']
-            st.metric("Entry Signals Today", len(today_alerts))
+            st.metric("Entry Signals Today", self.alerts.count(datetime.now().astimezone().date(), 'entry'))
         
         with col3:
-            alerts_count = len(self.alerts)
-            st.metric("Total Alerts", alerts_count)
+            st.metric("Total Alerts", len(self.alerts))
 
 # Run the enhanced dashboard
 if __name__ == "__main__":
+    configure_page()
     dashboard = InteractiveDashboard()
     dashboard.run()
\ No newline at end of file
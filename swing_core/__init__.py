@@ -0,0 +1,98 @@
+"""Headless strategy core for the QQQ swing trading dashboard
+
+Names are imported on first use, so ``import swing_core`` (and the CLI's
+argument parsing) stays cheap; pandas, plotting and network code load
+only with the modules that need them.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from swing_core.alerts import AlertStore, TradingAlert, edge_alerts, signal_edges
+    from swing_core.backtest import match_trades, simulate_trades
+    from swing_core.batch import run_batch
+    from swing_core.bar_store import BarStore, YFinanceProvider
+    from swing_core.config import TradeConfig
+    from swing_core.indicators import AtrState, IndicatorState, add_indicators, atr_kernel, calculate_atr
+    from swing_core.intraday import BarRing, DailyBarBuilder, IntradayFeed
+    from swing_core.journal import Trade, TradeJournal
+    from swing_core.monte_carlo import MonteCarloResult, run_monte_carlo, trade_r_multiples
+    from swing_core.optimizer import grid_configs, random_configs, run_sweep
+    from swing_core.portfolio import PortfolioResult, run_portfolio
+    from swing_core.refresh import RefreshWorker
+    from swing_core.scanner import scan_watchlist
+    from swing_core.signal_index import SignalIndex
+    from swing_core.snapshots import SnapshotRegistry
+    from swing_core.spans import SpanMetrics, SpanRecorder, recording, span
+    from swing_core.signals import (
+        SIGNAL_COLUMNS,
+        align_vix,
+        calculate_signal_frame,
+        entry_criteria,
+        exit_criteria,
+    )
+    from swing_core.walk_forward import WalkForwardResult, run_walk_forward, walk_forward_windows
+
+# Public name -> defining module
+_EXPORTS = {
+    'AlertStore': 'alerts',
+    'AtrState': 'indicators',
+    'BarRing': 'intraday',
+    'BarStore': 'bar_store',
+    'DailyBarBuilder': 'intraday',
+    'IndicatorState': 'indicators',
+    'IntradayFeed': 'intraday',
+    'MonteCarloResult': 'monte_carlo',
+    'PortfolioResult': 'portfolio',
+    'RefreshWorker': 'refresh',
+    'SIGNAL_COLUMNS': 'signals',
+    'SignalIndex': 'signal_index',
+    'SnapshotRegistry': 'snapshots',
+    'SpanMetrics': 'spans',
+    'SpanRecorder': 'spans',
+    'Trade': 'journal',
+    'TradeConfig': 'config',
+    'TradeJournal': 'journal',
+    'TradingAlert': 'alerts',
+    'WalkForwardResult': 'walk_forward',
+    'YFinanceProvider': 'bar_store',
+    'add_indicators': 'indicators',
+    'align_vix': 'signals',
+    'atr_kernel': 'indicators',
+    'calculate_atr': 'indicators',
+    'calculate_signal_frame': 'signals',
+    'edge_alerts': 'alerts',
+    'entry_criteria': 'signals',
+    'exit_criteria': 'signals',
+    'grid_configs': 'optimizer',
+    'match_trades': 'backtest',
+    'random_configs': 'optimizer',
+    'recording': 'spans',
+    'run_batch': 'batch',
+    'run_monte_carlo': 'monte_carlo',
+    'run_portfolio': 'portfolio',
+    'run_sweep': 'optimizer',
+    'run_walk_forward': 'walk_forward',
+    'scan_watchlist': 'scanner',
+    'signal_edges': 'alerts',
+    'simulate_trades': 'backtest',
+    'span': 'spans',
+    'trade_r_multiples': 'monte_carlo',
+    'walk_forward_windows': 'walk_forward',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,6 @@
+"""python -m swing_core"""
+import sys
+
+from swing_core.cli import main
+
+sys.exit(main())
@@ -0,0 +1,176 @@
+"""Bounded alert store and edge-triggered alerts from the signal series"""
+import json
+import os
+import threading
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Signal transition -> (alert type, message, priority)
+EDGE_ALERTS = {
+    'entry_on': ('entry', 'EXACT STRATEGY ENTRY SIGNAL - All 6 criteria met!', 'high'),
+    'entry_off': ('info', 'Entry signal cleared - not all 6 criteria met', 'normal'),
+    'exit_on': ('exit', 'Exit signal - trend break below 21 EMA or a > 3% down day', 'high'),
+}
+
+
+@dataclass
+class TradingAlert:
+    """Trading alert structure"""
+    timestamp: datetime
+    type: str  # 'entry', 'exit', 'warning', 'info'
+    message: str
+    price: float
+    priority: str = 'normal'  # 'low', 'normal', 'high', 'critical'
+    symbol: str = ''
+    bar_time: Optional[datetime] = None  # Bar whose signal transition raised the alert
+
+    @property
+    def key(self) -> Optional[Tuple[str, str, datetime]]:
+        """Identity of an edge alert - the same transition on the same bar is one alert"""
+        return None if self.bar_time is None else (self.symbol, self.type, self.bar_time)
+
+    def to_json(self) -> str:
+        values = asdict(self)
+        values['timestamp'] = self.timestamp.isoformat()
+        values['bar_time'] = None if self.bar_time is None else self.bar_time.isoformat()
+        return json.dumps(values)
+
+    @classmethod
+    def from_json(cls, line: str) -> 'TradingAlert':
+        values = json.loads(line)
+        values['timestamp'] = datetime.fromisoformat(values['timestamp'])
+        if values['bar_time'] is not None:
+            values['bar_time'] = pd.Timestamp(values['bar_time'])
+        return cls(**values)
+
+
+def signal_edges(entry_signal: np.ndarray, exit_signal: np.ndarray, lookback: int = 1) -> List[Tuple[int, str]]:
+    """(bar position, transition) for the signals turning on or off within the last lookback bars"""
+    entry_signal, exit_signal = np.asarray(entry_signal, dtype=bool), np.asarray(exit_signal, dtype=bool)
+    first = max(len(entry_signal) - lookback, 1)
+    edges = []
+    for name, mask in (
+        ('entry_on', entry_signal[first:] & ~entry_signal[first - 1:-1]),
+        ('entry_off', ~entry_signal[first:] & entry_signal[first - 1:-1]),
+        ('exit_on', exit_signal[first:] & ~exit_signal[first - 1:-1]),
+    ):
+        edges.extend((int(position) + first, name) for position in np.flatnonzero(mask))
+    return sorted(edges)
+
+
+def edge_alerts(symbol: str, index: pd.DatetimeIndex, close: np.ndarray, entry_signal: np.ndarray,
+                exit_signal: np.ndarray, lookback: int = 1) -> List[TradingAlert]:
+    """One alert per signal transition on the last lookback bars, keyed by symbol and bar"""
+    now = datetime.now().astimezone()
+    alerts = []
+    for position, edge in signal_edges(entry_signal, exit_signal, lookback):
+        alert_type, message, priority = EDGE_ALERTS[edge]
+        alerts.append(TradingAlert(now, alert_type, message, float(close[position]), priority, symbol,
+                                   index[position]))
+    return alerts
+
+
+class AlertStore:
+    """The latest alerts in a fixed-size ring, indexed by day, optionally kept in a JSON-lines file
+
+    Appends are O(1): the oldest alert is overwritten once the ring is full.
+    Alerts arrive in time order, so each day's alerts are one contiguous run
+    of sequence numbers and per-day counts stay exact as old ones drop out.
+    Edge alerts already held are not added again, so every session sharing
+    the store sees a transition once. The file is appended to and rewritten
+    with just the held alerts once it reaches twice the capacity in lines.
+    """
+
+    def __init__(self, capacity: int = 500, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self._ring: List[Optional[TradingAlert]] = [None] * capacity
+        self._next = 0  # Sequence number of the next alert
+        self._days: Dict[date, List[int]] = {}  # day -> [first, end) sequence numbers held
+        self._counts: Counter = Counter()  # (day, type) -> alerts held
+        self._keys = set()
+        self._file_lines = 0
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path: str):
+        with open(path) as f:
+            lines = deque(f, maxlen=self.capacity)
+        for line in lines:
+            self._append(TradingAlert.from_json(line))
+        self._compact()
+
+    def _compact(self):
+        """Rewrite the file with only the alerts the ring holds, oldest first"""
+        held = self._range(self._next - self.capacity, self._next)[::-1]
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.writelines(alert.to_json() + '\n' for alert in held)
+        os.replace(tmp_path, self.path)
+        self._file_lines = len(held)
+
+    def _append(self, alert: TradingAlert):
+        slot = self._next % self.capacity
+        evicted = self._ring[slot]
+        if evicted is not None:
+            day = evicted.timestamp.date()
+            self._counts[(day, evicted.type)] -= 1
+            self._days[day][0] += 1
+            if self._days[day][0] == self._days[day][1]:
+                del self._days[day]
+            self._keys.discard(evicted.key)
+
+        self._ring[slot] = alert
+        day = alert.timestamp.date()
+        self._days.setdefault(day, [self._next, self._next])[1] = self._next + 1
+        self._counts[(day, alert.type)] += 1
+        if alert.key is not None:
+            self._keys.add(alert.key)
+        self._next += 1
+
+    def add(self, alert: TradingAlert) -> bool:
+        """Append an alert, False when the same edge alert is already held"""
+        with self._lock:
+            if alert.key is not None and alert.key in self._keys:
+                return False
+            self._append(alert)
+            if self.path:
+                with open(self.path, 'a') as f:
+                    f.write(alert.to_json() + '\n')
+                self._file_lines += 1
+                if self._file_lines >= 2 * self.capacity:
+                    self._compact()
+            return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return min(self._next, self.capacity)
+
+    def _range(self, first: int, end: int) -> List[TradingAlert]:
+        """Alerts with sequence numbers in [first, end), newest first"""
+        first = max(first, self._next - self.capacity, 0)
+        return [self._ring[seq % self.capacity] for seq in range(end - 1, first - 1, -1)]
+
+    def latest(self, n: int = 5) -> List[TradingAlert]:
+        with self._lock:
+            return self._range(self._next - n, self._next)
+
+    def on_day(self, day: date) -> List[TradingAlert]:
+        """A day's alerts, newest first"""
+        with self._lock:
+            first, end = self._days.get(day, (0, 0))
+            return self._range(first, end)
+
+    def count(self, day: date, alert_type: Optional[str] = None) -> int:
+        """Alerts held for a day, optionally of one type"""
+        with self._lock:
+            if alert_type is not None:
+                return self._counts[(day, alert_type)]
+            first, end = self._days.get(day, (0, 0))
+            return end - first
@@ -0,0 +1,250 @@
+"""Array-backed trade simulation kernel - EXACT STRATEGY RULES"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_core.config import TradeConfig
+
+# Maximum hold per strategy rules, measured in calendar time like the signal dates
+MAX_HOLD_NS = pd.Timedelta(days=10).value
+DAY_NS = pd.Timedelta(days=1).value
+
+TRADE_COLUMNS = [
+    'Entry_Date', 'Entry_Price', 'Exit_Date', 'Exit_Price', 'Hold_Days',
+    'Stop_Loss', 'Target_1', 'Target_2', 'T1_Hit', 'T2_Hit',
+    'Price_Change', 'Profit_Pct', 'Shares', 'Total_Profit', 'Exit_Reason', 'Trade_Result',
+]
+
+
+# Exit reason codes in simulate_trades' 'exit_reason' array, and their trade table labels
+EXIT_SIGNAL, EXIT_TIME, EXIT_STOP, EXIT_TARGET2, EXIT_BREAKEVEN = range(5)
+EXIT_LABELS = ('Exit Signal', '⏰ 10-Day Limit', '🚨 Stop Loss', '🎯 Target 2 Hit', '⚖️ Breakeven Stop')
+
+# Cap on the (trades × bars) touch matrices built at once
+TOUCH_CHUNK_CELLS = 1 << 20
+
+
+def _first(mask: np.ndarray) -> np.ndarray:
+    """Column of the first True per row, the row width where there is none"""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
+
+
+def _path_exits(open_: np.ndarray, high: np.ndarray, low: np.ndarray, entry_pos: np.ndarray,
+                last_pos: np.ndarray, entry_price: np.ndarray, stop_loss: np.ndarray, target1: np.ndarray,
+                target2: np.ndarray, breakeven: bool) -> Dict[str, np.ndarray]:
+    """First-touch offsets (1 = bar after entry) of stop, T1, then T2 and the moved stop, per trade
+
+    Every trade's bars from entry+1 to last_pos are laid out as one row of
+    a (trades × bars) matrix, so all touches resolve in a few vectorized
+    passes. When one bar touches both stop and Target 1 the stop is taken
+    first unless the bar opened at or above the target - daily bars can't
+    tell otherwise, and that's the conservative reading.
+    """
+    width = int((last_pos - entry_pos).max(initial=1))
+    offsets = np.arange(1, width + 1)
+    cols = np.arange(width)
+    n = len(high)
+    out = {key: np.empty(len(entry_pos), dtype=np.int64) for key in ('stop', 'target1', 'rest')}
+    out['rest_reason'] = np.empty(len(entry_pos), dtype=np.int8)
+    out['stop_first'] = np.empty(len(entry_pos), dtype=bool)
+    chunk = max(TOUCH_CHUNK_CELLS // width, 1)
+    for lo in range(0, len(entry_pos), chunk):
+        rows = slice(lo, lo + chunk)
+        bars = entry_pos[rows, None] + offsets
+        inside = bars <= last_pos[rows, None]
+        bars = np.minimum(bars, n - 1)
+        highs, lows = high[bars], low[bars]
+
+        stop_touch = inside & (lows <= stop_loss[rows, None])
+        first_stop = _first(stop_touch)
+        first_target1 = _first(inside & (highs >= target1[rows, None]))
+        # A bar gapping up through Target 1 filled it at the open, before any dip to the stop
+        target1_bar = bars[np.arange(len(first_target1)), np.minimum(first_target1, width - 1)]
+        gap_target1 = open_[target1_bar] >= target1[rows]
+        stop_first = (first_stop < width) & ((first_stop < first_target1)
+                                             | ((first_stop == first_target1) & ~gap_target1))
+
+        # After T1 the rest exits at T2 (from the T1 bar on) or at the moved stop (from the next bar)
+        after = cols > first_target1[:, None]
+        first_target2 = _first(inside & (highs >= target2[rows, None]) & (cols >= first_target1[:, None]))
+        if breakeven:
+            first_moved = _first(inside & (lows <= entry_price[rows, None]) & after)
+        else:
+            first_moved = _first(stop_touch & after)
+        moved_first = first_moved <= first_target2
+
+        out['stop'][rows] = first_stop
+        out['stop_first'][rows] = stop_first
+        out['target1'][rows] = first_target1
+        out['rest'][rows] = np.minimum(first_moved, first_target2)
+        out['rest_reason'][rows] = np.where(moved_first, EXIT_BREAKEVEN if breakeven else EXIT_STOP, EXIT_TARGET2)
+    out['width'] = width
+    return out
+
+
+def simulate_trades(dates_ns: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    entry_signal: np.ndarray, exit_signal: np.ndarray, ema_5: np.ndarray, atr: np.ndarray,
+                    target1_multiplier: float = 2.0, target2_multiplier: float = 3.0,
+                    stop_multiplier: float = 2.0, stop_loss_percent: float = 2.0,
+                    account_value: float = 100000, risk_percent: float = 1.0,
+                    scale_out_percent: float = 50.0, breakeven_after_target1: bool = True) -> Dict[str, np.ndarray]:
+    """Resolve every entry to its exit along the bar path, all trades at once
+
+    Each trade enters at the entry bar's close. Its base exit is the first
+    exit signal within the 10-day limit, else the first bar on or after the
+    limit. Before that, the first bar whose low touches the stop closes the
+    whole position; the first whose high touches Target 1 sells
+    scale_out_percent there and moves the stop to breakeven, after which
+    the rest leaves at Target 2, the moved stop or the base exit. exit_price
+    is the share-weighted average of both legs, so P&L stays
+    (exit_price - entry_price) × shares; a zero-share position blends the
+    legs at scale_out_percent. A bar that opens through a level fills at
+    its open. Trades still open on the last bar are left out.
+    """
+    n = len(close)
+    entry_pos = np.flatnonzero(entry_signal)
+    exit_pos = np.flatnonzero(exit_signal)
+
+    # Next exit signal strictly after each entry, accepted only within the 10-day limit
+    limit_ns = dates_ns[entry_pos] + MAX_HOLD_NS
+    next_exit = np.searchsorted(exit_pos, entry_pos, side='right')
+    has_exit = next_exit < len(exit_pos)
+    signal_exit_pos = exit_pos[np.minimum(next_exit, len(exit_pos) - 1)] if len(exit_pos) else entry_pos
+    signal_exit = has_exit & (dates_ns[signal_exit_pos] <= limit_ns)
+
+    # Time-based exit: first bar on or after the 10-day limit
+    time_exit_pos = np.searchsorted(dates_ns, limit_ns, side='left')
+    base_found = signal_exit | (time_exit_pos < n)
+    base_exit = np.where(signal_exit, signal_exit_pos, np.minimum(time_exit_pos, n - 1))
+
+    entry_price = close[entry_pos]
+    entry_atr = atr[entry_pos]
+
+    # Stop Loss: Entry - (2.0 × ATR) OR 2% below entry (whichever gives smaller loss)
+    stop_loss = np.maximum(entry_price - (stop_multiplier * entry_atr),
+                           entry_price * (1 - stop_loss_percent / 100))
+
+    # Target 1: 5 EMA + (2.0 × ATR), Target 2: 5 EMA + (3.0 × ATR)
+    target1 = ema_5[entry_pos] + (target1_multiplier * entry_atr)
+    target2 = ema_5[entry_pos] + (target2_multiplier * entry_atr)
+
+    # Position Sizing: Risk 1% of account per trade
+    risk_amount = account_value * (risk_percent / 100)
+    risk_per_share = entry_price - stop_loss
+    positive_risk = risk_per_share > 0
+    shares = np.full(len(entry_pos), 100, dtype=np.int64)
+    shares[positive_risk] = np.trunc(risk_amount / risk_per_share[positive_risk])
+
+    touches = _path_exits(open_, high, low, entry_pos, base_exit, entry_price, stop_loss, target1, target2,
+                          breakeven_after_target1)
+    width = touches['width']
+    stopped = touches['stop_first']
+    scaled = (touches['target1'] < width) & ~stopped
+    rest_touched = scaled & (touches['rest'] < width)
+
+    # Bars and prices of the first leg (whole position when stopped) and the rest
+    first_at = entry_pos + 1 + np.where(stopped, touches['stop'], touches['target1'])
+    rest_at = np.where(rest_touched, entry_pos + 1 + touches['rest'], base_exit)
+    first_at, rest_at = np.minimum(first_at, n - 1), np.minimum(rest_at, n - 1)
+    first_price = np.where(stopped, np.minimum(stop_loss, open_[first_at]), np.maximum(target1, open_[first_at]))
+    rest_target2 = touches['rest_reason'] == EXIT_TARGET2
+    rest_level = np.select([rest_target2, touches['rest_reason'] == EXIT_BREAKEVEN], [target2, entry_price], stop_loss)
+    rest_fill = np.where(rest_target2, np.maximum(rest_level, open_[rest_at]), np.minimum(rest_level, open_[rest_at]))
+    rest_price = np.where(rest_touched, rest_fill, close[rest_at])
+
+    scale_shares = np.where(scaled, np.floor(shares * scale_out_percent / 100).astype(np.int64), 0)
+    # Share-weighted legs; a position too small for one share still prices at the nominal split
+    scale_fraction = np.where(shares > 0, scale_shares / np.maximum(shares, 1), scale_out_percent / 100)
+    blended = scale_fraction * first_price + (1 - scale_fraction) * rest_price
+    exit_at = np.where(stopped, first_at, rest_at)
+    exit_price = np.where(stopped, first_price, np.where(scaled, blended, rest_price))
+    exit_reason = np.where(stopped, EXIT_STOP,
+                           np.where(rest_touched, touches['rest_reason'], np.where(signal_exit, EXIT_SIGNAL, EXIT_TIME)))
+
+    # Skip trades still open on the last bar
+    valid = stopped | rest_touched | base_found
+    return {
+        'entry_pos': entry_pos[valid],
+        'exit_pos': exit_at[valid],
+        'signal_exit': (exit_reason == EXIT_SIGNAL)[valid],
+        'exit_reason': exit_reason[valid].astype(np.int8),
+        'entry_price': entry_price[valid],
+        'exit_price': exit_price[valid],
+        'hold_days': ((dates_ns[exit_at] - dates_ns[entry_pos]) // DAY_NS)[valid],
+        'stop_loss': stop_loss[valid],
+        'target1': target1[valid],
+        'target2': target2[valid],
+        'target1_hit': scaled[valid],
+        'target2_hit': (rest_touched & rest_target2)[valid],
+        'scale_pos': np.where(scaled, first_at, -1)[valid],
+        'scale_shares': scale_shares[valid],
+        'shares': shares[valid],
+    }
+
+
+def trade_parameters(config: TradeConfig) -> Dict[str, float]:
+    """simulate_trades keyword arguments taken from a TradeConfig"""
+    return {
+        'target1_multiplier': config.atr_target1_multiplier,
+        'target2_multiplier': config.atr_target2_multiplier,
+        'stop_multiplier': config.atr_stop_multiplier,
+        'stop_loss_percent': config.stop_loss_percent,
+        'account_value': config.account_value,
+        'risk_percent': config.risk_percent,
+        'scale_out_percent': config.scale_out_percent,
+        'breakeven_after_target1': config.breakeven_after_target1,
+    }
+
+
+def build_trade_table(dates: pd.DatetimeIndex, trades: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Format simulated trades as the dashboard trade table"""
+    if not len(trades['entry_pos']):
+        return pd.DataFrame()
+
+    entry_price = trades['entry_price']
+    exit_price = trades['exit_price']
+    hold_days = trades['hold_days']
+    profit_loss = exit_price - entry_price
+
+    exit_reason = np.asarray(EXIT_LABELS)[trades['exit_reason']]
+
+    return pd.DataFrame({
+        'Entry_Date': dates[trades['entry_pos']].strftime('%Y-%m-%d'),
+        'Entry_Price': np.round(entry_price, 2),
+        'Exit_Date': dates[trades['exit_pos']].strftime('%Y-%m-%d'),
+        'Exit_Price': np.round(exit_price, 2),
+        'Hold_Days': hold_days,
+        'Stop_Loss': np.round(trades['stop_loss'], 2),
+        'Target_1': np.round(trades['target1'], 2),
+        'Target_2': np.round(trades['target2'], 2),
+        'T1_Hit': np.where(trades['target1_hit'], '✅', '❌'),
+        'T2_Hit': np.where(trades['target2_hit'], '✅', '❌'),
+        'Price_Change': np.round(profit_loss, 2),
+        'Profit_Pct': np.round((profit_loss / entry_price) * 100, 2),
+        'Shares': trades['shares'],
+        'Total_Profit': np.round(profit_loss * trades['shares'], 0),
+        'Exit_Reason': exit_reason,
+        'Trade_Result': np.where(profit_loss > 0, '✅ WIN', '❌ LOSS'),
+    }, columns=TRADE_COLUMNS)
+
+
+def match_trades(signals_df: pd.DataFrame, config: Optional[TradeConfig] = None) -> pd.DataFrame:
+    """Match entry signals with exits from a signal frame and return the trade table"""
+    if signals_df.empty or not signals_df['Entry_Signal'].any():
+        return pd.DataFrame()
+
+    dates = pd.DatetimeIndex(signals_df['Date'])
+    trades = simulate_trades(
+        dates.as_unit('ns').asi8,
+        signals_df['Open'].to_numpy(dtype=np.float64),
+        signals_df['High'].to_numpy(dtype=np.float64),
+        signals_df['Low'].to_numpy(dtype=np.float64),
+        signals_df['Close'].to_numpy(dtype=np.float64),
+        signals_df['Entry_Signal'].to_numpy(dtype=bool),
+        signals_df['Exit_Signal'].to_numpy(dtype=bool),
+        signals_df['EMA_5'].to_numpy(dtype=np.float64),
+        signals_df['ATR'].to_numpy(dtype=np.float64),
+        **trade_parameters(config or TradeConfig()),
+    )
+    return build_trade_table(dates, trades)
@@ -0,0 +1,240 @@
+"""Persistent on-disk OHLCV store with incremental append"""
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Protocol, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.spans import traced
+
+DEFAULT_STORE_DIR = os.environ.get('SWING_BAR_STORE', '.bar_store')
+
+# Stored bars re-fetched on every refresh to catch a source that re-adjusted its history
+OVERLAP_BARS = 5
+# Relative price change in the overlap taken as a split or dividend adjustment
+ADJUSTMENT_TOLERANCE = 1e-5
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# How far back each yfinance-style period reaches (None = full history)
+PERIOD_OFFSETS = {
+    '1d': pd.DateOffset(days=1),
+    '5d': pd.DateOffset(days=5),
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '3y': pd.DateOffset(years=3),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10),
+    'max': None,
+}
+
+
+class BarProvider(Protocol):
+    """Source of OHLCV bars - either a trailing period or everything since start"""
+
+    def history(self, symbol: str, interval: str, period: Optional[str] = None,
+                start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        ...
+
+
+class YFinanceProvider:
+    """Bar provider backed by Yahoo Finance"""
+
+    @traced('yfinance.history')
+    def history(self, symbol: str, interval: str, period: Optional[str] = None,
+                start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+        if start is not None:
+            return ticker.history(start=start, interval=interval)
+        return ticker.history(period=period, interval=interval)
+
+
+def period_start(period: str, now: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """First timestamp covered by a trailing period ending now"""
+    offset = PERIOD_OFFSETS.get(period)
+    return None if offset is None else now - offset
+
+
+def slice_period(bars: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Copy of the bars inside a trailing period ending now"""
+    start = period_start(period, pd.Timestamp.now(tz='UTC'))
+    if bars.empty or start is None:
+        return bars.copy()
+    return bars[bars.index >= start].copy()
+
+
+def history_rewritten(stored: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """Whether fresh bars disagree with the stored bars they overlap, the last (possibly partial) one aside"""
+    if fresh is None or fresh.empty:
+        return False
+    closed = stored.iloc[:-1]
+    overlap = closed.index.intersection(fresh.index.tz_convert(closed.index.tz))
+    columns = [column for column in PRICE_COLUMNS if column in closed.columns and column in fresh.columns]
+    if overlap.empty or not columns:
+        return False
+    old = closed.loc[overlap, columns].to_numpy(dtype=np.float64)
+    new = fresh.tz_convert(closed.index.tz).loc[overlap, columns].to_numpy(dtype=np.float64)
+    return not np.allclose(old, new, rtol=ADJUSTMENT_TOLERANCE, atol=0.0, equal_nan=True)
+
+
+def merge_bars(stored: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """Append fresh bars, letting them replace stored bars with the same timestamp"""
+    if fresh is None or fresh.empty:
+        return stored
+    if stored is None or stored.empty:
+        return fresh
+    merged = pd.concat([stored, fresh.tz_convert(stored.index.tz)])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index()
+
+
+class BarStore:
+    """One memory-mapped columnar file set per (symbol, interval)
+
+    Layout per key: ``index.npy`` (int64 UTC nanoseconds), ``bars.npy`` (float64,
+    column-major so each column is contiguous on disk) and ``meta.json``.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR, provider: Optional[BarProvider] = None,
+                 min_refresh_seconds: float = 60.0):
+        self.root = Path(root)
+        self.provider = provider if provider is not None else YFinanceProvider()
+        self.min_refresh_seconds = min_refresh_seconds
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def _key_lock(self, symbol: str, interval: str) -> threading.Lock:
+        """Lock guarding one key's files, so loads of different keys never wait on each other"""
+        with self._lock:
+            return self._key_locks.setdefault((symbol, interval), threading.Lock())
+
+    def _key_dir(self, symbol: str, interval: str) -> Path:
+        safe_symbol = re.sub(r'[^A-Za-z0-9_.-]', '_', symbol)
+        return self.root / f"{safe_symbol}_{interval}"
+
+    def read(self, symbol: str, interval: str = '1d') -> Tuple[Optional[pd.DataFrame], Dict]:
+        """Read stored bars without touching the provider"""
+        key_dir = self._key_dir(symbol, interval)
+        try:
+            meta = json.loads((key_dir / 'meta.json').read_text())
+            index = np.load(key_dir / 'index.npy', mmap_mode='r')
+            bars = np.load(key_dir / 'bars.npy', mmap_mode='r')
+        except (OSError, ValueError):
+            return None, {}
+
+        # A crash between file replacements leaves mismatched lengths - treat as cold
+        if len(index) != meta.get('rows') or bars.shape != (len(index), len(meta['columns'])):
+            return None, {}
+
+        frame_index = pd.to_datetime(np.array(index), utc=True).tz_convert(meta['tz'])
+        frame = pd.DataFrame(np.array(bars), columns=meta['columns'],
+                             index=frame_index.as_unit(meta.get('unit', 'ns')))
+        frame.index.name = meta.get('index_name')
+        for column, dtype in meta['dtypes'].items():
+            if dtype != 'float64' and not frame[column].isna().any():
+                frame[column] = frame[column].astype(dtype)
+        return frame, meta
+
+    def write(self, symbol: str, interval: str, frame: pd.DataFrame, meta: Dict):
+        """Persist bars, replacing each file atomically and the metadata last"""
+        key_dir = self._key_dir(symbol, interval)
+        key_dir.mkdir(parents=True, exist_ok=True)
+
+        meta = dict(meta)
+        meta.update({
+            'rows': len(frame),
+            'columns': list(frame.columns),
+            'dtypes': {column: str(dtype) for column, dtype in frame.dtypes.items()},
+            'tz': str(frame.index.tz or 'UTC'),
+            'unit': frame.index.unit,
+            'index_name': frame.index.name,
+        })
+
+        index = frame.index if frame.index.tz is not None else frame.index.tz_localize('UTC')
+        arrays = {
+            'index.npy': index.as_unit('ns').asi8,
+            'bars.npy': np.asfortranarray(frame.to_numpy(dtype=np.float64)),
+        }
+        for name, array in arrays.items():
+            tmp_path = key_dir / f".{name}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, key_dir / name)
+
+        tmp_meta = key_dir / '.meta.json.tmp'
+        tmp_meta.write_text(json.dumps(meta))
+        os.replace(tmp_meta, key_dir / 'meta.json')
+
+    def load(self, symbol: str, interval: str = '1d', period: str = '2y',
+             force: bool = False) -> pd.DataFrame:
+        """Return bars for a trailing period, fetching only what the store is missing"""
+        return slice_period(self.load_history(symbol, interval, period, force), period)
+
+    @traced('bar_store.load_history')
+    def load_history(self, symbol: str, interval: str = '1d', period: str = '2y',
+                     force: bool = False) -> pd.DataFrame:
+        """Return everything stored for a key, making sure it covers at least period
+
+        The key's lock is held while reading and merging the stored bars,
+        never across the provider call. Each refresh re-fetches the last
+        OVERLAP_BARS stored bars; when the source has since adjusted them
+        for a split or dividend, everything stored is downloaded again.
+        """
+        lock = self._key_lock(symbol, interval)
+        now = pd.Timestamp.now(tz='UTC')
+        wanted_start = period_start(period, now)
+        with lock:
+            stored, meta = self.read(symbol, interval)
+            cold = stored is None or stored.empty or not self._covers(meta, wanted_start)
+            if not cold and not force and now.value - meta.get('fetched_at', 0) < self.min_refresh_seconds * 1e9:
+                return stored
+
+        if cold:
+            # Cold start or a longer period than we hold - download the full period
+            fresh = self.provider.history(symbol, interval, period=period)
+            if fresh is None or fresh.empty:
+                return pd.DataFrame()
+        else:
+            # Re-fetch a few stored bars too, so a partial bar gets completed and adjustments show up
+            fresh = self.provider.history(symbol, interval, start=stored.index[-min(OVERLAP_BARS, len(stored))])
+            if history_rewritten(stored, fresh):
+                history_start = meta.get('history_start')
+                if history_start is None:
+                    fresh = self.provider.history(symbol, interval, period='max')
+                else:
+                    fresh = self.provider.history(symbol, interval, start=pd.Timestamp(history_start, tz='UTC'))
+                if fresh is None or fresh.empty:
+                    return pd.DataFrame()
+                with lock:
+                    # The stored prices are stale, so nothing of them is kept
+                    meta = {'history_start': history_start, 'fetched_at': now.value}
+                    self.write(symbol, interval, fresh, meta)
+                    return fresh
+
+        with lock:
+            # Another load may have written the key during the fetch - merge into what is stored now
+            current, current_meta = self.read(symbol, interval)
+            if current is None:
+                current, current_meta = stored, meta
+            if cold and (current is None or not self._covers(current_meta, wanted_start)):
+                current_meta = {'history_start': None if wanted_start is None else wanted_start.value}
+            bars = merge_bars(current, fresh)
+            meta = dict(current_meta, fetched_at=now.value)
+            self.write(symbol, interval, bars, meta)
+            return bars
+
+    @staticmethod
+    def _covers(meta: Dict, start: Optional[pd.Timestamp]) -> bool:
+        """Whether stored history reaches back to start (None = full history)"""
+        history_start = meta.get('history_start')
+        if history_start is None:
+            return True
+        return start is not None and history_start <= start.value
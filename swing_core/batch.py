@@ -0,0 +1,185 @@
+"""Multi-symbol, multi-config backtests over a process pool for nightly batch runs"""
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.backtest import TRADE_COLUMNS, build_trade_table
+from swing_core.bar_store import slice_period
+from swing_core.config import TradeConfig
+from swing_core.optimizer import (
+    BAR_COLUMNS,
+    METRIC_COLUMNS,
+    config_trades,
+    indicator_columns,
+    indicator_key,
+    summarize_trades,
+)
+from swing_core.shared import SharedArrays, process_pool, worker_arrays
+from swing_core.signals import WARMUP_BARS, align_vix
+
+# (symbol row, first bar, end bar, config indices) - one unit of pool work
+Task = Tuple[int, int, int, List[int]]
+
+# progress(done, total, symbol) after every finished task
+Progress = Callable[[int, int, str], None]
+
+
+@dataclass
+class BatchResult:
+    """Every trade and one summary row per (symbol, config)"""
+    trades: pd.DataFrame
+    summary: pd.DataFrame
+
+
+def load_universe(store, symbols: Sequence[str], period: str = '2y', interval: str = '1d',
+                  max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+    """Full stored history per symbol, fetched concurrently, skipping symbols that fail
+
+    The dashboard computes indicators over everything stored before cutting
+    to data_period, so the batch run starts from the same bars.
+    """
+    def load(symbol):
+        try:
+            return symbol, store.load_history(symbol, interval=interval, period=period)
+        except Exception:
+            return symbol, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(load, symbols)
+    return {symbol: frame for symbol, frame in results if frame is not None and not frame.empty}
+
+
+def _in_tz(value, tz) -> pd.Timestamp:
+    """A date in the bars' time zone: naive values are taken as wall-clock time there"""
+    ts = pd.Timestamp(value)
+    return ts.tz_convert(tz) if ts.tzinfo is not None else ts.tz_localize(tz)
+
+
+def window_bounds(history: pd.DataFrame, period: str, start=None, end=None) -> Tuple[int, int]:
+    """Positions [lo, hi) of the bars inside period and the optional start/end dates"""
+    index = slice_period(history, period).index
+    if start is not None:
+        index = index[index >= _in_tz(start, index.tz)]
+    if end is not None:
+        # An end date includes that whole session
+        index = index[index < _in_tz(end, index.tz) + pd.Timedelta(days=1)]
+    if index.empty:
+        return 0, 0
+    lo = history.index.get_loc(index[0])
+    return lo, lo + len(index)
+
+
+def evaluate_window(dates_ns: np.ndarray, bars: Dict[str, np.ndarray], vix: np.ndarray, lo: int, hi: int,
+                    configs: Sequence[TradeConfig]) -> List[Dict[str, np.ndarray]]:
+    """Trades for configs sharing one indicator setting, over bars[lo:hi] with indicators warmed on bars[:hi]"""
+    columns = indicator_columns({name: values[:hi] for name, values in bars.items()}, configs[0])
+    columns = {name: values[lo:] for name, values in columns.items()}
+    return [config_trades(dates_ns[lo:hi], columns, vix[lo:hi], config) for config in configs]
+
+
+def _evaluate_shared(symbol_row: int, lo: int, hi: int,
+                     configs: Sequence[TradeConfig]) -> List[Dict[str, np.ndarray]]:
+    arrays = worker_arrays()
+    bars = {name: arrays[f'{symbol_row}/{name}'] for name in BAR_COLUMNS}
+    return evaluate_window(arrays[f'{symbol_row}/dates'], bars, arrays[f'{symbol_row}/vix'], lo, hi, configs)
+
+
+def run_batch(histories: Dict[str, pd.DataFrame], configs: Sequence[TradeConfig], period: str = '2y',
+              start=None, end=None, vix: Optional[pd.Series] = None, max_workers: Optional[int] = None,
+              chunk_size: int = 64, progress: Optional[Progress] = None) -> BatchResult:
+    """Backtest every config on every symbol's history
+
+    Signals and trades come from the same code as the dashboard's signal
+    history, so a symbol/config pair with the dashboard's data_period gives
+    the dashboard's trade table. Symbols are spread across the pool as
+    (symbol, indicator setting) tasks; bars are shared, not pickled.
+    """
+    configs = list(configs)
+    symbols = list(histories)
+    tasks: List[Task] = []
+    order = sorted(range(len(configs)), key=lambda i: indicator_key(configs[i]))
+    for row, symbol in enumerate(symbols):
+        lo, hi = window_bounds(histories[symbol], period, start, end)
+        if hi - lo <= WARMUP_BARS:
+            continue
+        for _, group in itertools.groupby(order, key=lambda i: indicator_key(configs[i])):
+            group = list(group)
+            tasks.extend((row, lo, hi, group[i:i + chunk_size]) for i in range(0, len(group), chunk_size))
+
+    arrays = {}
+    for row, symbol in enumerate(symbols):
+        history = histories[symbol]
+        arrays[f'{row}/dates'] = history.index.as_unit('ns').asi8
+        arrays[f'{row}/vix'] = align_vix(history.index, vix)
+        arrays.update({f'{row}/{name}': history[name].to_numpy(dtype=np.float64) for name in BAR_COLUMNS})
+
+    results: Dict[int, List[Dict[str, np.ndarray]]] = {}
+
+    def finished(task_id: int, trades: List[Dict[str, np.ndarray]]):
+        results[task_id] = trades
+        if progress is not None:
+            progress(len(results), len(tasks), symbols[tasks[task_id][0]])
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) <= 1:
+        for task_id, (row, lo, hi, group) in enumerate(tasks):
+            bars = {name: arrays[f'{row}/{name}'] for name in BAR_COLUMNS}
+            finished(task_id, evaluate_window(arrays[f'{row}/dates'], bars, arrays[f'{row}/vix'], lo, hi,
+                                              [configs[i] for i in group]))
+    else:
+        shared = SharedArrays(arrays)
+        try:
+            with process_pool(shared, min(max_workers, len(tasks)), __name__) as pool:
+                futures = {
+                    pool.submit(_evaluate_shared, row, lo, hi, [configs[i] for i in group]): task_id
+                    for task_id, (row, lo, hi, group) in enumerate(tasks)
+                }
+                for future in as_completed(futures):
+                    finished(futures[future], future.result())
+        finally:
+            shared.close()
+
+    trade_tables, summary_rows = [], []
+    for task_id, (row, lo, hi, group) in enumerate(tasks):
+        symbol = symbols[row]
+        # Trade positions count from the first bar after warmup, like the dashboard table
+        dates = histories[symbol].index[lo + WARMUP_BARS:hi]
+        for config_id, trades in zip(group, results[task_id]):
+            summary_rows.append({'Symbol': symbol, 'Config': config_id, **summarize_trades(trades)})
+            table = build_trade_table(dates, trades)
+            if not table.empty:
+                table.insert(0, 'Config', config_id)
+                table.insert(0, 'Symbol', symbol)
+                trade_tables.append(table)
+
+    trades = (pd.concat(trade_tables, ignore_index=True) if trade_tables
+              else pd.DataFrame(columns=['Symbol', 'Config'] + TRADE_COLUMNS))
+    if trade_tables:
+        trades = trades.sort_values(['Symbol', 'Config'], kind='stable').reset_index(drop=True)
+
+    # Only report the parameters that actually vary across the configs
+    params = pd.DataFrame([vars(config) for config in configs])
+    varying = [column for column in params.columns if params[column].nunique() > 1]
+    summary = pd.DataFrame(summary_rows, columns=['Symbol', 'Config'] + METRIC_COLUMNS)
+    summary = summary.join(params[varying], on='Config')
+    summary = summary.sort_values(['Symbol', 'Config']).reset_index(drop=True)
+    return BatchResult(trades, summary)
+
+
+def write_results(result: BatchResult, out_dir: str, fmt: str = 'csv') -> List[str]:
+    """Write trades and summary as CSV or Parquet, returning the paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, frame in (('trades', result.trades), ('summary', result.summary)):
+        path = os.path.join(out_dir, f'{name}.{fmt}')
+        if fmt == 'parquet':
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
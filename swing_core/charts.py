@@ -0,0 +1,446 @@
+"""Plotly figure builders for the dashboard, with a figure cache that patches new bars in"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from swing_core.config import TradeConfig
+from swing_core.downsample import downsample_lines, ohlc_buckets
+from swing_core.spans import traced
+
+EMA_STYLES = [
+    ('EMA_5', '#ff6b6b', 3),
+    ('EMA_10', '#4ecdc4', 2),
+    ('EMA_21', '#45b7d1', 2),
+    ('EMA_50', '#96ceb4', 3),
+]
+
+# Every column drawn on the price chart, in the order the last bar is compared
+CHART_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Volume_Avg', 'ATR'] + [ema for ema, _, _ in EMA_STYLES]
+
+
+def chart_dates(index: pd.DatetimeIndex) -> np.ndarray:
+    """Wall-clock datetime64 x values
+
+    plotly.js ignores UTC offsets, and tz-aware indexes go through one
+    Timestamp object per point on every build and serialization.
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy()
+
+
+# Volume bars are colored by a numeric direction code through a three-step
+# colorscale: 0 = first bar (gray), 1 = down or flat, 2 = up
+VOLUME_COLORSCALE = [[0.0, '#808080'], [0.5, '#ff4757'], [1.0, '#00ff88']]
+
+
+def volume_direction(close: np.ndarray) -> np.ndarray:
+    """Direction code of every bar versus the previous close, in one comparison"""
+    direction = np.zeros(len(close), dtype=np.int8)
+    direction[1:] = np.where(close[1:] > close[:-1], 2, 1)
+    return direction
+
+
+def price_trace_arrays(data: pd.DataFrame, max_points: Optional[int] = None) -> List[Dict]:
+    """Data arrays of every price-chart trace, in the order the traces are added
+
+    Past max_points, candles and volume are merged into OHLC buckets and
+    every line keeps its own LTTB selection of points.
+    """
+    line_columns = [ema for ema, _, _ in EMA_STYLES] + ['Volume_Avg', 'ATR']
+    if max_points and len(data) > max_points:
+        bars = ohlc_buckets(data, max_points)
+        lines = downsample_lines(data, line_columns, max_points)
+    else:
+        bars = data
+        lines = {column: data[column] for column in line_columns}
+
+    x = chart_dates(bars.index)
+    colors = volume_direction(bars['Close'].to_numpy())
+    arrays = [dict(x=x, open=bars['Open'], high=bars['High'], low=bars['Low'], close=bars['Close'])]
+    arrays.extend(dict(x=chart_dates(lines[ema].index), y=lines[ema]) for ema, _, _ in EMA_STYLES)
+    arrays.append(dict(x=x, y=bars['Volume'], marker=dict(color=colors)))
+    for column in ('Volume_Avg', 'ATR'):
+        arrays.append(dict(x=chart_dates(lines[column].index), y=lines[column]))
+    return arrays
+
+
+class InteractiveCharts:
+    """Enhanced chart creation with interactive features"""
+
+    @staticmethod
+    @traced('chart.price_build')
+    def create_enhanced_price_chart(data: pd.DataFrame, signals: Dict, config: TradeConfig) -> go.Figure:
+        """Create an enhanced interactive price chart"""
+        candles, *emas, volume, volume_avg, atr = price_trace_arrays(data, config.chart_max_points)
+
+        # Create subplots with custom spacing
+        fig = make_subplots(
+            rows=3, cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.02,
+            subplot_titles=(f'{config.symbol} Price with EMAs & Signals', 'Volume Analysis', 'Technical Indicators'),
+            row_heights=[0.6, 0.25, 0.15]
+        )
+
+        # Candlestick chart with enhanced styling
+        fig.add_trace(
+            go.Candlestick(
+                **candles,
+                name=f'{config.symbol} Price',
+                increasing_line_color='#00ff88',
+                decreasing_line_color='#ff4757',
+                increasing_fillcolor='rgba(0, 255, 136, 0.3)',
+                decreasing_fillcolor='rgba(255, 71, 87, 0.3)'
+            ),
+            row=1, col=1
+        )
+
+        # Enhanced EMAs with custom styling
+        for (ema, color, width), arrays in zip(EMA_STYLES, emas):
+            fig.add_trace(
+                go.Scatter(
+                    **arrays,
+                    mode='lines',
+                    name=ema,
+                    line=dict(color=color, width=width),
+                    opacity=0.8
+                ),
+                row=1, col=1
+            )
+
+        # Entry level with interactive annotation
+        if 'entry_level' in signals:
+            fig.add_hline(
+                y=signals['entry_level'],
+                line_dash="dash",
+                line_color="#feca57",
+                line_width=2,
+                annotation_text="Entry Zone",
+                annotation_position="right",
+                row=1, col=1
+            )
+
+        # Volume analysis with color coding
+        fig.add_trace(
+            go.Bar(
+                **volume,
+                name='Volume',
+                marker_colorscale=VOLUME_COLORSCALE,
+                marker_cmin=0,
+                marker_cmax=2,
+                opacity=0.7
+            ),
+            row=2, col=1
+        )
+
+        # Volume average line
+        fig.add_trace(
+            go.Scatter(
+                **volume_avg,
+                mode='lines',
+                name='Volume Average',
+                line=dict(color='#ffa502', width=2)
+            ),
+            row=2, col=1
+        )
+
+        # ATR indicator
+        fig.add_trace(
+            go.Scatter(
+                **atr,
+                mode='lines',
+                name='ATR',
+                line=dict(color='#a55eea', width=2),
+                fill='tonexty',
+                fillcolor='rgba(165, 94, 234, 0.1)'
+            ),
+            row=3, col=1
+        )
+
+        # Enhanced layout with dark theme
+        fig.update_layout(
+            title={
+                'text': f"🚀 Interactive {config.symbol} Analysis Dashboard",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 24, 'color': '#2c3e50'}
+            },
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            height=900,
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            ),
+            hovermode='x unified',
+            dragmode='zoom'
+        )
+
+        # Enhanced interactivity
+        fig.update_xaxes(
+            showspikes=True,
+            spikecolor="white",
+            spikesnap="cursor",
+            spikemode="across",
+            rangeslider_visible=False
+        )
+
+        fig.update_yaxes(
+            showspikes=True,
+            spikecolor="white",
+            spikesnap="cursor",
+            spikemode="across"
+        )
+
+        # Add range selector buttons
+        fig.update_layout(
+            xaxis=dict(
+                rangeselector=dict(
+                    buttons=list([
+                        dict(count=1, label="1D", step="day", stepmode="backward"),
+                        dict(count=5, label="5D", step="day", stepmode="backward"),
+                        dict(count=1, label="1M", step="month", stepmode="backward"),
+                        dict(count=3, label="3M", step="month", stepmode="backward"),
+                        dict(count=6, label="6M", step="month", stepmode="backward"),
+                        dict(step="all")
+                    ])
+                ),
+                rangeslider=dict(visible=False),
+                type="date"
+            )
+        )
+
+        return fig
+
+    @staticmethod
+    def create_risk_reward_chart(entry_price: float, stop_loss: float, target1: float, target2: float) -> go.Figure:
+        """Create interactive risk/reward visualization"""
+
+        levels = ['Stop Loss', 'Entry', 'Target 1', 'Target 2']
+        prices = [stop_loss, entry_price, target1, target2]
+        colors = ['#ff4757', '#74b9ff', '#00b894', '#fdcb6e']
+
+        fig = go.Figure()
+
+        # Add horizontal lines for each level
+        for i, (level, price, color) in enumerate(zip(levels, prices, colors)):
+            fig.add_hline(
+                y=price,
+                line_color=color,
+                line_width=3,
+                annotation_text=f"{level}: ${price:.2f}",
+                annotation_position="right"
+            )
+
+        # Add risk/reward zones
+        fig.add_shape(
+            type="rect",
+            x0=0, x1=1, y0=stop_loss, y1=entry_price,
+            fillcolor="rgba(255, 71, 87, 0.2)",
+            line=dict(width=0),
+            name="Risk Zone"
+        )
+
+        fig.add_shape(
+            type="rect",
+            x0=0, x1=1, y0=entry_price, y1=target2,
+            fillcolor="rgba(0, 184, 148, 0.2)",
+            line=dict(width=0),
+            name="Reward Zone"
+        )
+
+        fig.update_layout(
+            title="Risk/Reward Analysis",
+            yaxis_title="Price ($)",
+            height=400,
+            showlegend=False,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+
+        fig.update_xaxes(visible=False)
+
+        return fig
+
+    @staticmethod
+    @traced('chart.trade_build')
+    def create_trade_chart(signals_df: pd.DataFrame, trades_df: pd.DataFrame, symbol: str) -> go.Figure:
+        """Price line with entry/exit markers and a connector per trade"""
+        fig = go.Figure()
+
+        # Add price line
+        fig.add_trace(go.Scatter(
+            x=chart_dates(pd.DatetimeIndex(signals_df['Date'])),
+            y=signals_df['Close'],
+            mode='lines',
+            name=f'{symbol} Price',
+            line=dict(color='#74b9ff', width=2)
+        ))
+
+        entry_dates = pd.to_datetime(trades_df['Entry_Date']).to_numpy()
+        exit_dates = pd.to_datetime(trades_df['Exit_Date']).to_numpy()
+
+        # Add entry points
+        fig.add_trace(go.Scatter(
+            x=entry_dates,
+            y=trades_df['Entry_Price'],
+            mode='markers',
+            name='Entry Points',
+            marker=dict(
+                color='#00b894',
+                size=10,
+                symbol='triangle-up',
+                line=dict(width=2, color='white')
+            ),
+            hovertemplate='<b>Entry</b><br>Date: %{x}<br>Price: $%{y:.2f}<extra></extra>'
+        ))
+
+        # Add exit points
+        fig.add_trace(go.Scatter(
+            x=exit_dates,
+            y=trades_df['Exit_Price'],
+            mode='markers',
+            name='Exit Points',
+            marker=dict(
+                color='#e17055',
+                size=10,
+                symbol='triangle-down',
+                line=dict(width=2, color='white')
+            ),
+            hovertemplate='<b>Exit</b><br>Date: %{x}<br>Price: $%{y:.2f}<extra></extra>'
+        ))
+
+        # Connect entry/exit pairs with lines - one trace per color, segments split by NaN gaps
+        winners = trades_df['Profit_Pct'].to_numpy() > 0
+        for won, color in ((True, '#00b894'), (False, '#e17055')):
+            x, y = trade_connectors(entry_dates, exit_dates, trades_df['Entry_Price'].to_numpy(),
+                                    trades_df['Exit_Price'].to_numpy(), winners == won)
+            if len(x):
+                fig.add_trace(go.Scatter(
+                    x=x,
+                    y=y,
+                    mode='lines',
+                    line=dict(color=color, width=2, dash='dot'),
+                    showlegend=False,
+                    hoverinfo='skip'
+                ))
+
+        fig.update_layout(
+            title="Swing Trading Entry/Exit Points with P&L",
+            xaxis_title="Date",
+            yaxis_title="Price ($)",
+            height=600,
+            hovermode='x unified'
+        )
+
+        return fig
+
+
+def trade_connectors(entry_dates: np.ndarray, exit_dates: np.ndarray, entry_prices: np.ndarray,
+                     exit_prices: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Entry->exit segments of the masked trades as one polyline broken by NaN points"""
+    n = int(mask.sum())
+    x = np.empty(3 * n, dtype=entry_dates.dtype)
+    y = np.full(3 * n, np.nan)
+    x[0::3], y[0::3] = entry_dates[mask], entry_prices[mask]
+    x[1::3], y[1::3] = exit_dates[mask], exit_prices[mask]
+    # The gap point reuses the exit date so the x axis never sees a NaT
+    x[2::3] = exit_dates[mask]
+    return x, y
+
+
+@dataclass
+class _CachedFigure:
+    figure: go.Figure
+    index: pd.DatetimeIndex
+    last_bar: np.ndarray
+    entry_level: Optional[float]
+
+
+class FigureCache:
+    """Price charts keyed by (symbol, last bar, chart_period, indicator config, point cap)
+
+    A rerun on unchanged bars returns the cached figure as is. When bars are
+    appended, or the forming last bar ticks, the cached figure's trace arrays
+    are patched in place instead of rebuilding subplots, traces and layout.
+    Bars before the cached last one are treated as final, as in the bar store.
+    """
+
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Tuple, _CachedFigure]' = OrderedDict()
+        self.last_action = None
+
+    @staticmethod
+    def key(config: TradeConfig) -> Tuple:
+        return (config.symbol, config.chart_period, config.ema_periods, config.atr_period, config.volume_period,
+                config.chart_max_points)
+
+    @traced('chart.price')
+    def price_chart(self, data: pd.DataFrame, signals: Dict, config: TradeConfig) -> go.Figure:
+        """Cached create_enhanced_price_chart"""
+        key = self.key(config)
+        entry = self._entries.get(key)
+        entry_level = signals.get('entry_level')
+        last_bar = data[CHART_COLUMNS].to_numpy()[-1]
+
+        if entry is None or (entry.entry_level is None) != (entry_level is None):
+            self.last_action = 'build'
+            entry = self._build(data, signals, config)
+        elif len(entry.index) == len(data) and entry.index[-1] == data.index[-1] \
+                and entry.index[0] == data.index[0] and np.array_equal(entry.last_bar, last_bar, equal_nan=True):
+            self.last_action = 'hit'
+        elif not self._patch(entry, data, config.chart_max_points):
+            self.last_action = 'build'
+            entry = self._build(data, signals, config)
+        else:
+            self.last_action = 'patch'
+
+        entry.last_bar = last_bar
+        if entry_level is not None and entry_level != entry.entry_level:
+            self._move_entry_level(entry.figure, entry_level)
+        entry.entry_level = entry_level
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry.figure
+
+    @staticmethod
+    def _build(data: pd.DataFrame, signals: Dict, config: TradeConfig) -> _CachedFigure:
+        figure = InteractiveCharts.create_enhanced_price_chart(data, signals, config)
+        return _CachedFigure(figure, data.index, data[CHART_COLUMNS].to_numpy()[-1], signals.get('entry_level'))
+
+    @staticmethod
+    def _patch(entry: _CachedFigure, data: pd.DataFrame, max_points: int) -> bool:
+        """Patch appended bars into the cached figure, False if the bars don't extend it"""
+        cached = entry.index
+        # Position of the cached last bar in the new data - it may have been updated
+        pos = data.index.searchsorted(cached[-1])
+        drop = len(cached) - 1 - pos
+        if pos >= len(data) or data.index[pos] != cached[-1] or drop < 0 \
+                or not data.index[:pos].equals(cached[drop:-1]):
+            return False
+
+        with entry.figure.batch_update():
+            for trace, arrays in zip(entry.figure.data, price_trace_arrays(data, max_points)):
+                trace.update(arrays)
+        entry.index = data.index
+        return True
+
+    @staticmethod
+    def _move_entry_level(figure: go.Figure, entry_level: float):
+        # add_hline appends the entry line after the subplot titles
+        figure.layout.shapes[-1].update(y0=entry_level, y1=entry_level)
+        figure.layout.annotations[-1].y = entry_level
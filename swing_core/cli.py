@@ -0,0 +1,290 @@
+"""Headless scans and backtests from the command line
+
+    python -m swing_core scan QQQ SPY NVDA --period 1y
+    python -m swing_core backtest QQQ --period 5y --csv trades.csv
+    python -m swing_core batch QQQ SPY NVDA --grid atr_entry_multiplier=1.0,1.5,2.0 --out results
+    python -m swing_core portfolio QQQ SPY NVDA --max-positions 2 --period 5y
+    python -m swing_core journal export trades.csv --start 2020-01-01
+
+Bars come from the same on-disk bar store as the dashboard. Heavy
+modules are imported inside each command, so --help and argument errors
+return without loading pandas.
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+VIX_SYMBOL = '^VIX'
+
+
+def load_vix(store, period: str):
+    """Daily VIX closes, or None when they can't be fetched"""
+    try:
+        vix = store.load_history(VIX_SYMBOL, interval='1d', period=period)
+    except Exception as exc:
+        print(f'VIX unavailable ({exc}), treating it as below the threshold', file=sys.stderr)
+        return None
+    return None if vix.empty else vix['Close']
+
+
+def open_store(args):
+    from swing_core.bar_store import BarStore
+    return BarStore(args.store) if args.store else BarStore()
+
+
+def run_scan(args) -> int:
+    import pandas as pd
+
+    from swing_core.scanner import scan_watchlist
+
+    store = open_store(args)
+    vix = load_vix(store, args.period)
+    vix_value = float(vix.iloc[-1]) if vix is not None else 0.0
+    ranked = scan_watchlist(store, args.symbols, vix_value, period=args.period, vix_threshold=args.vix_threshold)
+    if ranked.empty:
+        print('No symbols with enough data')
+        return 1
+    if args.signals_only:
+        ranked = ranked[ranked['Signal'] != '']
+    if args.csv:
+        ranked.to_csv(args.csv, index=False)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(ranked.to_string(index=False))
+    return 0
+
+
+def run_backtest(args) -> int:
+    from swing_core.batch import load_universe, run_batch as backtest_universe
+    from swing_core.config import TradeConfig
+
+    config = TradeConfig(symbol=args.symbol.upper(), data_period=args.period, vix_threshold=args.vix_threshold,
+                         account_value=args.account_value, risk_percent=args.risk_percent)
+    store = open_store(args)
+    histories = load_universe(store, [config.symbol], period=config.data_period)
+    if not histories:
+        print(f'No data for {config.symbol}')
+        return 1
+
+    result = backtest_universe(histories, [config], period=config.data_period,
+                               vix=load_vix(store, config.data_period), max_workers=1)
+    trades = result.trades.drop(columns=['Symbol', 'Config'])
+    if trades.empty:
+        print(f'{config.symbol}: no completed trades over {config.data_period}')
+        return 0
+    if args.csv:
+        trades.to_csv(args.csv, index=False)
+
+    wins = trades['Profit_Pct'] > 0
+    print(f'{config.symbol} {config.data_period}: {len(trades)} trades, '
+          f'win rate {wins.mean() * 100:.1f}%, total P&L ${trades["Total_Profit"].sum():,.0f}')
+    print(f'Avg win {trades.loc[wins, "Profit_Pct"].mean():.2f}% | '
+          f'Avg loss {trades.loc[~wins, "Profit_Pct"].mean():.2f}% | '
+          f'Avg hold {trades["Hold_Days"].mean():.1f} days')
+    return 0
+
+
+def read_symbols(args) -> List[str]:
+    """Symbols from the command line and --symbols-file, upper-cased and deduplicated"""
+    symbols = list(args.symbols)
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            symbols += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    return list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+
+def load_histories(store, symbols: List[str], period: str) -> dict:
+    from swing_core.batch import load_universe
+
+    histories = load_universe(store, symbols, period=period)
+    missing = [symbol for symbol in symbols if symbol not in histories]
+    if missing:
+        print(f"No data for {', '.join(missing)}", file=sys.stderr)
+    return histories
+
+
+def parse_grid(specs: List[str]) -> Dict[str, list]:
+    """field=v1,v2,... pairs into grid values typed like the TradeConfig defaults"""
+    from swing_core.config import TradeConfig
+
+    defaults = vars(TradeConfig())
+    grid = {}
+    for spec in specs:
+        field, _, values = spec.partition('=')
+        if field not in defaults or not values:
+            raise ValueError(f'expected <TradeConfig field>=v1,v2,... got {spec!r}')
+        if isinstance(defaults[field], bool):
+            grid[field] = [value.lower() in ('1', 'true', 'yes') for value in values.split(',')]
+        else:
+            grid[field] = [type(defaults[field])(value) for value in values.split(',')]
+    return grid
+
+
+def batch_configs(args) -> list:
+    """Config variants from --configs (a JSON list of overrides) times the --grid product"""
+    from dataclasses import replace
+
+    from swing_core.config import TradeConfig
+    from swing_core.optimizer import grid_configs
+
+    base = TradeConfig(account_value=args.account_value, risk_percent=args.risk_percent)
+    variants = [base]
+    if args.configs:
+        with open(args.configs) as f:
+            variants = [replace(base, **overrides) for overrides in json.load(f)]
+    grid = parse_grid(args.grid or [])
+    return [config for variant in variants for config in grid_configs(variant, grid)] if grid else variants
+
+
+def run_batch(args) -> int:
+    from swing_core.batch import run_batch as backtest_universe, write_results
+
+    if args.format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print('Parquet output needs pyarrow (pip install pyarrow), or use --format csv', file=sys.stderr)
+            return 2
+    try:
+        configs = batch_configs(args)
+    except (ValueError, TypeError) as exc:
+        print(f'Bad config: {exc}', file=sys.stderr)
+        return 2
+
+    symbols = read_symbols(args)
+    if not symbols:
+        print('No symbols given', file=sys.stderr)
+        return 2
+
+    store = open_store(args)
+    histories = load_histories(store, symbols, args.period)
+    vix = load_vix(store, args.period)
+    print(f'{len(histories)} symbols x {len(configs)} configs', file=sys.stderr)
+
+    def progress(done, total, symbol):
+        print(f'[{done}/{total}] {symbol}', file=sys.stderr, flush=True)
+
+    result = backtest_universe(histories, configs, period=args.period, start=args.start, end=args.end, vix=vix,
+                               max_workers=args.workers, progress=progress)
+    for path in write_results(result, args.out, args.format):
+        print(path)
+    return 0 if histories else 1
+
+
+def run_portfolio(args) -> int:
+    import pandas as pd
+
+    from swing_core.config import TradeConfig
+    from swing_core.portfolio import run_portfolio as backtest_portfolio
+
+    symbols = read_symbols(args)
+    if not symbols:
+        print('No symbols given', file=sys.stderr)
+        return 2
+    config = TradeConfig(data_period=args.period, vix_threshold=args.vix_threshold,
+                         account_value=args.account_value, risk_percent=args.risk_percent,
+                         max_positions=args.max_positions, daily_loss_limit=args.daily_loss_limit)
+    store = open_store(args)
+    histories = load_histories(store, symbols, args.period)
+    if not histories:
+        return 1
+
+    result = backtest_portfolio(histories, config, period=args.period, start=args.start, end=args.end,
+                                vix=load_vix(store, args.period))
+    if args.csv and not result.trades.empty:
+        result.trades.to_csv(args.csv, index=False)
+
+    summary = result.summary
+    print(f"{len(histories)} symbols: {summary['Trades']} of {summary['Candidates']} signals taken, "
+          f"final equity ${summary['Final_Equity']:,.0f} ({summary['Return_Pct']:+.1f}%), "
+          f"max drawdown {summary['Max_Drawdown_Pct']:.1f}%")
+    print('Skipped: ' + ', '.join(f'{reason} {count}' for reason, count in result.skipped.items()))
+    if not result.trades.empty:
+        by_symbol = result.trades.groupby('Symbol')['Total_Profit'].agg(['count', 'sum'])
+        with pd.option_context('display.width', 200):
+            print(by_symbol.rename(columns={'count': 'Trades', 'sum': 'Total_Profit'}).to_string())
+    return 0
+
+
+def run_journal(args) -> int:
+    from swing_core.journal import TradeJournal
+
+    journal = TradeJournal(args.journal) if args.journal else TradeJournal()
+    if args.action == 'import':
+        print(f'Imported {journal.import_csv(args.path, keep_ids=args.keep_ids):,} trades')
+        return 0
+    active = {'active': True, 'closed': False}.get(args.status)
+    count = journal.export_csv(args.path, symbol=args.symbol and args.symbol.upper(), active=active,
+                               start=args.start, end=args.end)
+    print(f'Exported {count:,} trades to {args.path}')
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m swing_core', description=__doc__.splitlines()[0])
+    parser.add_argument('--store', help='bar store directory (default: $SWING_BAR_STORE or .bar_store)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan = commands.add_parser('scan', help='rank a watchlist by signal strength on the latest bar')
+    scan.add_argument('symbols', nargs='+')
+    scan.add_argument('--period', default='2y')
+    scan.add_argument('--vix-threshold', type=float, default=30.0)
+    scan.add_argument('--signals-only', action='store_true', help='only list symbols with an entry signal')
+    scan.add_argument('--csv', help='also write the table to this file')
+    scan.set_defaults(handler=run_scan)
+
+    backtest = commands.add_parser('backtest', help='historical signals and trades for one symbol')
+    backtest.add_argument('symbol')
+    backtest.add_argument('--period', default='2y')
+    backtest.add_argument('--vix-threshold', type=float, default=30.0)
+    backtest.add_argument('--account-value', type=float, default=100000.0)
+    backtest.add_argument('--risk-percent', type=float, default=1.0)
+    backtest.add_argument('--csv', help='write the trade table to this file')
+    backtest.set_defaults(handler=run_backtest)
+
+    batch = commands.add_parser('batch', help='every config variant on every symbol over a process pool')
+    batch.add_argument('symbols', nargs='*')
+    batch.add_argument('--symbols-file', help='one symbol per line, # comments allowed')
+    batch.add_argument('--period', default='2y', help='history the indicators and trades run over')
+    batch.add_argument('--start', help='first date traded (YYYY-MM-DD)')
+    batch.add_argument('--end', help='last date traded (YYYY-MM-DD)')
+    batch.add_argument('--grid', action='append', metavar='FIELD=V1,V2',
+                       help='TradeConfig values to sweep, repeatable; variants are the product')
+    batch.add_argument('--configs', help='JSON list of TradeConfig overrides, one variant each')
+    batch.add_argument('--account-value', type=float, default=100000.0)
+    batch.add_argument('--risk-percent', type=float, default=1.0)
+    batch.add_argument('--workers', type=int, help='pool size (default: CPU count, 1 = in-process)')
+    batch.add_argument('--out', default='batch_results', help='output directory')
+    batch.add_argument('--format', choices=('csv', 'parquet'), default='csv')
+    batch.set_defaults(handler=run_batch)
+
+    portfolio = commands.add_parser('portfolio', help='one account trading every symbol under the portfolio limits')
+    portfolio.add_argument('symbols', nargs='*')
+    portfolio.add_argument('--symbols-file', help='one symbol per line, # comments allowed')
+    portfolio.add_argument('--period', default='2y')
+    portfolio.add_argument('--start', help='first date traded (YYYY-MM-DD)')
+    portfolio.add_argument('--end', help='last date traded (YYYY-MM-DD)')
+    portfolio.add_argument('--vix-threshold', type=float, default=30.0)
+    portfolio.add_argument('--account-value', type=float, default=100000.0)
+    portfolio.add_argument('--risk-percent', type=float, default=1.0)
+    portfolio.add_argument('--max-positions', type=int, default=3)
+    portfolio.add_argument('--daily-loss-limit', type=float, default=3.0, help='percent of equity, 0 = off')
+    portfolio.add_argument('--csv', help='write the taken trades to this file')
+    portfolio.set_defaults(handler=run_portfolio)
+
+    journal = commands.add_parser('journal', help='export or import the trade journal as CSV')
+    journal.add_argument('action', choices=('export', 'import'))
+    journal.add_argument('path', help='CSV file to write or read')
+    journal.add_argument('--journal', help='journal database (default: $SWING_JOURNAL or .trade_journal.db)')
+    journal.add_argument('--symbol', help='export: only this symbol')
+    journal.add_argument('--start', help='export: first entry date (YYYY-MM-DD)')
+    journal.add_argument('--end', help='export: last entry date (YYYY-MM-DD)')
+    journal.add_argument('--status', choices=('all', 'active', 'closed'), default='all', help='export: which trades')
+    journal.add_argument('--keep-ids', action='store_true', help='import: restore ids, replacing rows that have them')
+    journal.set_defaults(handler=run_journal)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
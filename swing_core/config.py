@@ -0,0 +1,52 @@
+"""Strategy and dashboard configuration"""
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass
+class TradeConfig:
+    """Enhanced configuration with interactive features"""
+    # Technical Analysis
+    ema_5_period: int = 5
+    ema_10_period: int = 10
+    ema_21_period: int = 21
+    ema_50_period: int = 50
+    atr_period: int = 14
+    volume_period: int = 20
+    
+    # Entry/Exit Criteria
+    atr_entry_multiplier: float = 1.5
+    atr_target1_multiplier: float = 2.0
+    atr_target2_multiplier: float = 3.0
+    atr_stop_multiplier: float = 2.0
+    
+    # Risk Management
+    risk_percent: float = 1.0
+    max_positions: int = 3
+    daily_loss_limit: float = 3.0
+    vix_threshold: float = 30.0
+    account_value: float = 100000.0
+    stop_loss_percent: float = 2.0
+    scale_out_percent: float = 50.0  # Sold at Target 1
+    breakeven_after_target1: bool = True  # Stop moves to entry once Target 1 is hit
+    
+    # Data Settings
+    symbol: str = "QQQ"
+    watchlist: str = "QQQ, SPY, IWM, DIA, AAPL, MSFT, NVDA, AMZN, META, GOOGL"
+    data_period: str = "2y"  # Default to 2 years
+    chart_period: str = "6mo"  # What to display on chart
+    chart_max_points: int = 800  # Longer visible ranges are downsampled
+    intraday_interval: str = "off"  # "1m"/"5m" builds the forming daily bar from live intraday bars
+    intraday_sessions: int = 5  # Sessions of intraday bars kept in memory
+    
+    # Interactive Features (removed voice_commands and mobile_mode)
+    auto_refresh: bool = False
+    refresh_interval: int = 60
+    enable_sounds: bool = True
+    enable_notifications: bool = True
+    timing_panel: bool = False  # Per-rerun span timings in the sidebar
+    
+    @property
+    def ema_periods(self) -> Tuple[int, int, int, int]:
+        """Fast-to-slow EMA periods backing the EMA_5/10/21/50 columns"""
+        return (self.ema_5_period, self.ema_10_period, self.ema_21_period, self.ema_50_period)
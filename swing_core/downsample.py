@@ -0,0 +1,85 @@
+"""Level-of-detail reduction for long-history charts: LTTB for lines, OHLC buckets for candles"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+def bucket_edges(n: int, n_buckets: int) -> np.ndarray:
+    """Start positions of n_buckets near-equal consecutive buckets over n points"""
+    return np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: positions of the n_out points that best keep the line's shape
+
+    y may be one line or a (lines, n) stack sharing x, reduced in the same
+    pass. First and last points are always kept. In every bucket the point
+    forming the largest triangle with the previously kept point and the next
+    bucket's centroid wins. NaN points (indicator warmup) only win buckets
+    that have nothing else.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    lines = np.atleast_2d(y)
+    n = lines.shape[1]
+    if n_out >= n or n_out < 3:
+        return np.broadcast_to(np.arange(n), y.shape).copy()
+
+    x = np.asarray(x, dtype=np.float64)
+    finite = np.isfinite(lines)
+
+    # Interior points 1..n-2 split into n_out - 2 buckets
+    edges = bucket_edges(n - 2, n_out - 2) + 1
+    ends = np.append(edges[1:], n - 1)
+    interior = slice(None, n - 1)
+    counts = np.add.reduceat(finite[:, interior].astype(np.int64), edges, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.add.reduceat(np.where(finite, x, 0.0)[:, interior], edges, axis=1) / counts
+        mean_y = np.add.reduceat(np.where(finite, lines, 0.0)[:, interior], edges, axis=1) / counts
+    # The last bucket looks ahead to the fixed last point
+    next_x = np.column_stack([mean_x[:, 1:], np.full(len(lines), x[-1])])
+    next_y = np.column_stack([mean_y[:, 1:], lines[:, -1]])
+
+    rows = np.arange(len(lines))
+    selected = np.empty((len(lines), n_out), dtype=np.int64)
+    selected[:, 0], selected[:, -1] = 0, n - 1
+    a = np.zeros(len(lines), dtype=np.int64)
+    for i in range(n_out - 2):
+        lo, hi = edges[i], ends[i]
+        ax, ay = x[a][:, None], lines[rows, a][:, None]
+        area = np.abs((ax - next_x[:, i, None]) * (lines[:, lo:hi] - ay)
+                      - (ax - x[lo:hi]) * (next_y[:, i, None] - ay))
+        a = lo + np.argmax(np.nan_to_num(area, nan=-1.0), axis=1)
+        selected[:, i + 1] = a
+    return selected.reshape(y.shape[:-1] + (n_out,))
+
+
+def ohlc_buckets(data: pd.DataFrame, n_out: int) -> pd.DataFrame:
+    """Merge consecutive bars into n_out candles: first open, highest high, lowest low, last close
+
+    Volume keeps each bucket's largest bar so spikes stay visible on the same
+    scale as the per-bar volume average.
+    """
+    n = len(data)
+    if n_out >= n:
+        return data
+    edges = bucket_edges(n, n_out)
+    last = np.append(edges[1:], n) - 1
+    buckets = {
+        'Open': data['Open'].to_numpy()[edges],
+        'High': np.maximum.reduceat(data['High'].to_numpy(), edges),
+        'Low': np.minimum.reduceat(data['Low'].to_numpy(), edges),
+        'Close': data['Close'].to_numpy()[last],
+        'Volume': np.maximum.reduceat(data['Volume'].to_numpy(), edges),
+    }
+    return pd.DataFrame(buckets, index=data.index[edges])
+
+
+def downsample_lines(data: pd.DataFrame, columns, n_out: int) -> Dict[str, pd.Series]:
+    """Each column reduced to at most n_out points with its own LTTB selection"""
+    values = data[list(columns)].to_numpy(dtype=np.float64).T
+    keep = lttb(data.index.asi8, values, n_out)
+    return {
+        column: pd.Series(values[i, keep[i]], index=data.index[keep[i]], name=column)
+        for i, column in enumerate(columns)
+    }
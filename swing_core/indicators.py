@@ -0,0 +1,285 @@
+"""Technical indicators - batch pandas path and O(1) streaming state"""
+import math
+from collections import deque
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_EMA_PERIODS = (5, 10, 21, 50)
+
+# Column names are strategy roles - EMA_5 is the fast EMA whatever its period
+EMA_COLUMNS = ('EMA_5', 'EMA_10', 'EMA_21', 'EMA_50')
+INDICATOR_COLUMNS = EMA_COLUMNS + ('ATR', 'Volume_Avg')
+
+
+ATR_SMOOTHING = ('sma', 'wilder')
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: Optional[np.ndarray] = None,
+               scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """max(high - low, |high - prev close|, |low - prev close|) along the last axis, NaN on the first bar
+
+    Writes into out (and uses scratch for the gap terms) without any other
+    temporaries; both are allocated when not given.
+    """
+    out = np.empty(np.shape(high)) if out is None else out
+    gap = (np.empty(np.shape(high)) if scratch is None else scratch)[..., 1:]
+    np.subtract(high, low, out=out)
+    for extreme in (high, low):
+        np.subtract(extreme[..., 1:], close[..., :-1], out=gap)
+        np.abs(gap, out=gap)
+        np.maximum(out[..., 1:], gap, out=out[..., 1:])
+    out[..., 0] = np.nan
+    return out
+
+
+def atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14, smoothing: str = 'sma',
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Fused true range and ATR over float64 arrays with bars on the last axis (2-D = one row per symbol)
+
+    'sma' matches pandas rolling(period).mean() of the true range: each
+    window is summed left to right in place, period vector adds in total.
+    That is bit for bit at the usual short periods; past a few dozen bars
+    pandas' running sum rounds differently and the two agree to ~1e-15
+    relative. 'wilder' seeds with that SMA and then smooths with alpha =
+    1/period, skipping bars without a true range. Apart from pandas' ewm
+    pass for 'wilder', the only allocations are out and one true-range
+    buffer.
+    """
+    if smoothing not in ATR_SMOOTHING:
+        raise ValueError(f"smoothing must be one of {ATR_SMOOTHING}, got {smoothing!r}")
+    high, low, close = (np.asarray(values, dtype=np.float64) for values in (high, low, close))
+    out = np.empty(high.shape) if out is None else out
+    # out doubles as the scratch buffer until the averages are written into it
+    tr = true_range(high, low, close, scratch=out)
+
+    n = high.shape[-1]
+    out[..., :period - 1] = np.nan
+    if n < period:
+        out[...] = np.nan
+        return out
+    window_sums = out[..., period - 1:]
+    m = window_sums.shape[-1]
+    np.copyto(window_sums, tr[..., :m])
+    for k in range(1, period):
+        np.add(window_sums, tr[..., k:k + m], out=window_sums)
+    np.divide(window_sums, period, out=window_sums)
+    if smoothing == 'sma' or n <= period:
+        return out
+
+    # Wilder is a recursion, so the compiled ewm(adjust=False) loop runs it from the first full window
+    tr[..., :period] = np.nan
+    tr[..., period] = out[..., period]
+    frame = pd.Series(tr, copy=False) if tr.ndim == 1 else pd.DataFrame(tr.T, copy=False)
+    smoothed = frame.ewm(alpha=1 / period, adjust=False, ignore_na=True).mean().to_numpy()
+    np.copyto(out[..., period:], (smoothed if tr.ndim == 1 else smoothed.T)[..., period:])
+    return out
+
+
+def calculate_atr(high, low, close, period=14, smoothing='sma'):
+    """Calculate Average True Range"""
+    atr = atr_kernel(high.to_numpy(dtype=np.float64), low.to_numpy(dtype=np.float64),
+                     close.to_numpy(dtype=np.float64), period, smoothing)
+    return pd.Series(atr, index=high.index, copy=False)
+
+
+def add_indicators(data: pd.DataFrame, ema_periods: Sequence[int] = DEFAULT_EMA_PERIODS,
+                   atr_period: int = 14, volume_period: int = 20) -> pd.DataFrame:
+    """Add EMA, ATR and volume average columns over the whole frame"""
+    for column, period in zip(EMA_COLUMNS, ema_periods):
+        data[column] = data['Close'].ewm(span=period).mean()
+    data['ATR'] = calculate_atr(data['High'], data['Low'], data['Close'], atr_period)
+    data['Volume_Avg'] = data['Volume'].rolling(volume_period).mean()
+    return data
+
+
+class _RollingMean:
+    """Fixed-window mean matching pandas rolling(window).mean(), NaN while incomplete"""
+
+    def __init__(self, window: int, values=()):
+        self.window = window
+        self.values = deque(values, maxlen=window)
+
+    def push(self, value: float) -> float:
+        self.values.append(value)
+        if len(self.values) < self.window:
+            return np.nan
+        # fsum over a fixed window is constant time and does not drift like a running sum
+        return math.fsum(self.values) / self.window
+
+    def copy(self) -> '_RollingMean':
+        return _RollingMean(self.window, self.values)
+
+
+class AtrState:
+    """Streaming ATR for live bars, one push per bar in O(period)
+
+    Matches atr_kernel on the same bars exactly for 'sma' and to rounding
+    for 'wilder'.
+    """
+
+    def __init__(self, period: int = 14, smoothing: str = 'sma'):
+        if smoothing not in ATR_SMOOTHING:
+            raise ValueError(f"smoothing must be one of {ATR_SMOOTHING}, got {smoothing!r}")
+        self.period = period
+        self.smoothing = smoothing
+        self.window = deque(maxlen=period)
+        self.prev_close = np.nan
+        self.value = np.nan
+
+    @classmethod
+    def from_bars(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14,
+                  smoothing: str = 'sma') -> 'AtrState':
+        """State after pushing every bar, computed with the batch kernel"""
+        state = cls(period, smoothing)
+        if len(close):
+            high, low, close = (np.asarray(values, dtype=np.float64) for values in (high, low, close))
+            state.window.extend(true_range(high, low, close)[-period:])
+            state.prev_close = float(close[-1])
+            state.value = float(atr_kernel(high, low, close, period, smoothing)[-1])
+        return state
+
+    def copy(self) -> 'AtrState':
+        state = AtrState(self.period, self.smoothing)
+        state.window.extend(self.window)
+        state.prev_close, state.value = self.prev_close, self.value
+        return state
+
+    def push(self, high: float, low: float, close: float) -> float:
+        """Add one bar and return its ATR (NaN until a full window)"""
+        gaps = (high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        tr = np.nan if any(math.isnan(gap) for gap in gaps) else max(gaps)
+        self.prev_close = close
+        self.window.append(tr)
+
+        full = len(self.window) == self.period
+        # Left-to-right sum, the same order as the batch kernel
+        sma = sum(self.window) / self.period if full else np.nan
+        if self.smoothing == 'sma' or math.isnan(self.value):
+            self.value = sma
+            return self.value
+
+        # A bar without a true range carries the value forward
+        if not math.isnan(tr):
+            self.value += (tr - self.value) / self.period
+        return self.value
+
+
+class IndicatorState:
+    """Streaming EMA / ATR / volume-average state for one symbol
+
+    Cold start runs the batch pandas path once; after that each appended or
+    revised bar updates every indicator in constant time.
+    """
+
+    def __init__(self, ema_periods: Sequence[int] = DEFAULT_EMA_PERIODS,
+                 atr_period: int = 14, volume_period: int = 20):
+        self.ema_periods = tuple(ema_periods)
+        self.atr_period = atr_period
+        self.volume_period = volume_period
+        self._decay = [1 - 2 / (period + 1) for period in self.ema_periods]
+        self._reset(0)
+
+    def _reset(self, capacity: int):
+        self.length = 0
+        self._timestamps = np.empty(max(capacity, 16), dtype=np.int64)
+        self._values = np.empty((max(capacity, 16), len(INDICATOR_COLUMNS)))
+        self._last_bar = None
+        self._checkpoint = None
+
+        # pandas ewm(adjust=True) is num/den with both decaying by (1 - alpha) each bar
+        self._ema_num = [0.0] * len(self.ema_periods)
+        self._ema_den = [0.0] * len(self.ema_periods)
+        self._atr = AtrState(self.atr_period)
+        self._volume = _RollingMean(self.volume_period)
+
+    def _state(self):
+        return (list(self._ema_num), list(self._ema_den), self._atr.copy(), self._volume.copy(), self._last_bar)
+
+    def _restore(self, state):
+        self._ema_num, self._ema_den, self._atr, self._volume, self._last_bar = state
+
+    def _grow(self):
+        capacity = len(self._timestamps) * 2
+        self._timestamps = np.resize(self._timestamps, capacity)
+        self._values = np.resize(self._values, (capacity, len(INDICATOR_COLUMNS)))
+
+    def append(self, timestamp: int, high: float, low: float, close: float, volume: float):
+        """Add a new bar and update every indicator in O(1)"""
+        self._checkpoint = self._state()
+        if self.length == len(self._timestamps):
+            self._grow()
+
+        row = self._values[self.length]
+        for k, decay in enumerate(self._decay):
+            self._ema_num[k] = close + decay * self._ema_num[k]
+            self._ema_den[k] = 1.0 + decay * self._ema_den[k]
+            row[k] = self._ema_num[k] / self._ema_den[k]
+
+        row[len(EMA_COLUMNS)] = self._atr.push(high, low, close)
+        row[len(EMA_COLUMNS) + 1] = self._volume.push(volume)
+
+        self._last_bar = (timestamp, high, low, close, volume)
+        self._timestamps[self.length] = timestamp
+        self.length += 1
+
+    def replace_last(self, timestamp: int, high: float, low: float, close: float, volume: float):
+        """Revise the most recent (still forming) bar in O(1)"""
+        self._restore(self._checkpoint)
+        self.length -= 1
+        self.append(timestamp, high, low, close, volume)
+
+    def cold_start(self, data: pd.DataFrame):
+        """Full batch recompute, then seed the streaming state from its tail"""
+        self._reset(len(data) * 2)
+        if data.empty:
+            return
+
+        seeded = add_indicators(data[['High', 'Low', 'Close', 'Volume']].iloc[:-1].copy(),
+                                self.ema_periods, self.atr_period, self.volume_period)
+        m = len(seeded)
+        if m:
+            self._values[:m] = seeded[list(INDICATOR_COLUMNS)].to_numpy()
+            self._timestamps[:m] = seeded.index.as_unit('ns').asi8
+            self.length = m
+
+            for k, decay in enumerate(self._decay):
+                self._ema_den[k] = (1 - decay ** m) / (1 - decay)
+                self._ema_num[k] = self._values[m - 1, k] * self._ema_den[k]
+
+            self._atr = AtrState.from_bars(*(seeded[c].to_numpy(dtype=np.float64) for c in ('High', 'Low', 'Close')),
+                                           self.atr_period)
+            self._volume = _RollingMean(self.volume_period,
+                                        seeded['Volume'].to_numpy(dtype=np.float64)[-self.volume_period:])
+
+        self._append_row(data, len(data) - 1)
+
+    def _append_row(self, data: pd.DataFrame, i: int, replace: bool = False):
+        bar = (int(data.index[i:i + 1].as_unit('ns').asi8[0]),) + tuple(
+            float(data[c].iat[i]) for c in ('High', 'Low', 'Close', 'Volume'))
+        (self.replace_last if replace else self.append)(*bar)
+
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Bring the state up to date with data and return its indicator columns
+
+        Data is expected to be the previous frame plus bars appended at the end,
+        with the last known bar possibly revised. Anything else is a cold start.
+        """
+        timestamps = data.index.as_unit('ns').asi8
+        last = self.length - 1
+        extends = (
+            self.length > 0 and len(timestamps) >= self.length
+            and timestamps[0] == self._timestamps[0] and timestamps[last] == self._timestamps[last]
+        )
+
+        if not extends:
+            self.cold_start(data)
+        else:
+            current = tuple(float(data[c].iat[last]) for c in ('High', 'Low', 'Close', 'Volume'))
+            if current != self._last_bar[1:]:
+                self._append_row(data, last, replace=True)
+            for i in range(self.length, len(data)):
+                self._append_row(data, i)
+
+        return pd.DataFrame(self._values[:self.length].copy(), index=data.index, columns=INDICATOR_COLUMNS)
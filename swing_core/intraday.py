@@ -0,0 +1,145 @@
+"""Intraday minute bars in a bounded ring buffer, resampled live into the forming daily bar"""
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from swing_core.bar_store import BarProvider, YFinanceProvider, merge_bars
+from swing_core.signals import session_dates
+from swing_core.spans import traced
+
+# Regular-session bars per day for the supported intraday intervals
+SESSION_BARS = {'1m': 390, '2m': 195, '5m': 78, '15m': 26, '30m': 13}
+
+RING_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+class BarRing:
+    """Fixed-capacity OHLCV ring: appending past capacity overwrites the oldest bar"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((capacity, len(RING_COLUMNS)))
+        self._next = 0
+        self.length = 0
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self._timestamps[self._next - 1]) if self.length else None
+
+    def push(self, timestamp: int, bar) -> bool:
+        """Append a bar or revise the last one if it has the same timestamp, False if it is older"""
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            return False
+        if timestamp == last:
+            self._values[self._next - 1] = bar
+            return True
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = bar
+        self._next = (self._next + 1) % self.capacity
+        self.length = min(self.length + 1, self.capacity)
+        return True
+
+    def frame(self, tz=None) -> pd.DataFrame:
+        """Buffered bars oldest first"""
+        order = (np.arange(self.length) + self._next - self.length) % self.capacity
+        index = pd.DatetimeIndex(self._timestamps[order], name='Datetime').tz_localize('UTC')
+        frame = pd.DataFrame(self._values[order], index=index, columns=RING_COLUMNS)
+        return frame if tz is None else frame.tz_convert(tz)
+
+
+class DailyBarBuilder:
+    """Streaming resample of intraday bars into the daily bar of the current session
+
+    Each bar updates open/high/low/close/volume in O(1). A revised last bar
+    (same timestamp, still forming) replaces its earlier volume instead of
+    adding to it; its high/low can only widen, so max/min stay exact.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.open = self.high = self.low = self.close = np.nan
+        self.volume = 0.0
+        self._last_timestamp = None
+        self._last_volume = 0.0
+
+    def update(self, timestamp: int, session: np.datetime64, bar):
+        open_, high, low, close, volume = bar
+        if session != self.session:
+            self.session = session
+            self.open, self.high, self.low, self.close = open_, high, low, close
+            self.volume = 0.0
+            self._last_timestamp = None
+        else:
+            self.high = max(self.high, high)
+            self.low = min(self.low, low)
+            self.close = close
+
+        if timestamp == self._last_timestamp:
+            self.volume -= self._last_volume
+        self.volume += volume
+        self._last_timestamp = timestamp
+        self._last_volume = volume
+
+    def frame(self, tz) -> pd.DataFrame:
+        """The forming daily bar, stamped at session midnight like daily history"""
+        index = pd.DatetimeIndex([self.session], name='Date').tz_localize(tz)
+        return pd.DataFrame([[self.open, self.high, self.low, self.close, self.volume]],
+                            index=index, columns=RING_COLUMNS)
+
+
+class IntradayFeed:
+    """Polls intraday bars for one symbol into a ring holding the last N sessions"""
+
+    def __init__(self, symbol: str, interval: str = '1m', sessions: int = 5,
+                 provider: Optional[BarProvider] = None, min_refresh_seconds: int = 15):
+        self.symbol = symbol
+        self.interval = interval
+        self.provider = provider or YFinanceProvider()
+        self.min_refresh_seconds = min_refresh_seconds
+        self.ring = BarRing(sessions * SESSION_BARS[interval])
+        self.daily = DailyBarBuilder()
+        self.tz = None
+        self._fetched_at = 0
+        self._lock = threading.Lock()
+
+    def ingest(self, bars: pd.DataFrame):
+        """Push new (or revised last) bars into the ring and the forming daily bar"""
+        if bars is None or bars.empty:
+            return
+        self.tz = bars.index.tz
+        timestamps = bars.index.as_unit('ns').asi8
+        # Session date in the exchange's own wall-clock time
+        sessions = session_dates(bars.index)
+        values = bars[RING_COLUMNS].to_numpy(dtype=np.float64)
+        for timestamp, session, bar in zip(timestamps, sessions, values):
+            if self.ring.push(int(timestamp), bar):
+                self.daily.update(int(timestamp), session, bar)
+
+    @traced('intraday.poll')
+    def poll(self, force: bool = False) -> Optional[pd.DataFrame]:
+        """Fetch bars since the last one and return the forming daily bar"""
+        with self._lock:
+            now = pd.Timestamp.now(tz='UTC').value
+            if force or now - self._fetched_at >= self.min_refresh_seconds * 1e9:
+                last = self.ring.last_timestamp
+                if last is None:
+                    # yfinance serves minute bars for the last few days only
+                    bars = self.provider.history(self.symbol, self.interval, period='5d')
+                else:
+                    # From the last buffered bar, so the still-forming one gets revised
+                    bars = self.provider.history(self.symbol, self.interval,
+                                                 start=pd.Timestamp(last, tz='UTC'))
+                self.ingest(bars)
+                self._fetched_at = now
+            return None if self.daily.session is None else self.daily.frame(self.tz)
+
+
+def with_live_bar(history: pd.DataFrame, live: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Daily history with the forming bar appended, or replacing today's partial daily bar"""
+    if live is None or history.empty or live.index[0] < history.index[-1]:
+        return history
+    return merge_bars(history, live)
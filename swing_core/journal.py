@@ -0,0 +1,238 @@
+"""Durable trade journal in SQLite"""
+import csv
+import json
+import operator
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, fields
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_JOURNAL_PATH = os.environ.get('SWING_JOURNAL', '.trade_journal.db')
+
+
+@dataclass
+class Trade:
+    """Enhanced trade record"""
+    entry_date: str
+    entry_time: str
+    entry_price: float
+    position_size: int
+    stop_loss: float
+    target1: float
+    target2: float
+    notes: str = ""
+    tags: List[str] = None
+    exit_date: Optional[str] = None
+    exit_time: Optional[str] = None
+    exit_price: Optional[float] = None
+    pnl: Optional[float] = None
+    pnl_percent: Optional[float] = None
+    exit_reason: Optional[str] = None
+    is_active: bool = True
+    symbol: str = 'QQQ'
+    id: Optional[int] = None  # Row id, set once the journal stores the trade
+
+
+# Stored columns in Trade field order; id is the row id
+COLUMNS = tuple(f.name for f in fields(Trade) if f.name != 'id')
+# Columns an empty CSV cell reads back as NULL
+NULLABLE = frozenset(f.name for f in fields(Trade) if f.default is None)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    entry_date TEXT NOT NULL,
+    entry_time TEXT NOT NULL,
+    entry_price REAL NOT NULL,
+    position_size INTEGER NOT NULL,
+    stop_loss REAL NOT NULL,
+    target1 REAL NOT NULL,
+    target2 REAL NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    exit_date TEXT,
+    exit_time TEXT,
+    exit_price REAL,
+    pnl REAL,
+    pnl_percent REAL,
+    exit_reason TEXT,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    symbol TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_symbol_entry ON trades (symbol, entry_date);
+CREATE INDEX IF NOT EXISTS trades_active_symbol ON trades (is_active, symbol);
+CREATE INDEX IF NOT EXISTS trades_entry ON trades (entry_date);
+"""
+
+
+_column_values = operator.attrgetter(*COLUMNS)
+_TAGS, _IS_ACTIVE = COLUMNS.index('tags'), COLUMNS.index('is_active')
+
+
+def _row(trade: Trade) -> list:
+    """Trade as stored column values, id last"""
+    values = list(_column_values(trade))
+    values[_TAGS] = json.dumps(values[_TAGS]) if values[_TAGS] else '[]'
+    values[_IS_ACTIVE] = int(bool(values[_IS_ACTIVE]))
+    values.append(trade.id)
+    return values
+
+
+def _trade(row: tuple) -> Trade:
+    """Trade from an (id, *COLUMNS) row"""
+    trade = Trade(*row[1:], id=row[0])
+    trade.tags = json.loads(trade.tags)
+    trade.is_active = bool(trade.is_active)
+    return trade
+
+
+class TradeJournal:
+    """Trades in one SQLite file, shared by every session and thread of the process
+
+    Each thread gets its own connection; WAL mode lets readers run while a
+    writer commits. Dates are ISO strings, so date ranges compare as text
+    and use the entry_date indexes. Queries stream rows in batches, so
+    years of trades never have to fit in memory at once.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            # Safe with WAL: a crash can lose the last commits but never corrupts the file
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def add(self, trade: Trade) -> int:
+        """Store a new trade, setting and returning its id"""
+        return self.add_many([trade])[0]
+
+    def add_many(self, trades: Iterable[Trade], batch_size: int = 10000) -> List[int]:
+        """Store new trades in one transaction, setting their ids"""
+        insert = f"INSERT INTO trades ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+        ids = []
+        with self._connection() as conn:
+            for batch in _batches(trades, batch_size):
+                for trade in batch:
+                    trade.id = conn.execute(insert, _row(trade)[:-1]).lastrowid
+                    ids.append(trade.id)
+        return ids
+
+    def update(self, trade: Trade):
+        self.update_many([trade])
+
+    def update_many(self, trades: Iterable[Trade], batch_size: int = 10000):
+        """Write back changed trades by id in one transaction"""
+        update = f"UPDATE trades SET {', '.join(f'{name} = ?' for name in COLUMNS)} WHERE id = ?"
+        with self._connection() as conn:
+            for batch in _batches(trades, batch_size):
+                if any(trade.id is None for trade in batch):
+                    raise ValueError('only trades read from or added to the journal can be updated')
+                conn.executemany(update, [_row(trade) for trade in batch])
+
+    def close_trade(self, trade: Trade, exit_date: str, exit_time: str, exit_price: float, exit_reason: str):
+        """Record a trade's exit with its P&L"""
+        trade.exit_date, trade.exit_time, trade.exit_price = exit_date, exit_time, exit_price
+        trade.pnl = (exit_price - trade.entry_price) * trade.position_size
+        trade.pnl_percent = (exit_price / trade.entry_price - 1) * 100
+        trade.exit_reason = exit_reason
+        trade.is_active = False
+        self.update(trade)
+
+    @staticmethod
+    def _where(symbol: Optional[str], active: Optional[bool], start: Optional[str],
+               end: Optional[str]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append('symbol = ?')
+            params.append(symbol)
+        if active is not None:
+            clauses.append('is_active = ?')
+            params.append(int(active))
+        if start is not None:
+            clauses.append('entry_date >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('entry_date <= ?')
+            params.append(end)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def _rows(self, batch_size: int, **filters) -> Iterator[tuple]:
+        where, params = self._where(**filters)
+        cursor = self._connection().execute(
+            f"SELECT id, {', '.join(COLUMNS)} FROM trades{where} ORDER BY entry_date, id", params)
+        for batch in iter(lambda: cursor.fetchmany(batch_size), []):
+            yield from batch
+
+    def trades(self, symbol: Optional[str] = None, active: Optional[bool] = None, start: Optional[str] = None,
+               end: Optional[str] = None, batch_size: int = 1000) -> Iterator[Trade]:
+        """Trades matching every given filter, by entry date then id, start/end inclusive"""
+        return map(_trade, self._rows(batch_size, symbol=symbol, active=active, start=start, end=end))
+
+    def active_trades(self, symbol: Optional[str] = None) -> List[Trade]:
+        return list(self.trades(symbol=symbol, active=True))
+
+    def count(self, symbol: Optional[str] = None, active: Optional[bool] = None, start: Optional[str] = None,
+              end: Optional[str] = None) -> int:
+        """Number of matching trades, answered from the indexes"""
+        where, params = self._where(symbol, active, start, end)
+        return self._connection().execute(f'SELECT COUNT(*) FROM trades{where}', params).fetchone()[0]
+
+    def export_csv(self, path: str, symbol: Optional[str] = None, active: Optional[bool] = None,
+                   start: Optional[str] = None, end: Optional[str] = None, batch_size: int = 10000) -> int:
+        """Stream matching trades to CSV as stored, returning the row count"""
+        written = 0
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('id',) + COLUMNS)
+            for batch in _batches(self._rows(batch_size, symbol=symbol, active=active, start=start, end=end),
+                                  batch_size):
+                writer.writerows(batch)
+                written += len(batch)
+        return written
+
+    def import_csv(self, path: str, keep_ids: bool = False, batch_size: int = 10000) -> int:
+        """Load trades from an export_csv file in batches, returning the row count
+
+        Rows get new ids unless keep_ids, which restores an export in place:
+        rows whose id already exists are replaced.
+        """
+        columns = ('id',) + COLUMNS if keep_ids else COLUMNS
+        verb = 'INSERT OR REPLACE' if keep_ids else 'INSERT'
+        insert = f"{verb} INTO trades ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        imported = 0
+        with open(path, newline='') as f, self._connection() as conn:
+            for batch in _batches(csv.DictReader(f), batch_size):
+                conn.executemany(insert, [
+                    tuple(None if name in NULLABLE and row[name] == '' else row[name] for name in columns)
+                    for row in batch
+                ])
+                imported += len(batch)
+        return imported
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,125 @@
+"""Monte Carlo resampling of backtest trades for drawdown, final-equity and risk-of-ruin distributions"""
+import os
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.shared import SharedArrays, process_pool, worker_arrays
+
+METHODS = ('bootstrap', 'shuffle')
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Cells in one (paths × trades) equity block - small enough that its two float64 buffers stay in cache
+CHUNK_CELLS = 1 << 17
+
+
+def trade_r_multiples(entry_price: np.ndarray, exit_price: np.ndarray, stop_loss: np.ndarray) -> np.ndarray:
+    """Each trade's result in units of its initial risk, (exit - entry) / (entry - stop)
+
+    Trades without a stop below entry have no defined risk and are left out.
+    """
+    entry_price, exit_price, stop_loss = (np.asarray(values, dtype=np.float64)
+                                          for values in (entry_price, exit_price, stop_loss))
+    risk = entry_price - stop_loss
+    valid = risk > 0
+    r = (exit_price[valid] - entry_price[valid]) / risk[valid]
+    return r[np.isfinite(r)]
+
+
+def simulate_paths(growth: np.ndarray, n_paths: int, n_trades: int, method: str,
+                   seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Final equity, max drawdown and lowest equity of n_paths resampled paths, all as fractions of the start
+
+    growth holds each trade's equity multiplier. One (n_paths × n_trades)
+    block is drawn, compounded in place and reduced along the trade axis.
+    """
+    rng = np.random.default_rng(seed)
+    if method == 'shuffle':
+        equity = rng.permuted(np.tile(growth, (n_paths, 1)), axis=1)
+    else:
+        equity = growth[rng.integers(0, len(growth), size=(n_paths, n_trades))]
+    np.cumprod(equity, axis=1, out=equity)
+
+    # Running peak, floored at the starting equity, then equity as a share of it
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, 1.0, out=peak)
+    np.divide(equity, peak, out=peak)
+    return equity[:, -1].copy(), 1.0 - peak.min(axis=1), equity.min(axis=1)
+
+
+def _simulate_shared(n_paths: int, n_trades: int, method: str,
+                     seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return simulate_paths(worker_arrays()['growth'], n_paths, n_trades, method, seed)
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-path outcomes of a Monte Carlo run"""
+    final_equity: np.ndarray
+    max_drawdown_pct: np.ndarray
+    ruined: np.ndarray
+    account_value: float
+
+    @property
+    def risk_of_ruin_pct(self) -> float:
+        return float(self.ruined.mean() * 100) if len(self.ruined) else 0.0
+
+    def percentiles(self, q: Sequence[float] = PERCENTILES) -> pd.DataFrame:
+        """Final equity, return and max drawdown at each percentile across paths"""
+        final = np.percentile(self.final_equity, q)
+        return pd.DataFrame({
+            'Final_Equity': final,
+            'Return_Pct': (final / self.account_value - 1) * 100,
+            'Max_Drawdown_Pct': np.percentile(self.max_drawdown_pct, q),
+        }, index=pd.Index([f'P{p:g}' for p in q], name='Percentile'))
+
+
+def run_monte_carlo(r_multiples: np.ndarray, risk_percent: float = 1.0, account_value: float = 100000,
+                    n_paths: int = 10000, n_trades: Optional[int] = None, method: str = 'bootstrap',
+                    ruin_percent: float = 50.0, seed: Optional[int] = None, max_workers: Optional[int] = None,
+                    chunk_cells: int = CHUNK_CELLS) -> MonteCarloResult:
+    """Resample a backtest's trades into n_paths equity paths sized at risk_percent of current equity
+
+    'bootstrap' draws n_trades trades with replacement (default: as many
+    as the backtest had); 'shuffle' reorders the historical trades, so
+    only the path, not the final equity, changes. A path is ruined once
+    its equity falls ruin_percent below the starting account. Paths are
+    simulated in chunks of chunk_cells, over a process pool when there
+    is more than one chunk; each chunk has its own seed, so results for
+    a given seed don't depend on max_workers.
+    """
+    if method not in METHODS:
+        raise ValueError(f'method must be one of {METHODS}, got {method!r}')
+    r_multiples = np.asarray(r_multiples, dtype=np.float64)
+    n_trades = len(r_multiples) if n_trades is None else n_trades
+    if method == 'shuffle' and n_trades != len(r_multiples):
+        raise ValueError('shuffle reorders the historical trades, so n_trades must equal their count')
+    if not len(r_multiples) or n_trades <= 0 or n_paths <= 0:
+        empty = np.empty(0)
+        return MonteCarloResult(empty, empty, np.empty(0, dtype=bool), account_value)
+
+    # A loss past the whole account can't take equity below zero
+    growth = np.maximum(1 + r_multiples * risk_percent / 100, 0.0)
+    rows = max(chunk_cells // n_trades, 1)
+    chunks = [min(rows, n_paths - start) for start in range(0, n_paths, rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(chunks) == 1:
+        results = [simulate_paths(growth, paths, n_trades, method, chunk_seed)
+                   for paths, chunk_seed in zip(chunks, seeds)]
+    else:
+        workers = min(max_workers, len(chunks))
+        shared = SharedArrays({'growth': growth})
+        try:
+            with process_pool(shared, workers, __name__) as pool:
+                results = list(pool.map(_simulate_shared, chunks, [n_trades] * len(chunks), [method] * len(chunks),
+                                        seeds, chunksize=max(len(chunks) // (4 * workers), 1)))
+        finally:
+            shared.close()
+
+    final, drawdown, lowest = (np.concatenate(values) for values in zip(*results))
+    return MonteCarloResult(final * account_value, drawdown * 100, lowest <= 1 - ruin_percent / 100,
+                            account_value)
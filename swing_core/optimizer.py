@@ -0,0 +1,167 @@
+"""Parameter-sweep optimizer for TradeConfig multipliers over a process pool"""
+import itertools
+import os
+import random
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.backtest import simulate_trades, trade_parameters
+from swing_core.config import TradeConfig
+from swing_core.indicators import INDICATOR_COLUMNS, add_indicators
+from swing_core.shared import SharedArrays, process_pool, worker_arrays
+from swing_core.signals import WARMUP_BARS, align_vix, compute_signals, vix_below
+
+BAR_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Configs sharing these fields share every indicator column
+INDICATOR_FIELDS = ('ema_5_period', 'ema_10_period', 'ema_21_period', 'ema_50_period', 'atr_period', 'volume_period')
+
+DEFAULT_GRID = {
+    'atr_entry_multiplier': [1.0, 1.25, 1.5, 1.75, 2.0],
+    'atr_target1_multiplier': [1.5, 2.0, 2.5],
+    'atr_target2_multiplier': [2.5, 3.0, 4.0],
+    'atr_stop_multiplier': [1.5, 2.0, 2.5],
+}
+
+METRIC_COLUMNS = ['Trades', 'Win_Rate', 'Total_PnL', 'Avg_Profit_Pct', 'Max_Drawdown', 'Profit_Factor']
+
+
+def grid_configs(base: TradeConfig, grid: Dict[str, Sequence]) -> List[TradeConfig]:
+    """Every combination of the grid values applied on top of base"""
+    fields = list(grid)
+    return [replace(base, **dict(zip(fields, values))) for values in itertools.product(*grid.values())]
+
+
+def random_configs(base: TradeConfig, space: Dict[str, Sequence], n: int,
+                   seed: Optional[int] = None) -> List[TradeConfig]:
+    """Random search: lists are sampled as choices, (low, high) tuples uniformly"""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(n):
+        values = {}
+        for field, choices in space.items():
+            if isinstance(choices, tuple):
+                low, high = choices
+                values[field] = rng.randint(low, high) if isinstance(low, int) else rng.uniform(low, high)
+            else:
+                values[field] = rng.choice(list(choices))
+        configs.append(replace(base, **values))
+    return configs
+
+
+def indicator_key(config: TradeConfig) -> Tuple:
+    return tuple(getattr(config, field) for field in INDICATOR_FIELDS)
+
+
+def indicator_columns(bars: Dict[str, np.ndarray], config: TradeConfig,
+                      warmed: Optional[Tuple] = None) -> Dict[str, np.ndarray]:
+    """Indicator columns for one EMA/ATR/volume setting, computed once per group
+
+    When bars already carry indicator columns for the warmed indicator key
+    (warmed up on a longer history than bars span), configs with that key
+    use them as they are.
+    """
+    if warmed is not None and indicator_key(config) == warmed:
+        return {name: bars[name] for name in BAR_COLUMNS + INDICATOR_COLUMNS}
+    frame = add_indicators(pd.DataFrame(bars), config.ema_periods, config.atr_period, config.volume_period)
+    return {name: frame[name].to_numpy() for name in BAR_COLUMNS + INDICATOR_COLUMNS}
+
+
+def summarize_trades(trades: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Win rate, P&L and drawdown of simulated trades, equity realized in exit order"""
+    profit = (trades['exit_price'] - trades['entry_price']) * trades['shares']
+    if not len(profit):
+        return dict.fromkeys(METRIC_COLUMNS, 0.0)
+
+    equity = np.cumsum(profit[np.argsort(trades['exit_pos'], kind='stable')])
+    peak = np.maximum.accumulate(np.concatenate([[0.0], equity]))[1:]
+    gains = profit[profit > 0].sum()
+    losses = -profit[profit < 0].sum()
+    return {
+        'Trades': len(profit),
+        'Win_Rate': (profit > 0).mean() * 100,
+        'Total_PnL': profit.sum(),
+        'Avg_Profit_Pct': ((trades['exit_price'] / trades['entry_price'] - 1) * 100).mean(),
+        'Max_Drawdown': (peak - equity).max(),
+        'Profit_Factor': gains / losses if losses > 0 else np.inf,
+    }
+
+
+def config_trades(dates_ns: np.ndarray, columns: Dict[str, np.ndarray], vix: np.ndarray,
+                  config: TradeConfig) -> Dict[str, np.ndarray]:
+    """The dashboard's signals and trade rules for one config over precomputed indicator columns"""
+    signals = compute_signals(columns, config.atr_entry_multiplier, vix_below(vix, config.vix_threshold))
+    # Trades start after warmup exactly like the dashboard signal table
+    w = slice(WARMUP_BARS, None)
+    return simulate_trades(
+        dates_ns[w], columns['Open'][w], columns['High'][w], columns['Low'][w], columns['Close'][w],
+        signals['entry_signal'][w], signals['exit_signal'][w],
+        columns['EMA_5'][w], columns['ATR'][w], **trade_parameters(config)
+    )
+
+
+def evaluate_configs(dates_ns: np.ndarray, bars: Dict[str, np.ndarray], vix: np.ndarray,
+                     configs: Sequence[TradeConfig], warmed: Optional[Tuple] = None) -> List[Dict[str, float]]:
+    """Backtest configs that share one indicator setting, vix already aligned to the bars"""
+    columns = indicator_columns(bars, configs[0], warmed)
+    return [summarize_trades(config_trades(dates_ns, columns, vix, config)) for config in configs]
+
+
+def _evaluate_shared(configs: Sequence[TradeConfig], warmed: Optional[Tuple]) -> List[Dict[str, float]]:
+    arrays = worker_arrays()
+    bars = {name: values for name, values in arrays.items() if name not in ('dates', 'vix')}
+    return evaluate_configs(arrays['dates'], bars, arrays['vix'], configs, warmed)
+
+
+def run_sweep(data: pd.DataFrame, configs: Sequence[TradeConfig], max_workers: Optional[int] = None,
+              chunk_size: int = 64, vix: Optional[pd.Series] = None,
+              indicators: Optional[TradeConfig] = None) -> pd.DataFrame:
+    """Backtest every config and return a results table sorted by total P&L
+
+    vix is the daily VIX close series; each config applies its own vix_threshold.
+    When data already has indicator columns (e.g. the dashboard's frame,
+    warmed up on the full stored history), indicators is the config they
+    were computed with; configs sharing its indicator settings trade on
+    those columns instead of ones recomputed cold from data's first bar.
+    """
+    configs = list(configs)
+    if not configs or len(data) <= WARMUP_BARS:
+        return pd.DataFrame()
+
+    # Group by indicator settings so each worker task computes indicators once
+    order = sorted(range(len(configs)), key=lambda i: indicator_key(configs[i]))
+    tasks = []
+    for _, group in itertools.groupby(order, key=lambda i: indicator_key(configs[i])):
+        group = list(group)
+        tasks.extend(group[i:i + chunk_size] for i in range(0, len(group), chunk_size))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    dates_ns = data.index.as_unit('ns').asi8
+    warmed = None if indicators is None else indicator_key(indicators)
+    bars = {name: data[name].to_numpy(dtype=np.float64)
+            for name in BAR_COLUMNS + (INDICATOR_COLUMNS if warmed is not None else ())}
+    vix_values = align_vix(data.index, vix)
+    metrics: List[Optional[Dict]] = [None] * len(configs)
+    if max_workers == 1 or len(tasks) == 1:
+        results = [evaluate_configs(dates_ns, bars, vix_values, [configs[i] for i in task], warmed) for task in tasks]
+    else:
+        shared = SharedArrays({'dates': dates_ns, 'vix': vix_values, **bars})
+        try:
+            with process_pool(shared, min(max_workers, len(tasks)), __name__) as pool:
+                results = list(pool.map(_evaluate_shared, [[configs[i] for i in task] for task in tasks],
+                                        [warmed] * len(tasks)))
+        finally:
+            shared.close()
+
+    for task, task_results in zip(tasks, results):
+        for i, result in zip(task, task_results):
+            metrics[i] = result
+
+    # Only report the parameters that actually vary across the sweep
+    params = pd.DataFrame([vars(config) for config in configs])
+    varying = [column for column in params.columns if params[column].nunique() > 1]
+    table = pd.concat([params[varying], pd.DataFrame(metrics, columns=METRIC_COLUMNS)], axis=1)
+    return table.sort_values('Total_PnL', ascending=False).reset_index(drop=True)
@@ -0,0 +1,183 @@
+"""Portfolio-level backtest: candidate trades taken in time order under capital and risk limits"""
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.backtest import build_trade_table
+from swing_core.batch import evaluate_window, window_bounds
+from swing_core.config import TradeConfig
+from swing_core.optimizer import BAR_COLUMNS
+from swing_core.signals import WARMUP_BARS, align_vix, session_dates
+
+# Why a candidate was not taken, by code in simulate_portfolio's 'skip' array
+SKIP_REASONS = ('', 'already_held', 'max_positions', 'daily_loss_limit', 'insufficient_cash')
+TAKEN, HELD, FULL, DAILY_LOSS, NO_CASH = range(len(SKIP_REASONS))
+
+# Per-symbol candidates: bar dates the positions refer to, and simulate_trades output
+SymbolTrades = Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]
+
+
+def simulate_portfolio(symbol: np.ndarray, entry_ns: np.ndarray, exit_ns: np.ndarray, entry_day: np.ndarray,
+                       exit_day: np.ndarray, entry_price: np.ndarray, exit_price: np.ndarray,
+                       stop_loss: np.ndarray, account_value: float = 100000, risk_percent: float = 1.0,
+                       max_positions: int = 3, daily_loss_limit: float = 3.0) -> Dict[str, np.ndarray]:
+    """Walk candidate trades in entry order, taking each one the account could actually have taken
+
+    Candidates are independent trades (e.g. simulate_trades on each
+    symbol). Exits at or before an entry's bar are realized first. A
+    candidate is skipped when its symbol is already held, max_positions
+    are open, that session's realized loss has reached daily_loss_limit
+    percent of its opening equity, or there is no cash for one share.
+    Taken trades risk risk_percent of realized equity, capped by cash.
+    Simultaneous entries are taken in input order.
+    """
+    n = len(entry_ns)
+    order = np.lexsort((np.arange(n), entry_ns))
+    # Plain lists - the walk is sequential and indexes one element at a time
+    symbol, entry_ns, exit_ns, entry_day, exit_day, entry_price, exit_price, stop_loss = (
+        np.asarray(values).tolist()
+        for values in (symbol, entry_ns, exit_ns, entry_day, exit_day, entry_price, exit_price, stop_loss))
+    shares = [0] * n
+    skip = [TAKEN] * n
+
+    cash = equity = float(account_value)
+    open_positions = []  # heap of (exit_ns, candidate)
+    held = set()
+    day, day_start, day_pnl = None, equity, 0.0
+
+    for i in order.tolist():
+        entry_at = entry_ns[i]
+        while open_positions and open_positions[0][0] <= entry_at:
+            _, j = heapq.heappop(open_positions)
+            if exit_day[j] != day:
+                day, day_start, day_pnl = exit_day[j], equity, 0.0
+            pnl = (exit_price[j] - entry_price[j]) * shares[j]
+            cash += exit_price[j] * shares[j]
+            equity += pnl
+            day_pnl += pnl
+            held.discard(symbol[j])
+
+        if entry_day[i] != day:
+            day, day_start, day_pnl = entry_day[i], equity, 0.0
+        if symbol[i] in held:
+            skip[i] = HELD
+            continue
+        if len(open_positions) >= max_positions:
+            skip[i] = FULL
+            continue
+        if daily_loss_limit > 0 and day_pnl <= -day_start * daily_loss_limit / 100:
+            skip[i] = DAILY_LOSS
+            continue
+
+        risk_per_share = entry_price[i] - stop_loss[i]
+        wanted = int(equity * risk_percent / 100 / risk_per_share) if risk_per_share > 0 else 100
+        size = min(wanted, int(cash // entry_price[i]))
+        if size <= 0:
+            skip[i] = NO_CASH
+            continue
+
+        shares[i] = size
+        cash -= entry_price[i] * size
+        held.add(symbol[i])
+        heapq.heappush(open_positions, (exit_ns[i], i))
+
+    shares = np.array(shares, dtype=np.int64)
+    skip = np.array(skip, dtype=np.int8)
+    entry_price, exit_price = np.asarray(entry_price, dtype=np.float64), np.asarray(exit_price, dtype=np.float64)
+    taken = skip == TAKEN
+    return {'taken': taken, 'shares': shares, 'skip': skip,
+            'profit': np.where(taken, (exit_price - entry_price) * shares, 0.0)}
+
+
+@dataclass
+class PortfolioResult:
+    """Trades the account took, what it skipped and its realized equity"""
+    trades: pd.DataFrame
+    equity: pd.Series
+    skipped: Dict[str, int] = field(default_factory=dict)
+    summary: Dict[str, float] = field(default_factory=dict)
+
+
+def run_portfolio_trades(candidates: Dict[str, SymbolTrades], config: TradeConfig) -> PortfolioResult:
+    """Apply the config's account, risk, max_positions and daily loss limits to per-symbol candidate trades"""
+    symbols = [symbol for symbol, (_, trades) in candidates.items() if len(trades.get('entry_pos', ()))]
+    if not symbols:
+        return PortfolioResult(pd.DataFrame(), pd.Series(dtype=float), summary=portfolio_summary(
+            pd.Series(dtype=float), config.account_value, 0, 0))
+
+    def stacked(values):
+        return np.concatenate([values(*candidates[symbol]) for symbol in symbols])
+
+    def days(dates, positions):
+        return session_dates(dates[positions]).astype('datetime64[D]').astype(np.int64)
+
+    symbol_ids = np.concatenate([np.full(len(candidates[symbol][1]['entry_pos']), k)
+                                 for k, symbol in enumerate(symbols)])
+    entry_ns = stacked(lambda dates, trades: dates[trades['entry_pos']].as_unit('ns').asi8)
+    exit_ns = stacked(lambda dates, trades: dates[trades['exit_pos']].as_unit('ns').asi8)
+    result = simulate_portfolio(
+        symbol_ids, entry_ns, exit_ns,
+        stacked(lambda dates, trades: days(dates, trades['entry_pos'])),
+        stacked(lambda dates, trades: days(dates, trades['exit_pos'])),
+        stacked(lambda dates, trades: trades['entry_price']),
+        stacked(lambda dates, trades: trades['exit_price']),
+        stacked(lambda dates, trades: trades['stop_loss']),
+        config.account_value, config.risk_percent, config.max_positions, config.daily_loss_limit,
+    )
+
+    tables, start = [], 0
+    for symbol in symbols:
+        dates, trades = candidates[symbol]
+        count = len(trades['entry_pos'])
+        taken = result['taken'][start:start + count]
+        sized = {key: values[taken] for key, values in trades.items()}
+        sized['shares'] = result['shares'][start:start + count][taken]
+        table = build_trade_table(dates, sized)
+        if not table.empty:
+            table.insert(0, 'Symbol', symbol)
+            tables.append(table)
+        start += count
+    trade_table = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+    if tables:
+        trade_table = trade_table.sort_values(['Entry_Date', 'Symbol'], kind='stable').reset_index(drop=True)
+
+    # Realized equity after each exit, in exit order
+    taken = result['taken']
+    by_exit = np.argsort(exit_ns[taken], kind='stable')
+    equity = pd.Series(config.account_value + np.cumsum(result['profit'][taken][by_exit]),
+                       index=pd.to_datetime(exit_ns[taken][by_exit], utc=True), name='Equity')
+    skipped = {reason: int((result['skip'] == code).sum()) for code, reason in enumerate(SKIP_REASONS) if code}
+    return PortfolioResult(trade_table, equity, skipped,
+                           portfolio_summary(equity, config.account_value, int(taken.sum()), len(taken)))
+
+
+def portfolio_summary(equity: pd.Series, account_value: float, taken: int, candidates: int) -> Dict[str, float]:
+    """Final equity, return and realized drawdown of a portfolio run"""
+    final = float(equity.iloc[-1]) if len(equity) else float(account_value)
+    curve = np.concatenate([[account_value], equity.to_numpy(dtype=np.float64)])
+    peak = np.maximum.accumulate(curve)
+    return {
+        'Candidates': candidates,
+        'Trades': taken,
+        'Final_Equity': final,
+        'Return_Pct': (final / account_value - 1) * 100,
+        'Max_Drawdown_Pct': float(((peak - curve) / peak).max() * 100),
+    }
+
+
+def run_portfolio(histories: Dict[str, pd.DataFrame], config: TradeConfig, period: str = '2y', start=None,
+                  end=None, vix: Optional[pd.Series] = None) -> PortfolioResult:
+    """Backtest one config across symbols as a single account, candidates built as in run_batch"""
+    candidates = {}
+    for symbol, history in histories.items():
+        lo, hi = window_bounds(history, period, start, end)
+        if hi - lo <= WARMUP_BARS:
+            continue
+        bars = {name: history[name].to_numpy(dtype=np.float64) for name in BAR_COLUMNS}
+        trades = evaluate_window(history.index.as_unit('ns').asi8, bars, align_vix(history.index, vix),
+                                 lo, hi, [config])[0]
+        candidates[symbol] = (history.index[lo + WARMUP_BARS:hi], trades)
+    return run_portfolio_trades(candidates, config)
@@ -0,0 +1,149 @@
+"""Background market-data refresh shared by every dashboard session"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from swing_core.bar_store import BarStore
+from swing_core.spans import traced
+
+logger = logging.getLogger(__name__)
+
+# (symbol, interval, data_period)
+SnapshotKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable bars for one key as of one refresh; version increases with every refresh"""
+    version: int
+    history: pd.DataFrame
+    vix: Optional[pd.Series]
+    fetched_at: pd.Timestamp
+
+
+class RefreshWorker:
+    """Daemon thread that polls the bar store for every subscribed key on its own interval
+
+    Sessions read the latest snapshot instead of fetching; the version number
+    tells them whether anything changed since they last drew. Each subscriber
+    of a key keeps its own interval and the key is polled at the smallest one;
+    subscribers that stop renewing for subscriber_ttl seconds no longer count.
+    """
+
+    def __init__(self, store: BarStore, vix_symbol: Optional[str] = '^VIX', subscriber_ttl: float = 600):
+        self.store = store
+        self.vix_symbol = vix_symbol
+        self.subscriber_ttl = subscriber_ttl
+        # key -> subscriber -> (every_seconds, last subscribed)
+        self._intervals: Dict[SnapshotKey, Dict[Hashable, Tuple[float, float]]] = {}
+        self._due: Dict[SnapshotKey, float] = {}
+        self._snapshots: Dict[SnapshotKey, MarketSnapshot] = {}
+        self._version = 0
+        self._changed = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, symbol: str, interval: str, period: str, every_seconds: float,
+                  subscriber: Hashable = None) -> SnapshotKey:
+        """Ask for a key to be refreshed at least every every_seconds, starting the thread on first use
+
+        Calling again renews subscriber's interval; other subscribers' intervals are left alone.
+        """
+        key = (symbol, interval, period)
+        now = time.monotonic()
+        with self._changed:
+            subscribers = self._intervals.setdefault(key, {})
+            for quiet in [other for other, (_, seen) in subscribers.items() if now - seen > self.subscriber_ttl]:
+                del subscribers[quiet]
+            subscribers[subscriber] = (every_seconds, now)
+            # A shorter interval pulls the next poll in; a longer one waits for the current one
+            self._due[key] = min(self._due.get(key, float('inf')), now + self.poll_interval(key))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='market-data-refresh', daemon=True)
+                self._thread.start()
+            self._changed.notify_all()
+        return key
+
+    def unsubscribe(self, key: SnapshotKey, subscriber: Hashable = None):
+        """Drop subscriber's interval for key, or every subscriber when None
+
+        Once nobody is left the key stops refreshing and its snapshot is dropped.
+        """
+        with self._changed:
+            subscribers = self._intervals.get(key, {})
+            if subscriber is not None:
+                subscribers.pop(subscriber, None)
+                if subscribers:
+                    return
+            self._intervals.pop(key, None)
+            self._due.pop(key, None)
+            self._snapshots.pop(key, None)
+
+    def poll_interval(self, key: SnapshotKey) -> Optional[float]:
+        """Smallest interval any current subscriber asked for, None when nobody is subscribed
+
+        If every subscriber has gone quiet, the one seen most recently still sets the pace.
+        """
+        subscribers = self._intervals.get(key)
+        if not subscribers:
+            return None
+        cutoff = time.monotonic() - self.subscriber_ttl
+        live = [seconds for seconds, seen in subscribers.values() if seen >= cutoff]
+        return min(live) if live else max(subscribers.values(), key=lambda interval: interval[1])[0]
+
+    def snapshot(self, key: SnapshotKey) -> Optional[MarketSnapshot]:
+        return self._snapshots.get(key)
+
+    @traced('refresh_worker.refresh')
+    def refresh(self, key: SnapshotKey) -> MarketSnapshot:
+        """Fetch new bars for key now and publish them as the next snapshot"""
+        symbol, interval, period = key
+        history = self.store.load_history(symbol, interval, period, force=True)
+        vix = None
+        if self.vix_symbol:
+            vix_history = self.store.load_history(self.vix_symbol, interval, period, force=True)
+            vix = None if vix_history.empty else vix_history['Close']
+
+        with self._changed:
+            previous = self._snapshots.get(key)
+            if previous is not None and previous.history.equals(history) and \
+                    (vix is None or (previous.vix is not None and previous.vix.equals(vix))):
+                # Nothing new - keep the version so sessions skip redrawing
+                snapshot = previous
+            else:
+                self._version += 1
+                snapshot = MarketSnapshot(self._version, history, vix, pd.Timestamp.now())
+            # Unsubscribed while fetching - hand back the bars but stop tracking the key
+            if key in self._intervals:
+                self._snapshots[key] = snapshot
+                self._due[key] = time.monotonic() + self.poll_interval(key)
+            self._changed.notify_all()
+        return snapshot
+
+    def wait_for_change(self, key: SnapshotKey, version: int, timeout: float) -> Optional[MarketSnapshot]:
+        """Block until key has a snapshot newer than version, or timeout"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._snapshots.get(key) is not None
+                                   and self._snapshots[key].version > version, timeout)
+            return self._snapshots.get(key)
+
+    def _run(self):
+        while True:
+            with self._changed:
+                now = time.monotonic()
+                due = [key for key, at in self._due.items() if at <= now]
+                if not due:
+                    next_at = min(self._due.values(), default=now + 60)
+                    self._changed.wait(max(next_at - now, 0.1))
+                    continue
+            for key in due:
+                try:
+                    self.refresh(key)
+                except Exception:
+                    logger.exception('Refresh failed for %s', key)
+                    with self._changed:
+                        if key in self._intervals:
+                            self._due[key] = time.monotonic() + self.poll_interval(key)
@@ -0,0 +1,132 @@
+"""Multi-symbol watchlist scanner running the six-criteria strategy on stacked arrays"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.indicators import DEFAULT_EMA_PERIODS, EMA_COLUMNS, atr_kernel
+from swing_core.signals import CRITERIA_KEYS, MOMENTUM_LOOKBACK, WARMUP_BARS, entry_criteria
+
+STACKED_COLUMNS = ('High', 'Low', 'Close', 'Volume')
+
+CRITERIA_LABELS = {
+    'ema_alignment': 'EMA Stack',
+    'price_above_50ema': 'Above 50 EMA',
+    'price_touch_entry': 'Entry Touch',
+    'volume_above_avg': 'Volume',
+    'vix_below_threshold': 'VIX',
+    'momentum_positive': 'Momentum',
+}
+
+
+def fetch_watchlist(store, symbols: Sequence[str], period: str = '2y', interval: str = '1d',
+                    max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+    """Load every symbol concurrently through a bounded thread pool, skipping failures"""
+    def load(symbol):
+        try:
+            return symbol, store.load(symbol, interval=interval, period=period)
+        except Exception:
+            return symbol, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(load, symbols)
+    return {symbol: frame for symbol, frame in results if frame is not None and not frame.empty}
+
+
+def stack_bars(frames: Dict[str, pd.DataFrame]) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """Right-align each symbol's bars into (symbols × bars) arrays, NaN-padded on the left
+
+    Each row stays that symbol's own bar sequence, so indicators computed along
+    the bar axis match computing them one symbol at a time.
+    """
+    symbols = list(frames)
+    n_bars = max((len(frame) for frame in frames.values()), default=0)
+    stacked = {column: np.full((len(symbols), n_bars), np.nan) for column in STACKED_COLUMNS}
+    for row, symbol in enumerate(symbols):
+        frame = frames[symbol]
+        for column in STACKED_COLUMNS:
+            stacked[column][row, n_bars - len(frame):] = frame[column].to_numpy(dtype=np.float64)
+    return symbols, stacked
+
+
+def stacked_indicators(stacked: Dict[str, np.ndarray], ema_periods: Sequence[int] = DEFAULT_EMA_PERIODS,
+                       atr_period: int = 14, volume_period: int = 20) -> Dict[str, np.ndarray]:
+    """EMA, ATR and volume average for every symbol at once along the bar axis"""
+    # pandas window kernels work down columns, so hand them the (bars × symbols) view
+    close = pd.DataFrame(stacked['Close'].T)
+    indicators = {
+        column: close.ewm(span=period).mean().to_numpy().T
+        for column, period in zip(EMA_COLUMNS, ema_periods)
+    }
+
+    # The ATR kernel runs along the bar axis of every row at once
+    indicators['ATR'] = atr_kernel(stacked['High'], stacked['Low'], stacked['Close'], atr_period)
+    indicators['Volume_Avg'] = pd.DataFrame(stacked['Volume'].T).rolling(volume_period).mean().to_numpy().T
+    return indicators
+
+
+def evaluate_stacked(stacked: Dict[str, np.ndarray], indicators: Dict[str, np.ndarray],
+                     vix_value: float, vix_threshold: float = 30.0,
+                     entry_multiplier: float = 1.5) -> Dict[str, np.ndarray]:
+    """Evaluate the six entry criteria on the latest bar of every symbol"""
+    close = stacked['Close']
+    criteria = entry_criteria(
+        close[:, -1], stacked['Low'][:, -1], stacked['Volume'][:, -1],
+        *(indicators[column][:, -1] for column in EMA_COLUMNS),
+        indicators['ATR'][:, -1], indicators['Volume_Avg'][:, -1],
+        close[:, -1 - MOMENTUM_LOOKBACK],
+        np.full(len(close), vix_value < vix_threshold),
+        entry_multiplier=entry_multiplier,
+    )
+    criteria['strength'] = np.sum([criteria[key] for key in CRITERIA_KEYS], axis=0)
+    criteria['signal'] = criteria['strength'] == len(CRITERIA_KEYS)
+    # Same minimum history evaluate_signals requires
+    criteria['enough_data'] = np.sum(~np.isnan(close), axis=1) >= WARMUP_BARS
+    return criteria
+
+
+def scan_watchlist(store, symbols: Sequence[str], vix_value: float, period: str = '2y',
+                   vix_threshold: float = 30.0, entry_multiplier: float = 1.5,
+                   ema_periods: Sequence[int] = DEFAULT_EMA_PERIODS, atr_period: int = 14,
+                   volume_period: int = 20, max_workers: int = 8,
+                   chunk_size: int = 64) -> pd.DataFrame:
+    """Fetch, stack and evaluate a watchlist, returning a table ranked by signal strength"""
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+    frames = fetch_watchlist(store, symbols, period=period, max_workers=max_workers)
+    if not frames:
+        return pd.DataFrame()
+
+    def evaluate_chunk(chunk):
+        names, stacked = stack_bars({symbol: frames[symbol] for symbol in chunk})
+        indicators = stacked_indicators(stacked, ema_periods, atr_period, volume_period)
+        return names, stacked, evaluate_stacked(stacked, indicators, vix_value, vix_threshold, entry_multiplier)
+
+    # pandas window kernels and numpy release the GIL, so chunks run in parallel
+    loaded = list(frames)
+    chunks = [loaded[i:i + chunk_size] for i in range(0, len(loaded), chunk_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        evaluated = list(pool.map(evaluate_chunk, chunks))
+
+    rows = []
+    for names, stacked, criteria in evaluated:
+        close = stacked['Close']
+        for i, symbol in enumerate(names):
+            if not criteria['enough_data'][i]:
+                continue
+            entry_level = criteria['entry_level'][i]
+            rows.append({
+                'Symbol': symbol,
+                'Close': round(close[i, -1], 2),
+                'Change_Pct': round((close[i, -1] / close[i, -2] - 1) * 100, 2),
+                'Strength': int(criteria['strength'][i]),
+                'Signal': '🟢 ENTRY' if criteria['signal'][i] else '',
+                **{label: '✅' if criteria[key][i] else '❌' for key, label in CRITERIA_LABELS.items()},
+                'Entry_Level': round(entry_level, 2),
+                'Distance_To_Entry_Pct': round((close[i, -1] / entry_level - 1) * 100, 2),
+            })
+
+    if not rows:
+        return pd.DataFrame()
+    ranked = pd.DataFrame(rows).sort_values(['Strength', 'Distance_To_Entry_Pct'], ascending=[False, True])
+    return ranked.reset_index(drop=True)
@@ -0,0 +1,65 @@
+"""Shared-memory arrays and the process pool used by sweeps and walk-forward runs"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# (name, dtype, shape, byte offset) for every array in a shared block
+Layout = List[Tuple[str, str, Tuple[int, ...], int]]
+
+
+class SharedArrays:
+    """Named arrays copied once into one shared memory block for zero-copy worker access"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.layout: Layout = []
+        offset = 0
+        for name, array in arrays.items():
+            self.layout.append((name, array.dtype.str, array.shape, offset))
+            # Keep every array 8-byte aligned
+            offset += -(-array.nbytes // 8) * 8
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for name, view in self.views(self.shm, self.layout).items():
+            view[...] = arrays[name]
+
+    @staticmethod
+    def views(shm: shared_memory.SharedMemory, layout: Layout) -> Dict[str, np.ndarray]:
+        return {
+            name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            for name, dtype, shape, offset in layout
+        }
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+# Per-worker handle on the parent's shared block
+_worker_shm = None
+_worker_arrays: Dict[str, np.ndarray] = {}
+
+
+def _attach(name: str, layout: Layout):
+    global _worker_shm, _worker_arrays
+    _worker_shm = shared_memory.SharedMemory(name=name, track=False)
+    _worker_arrays = SharedArrays.views(_worker_shm, layout)
+
+
+def worker_arrays() -> Dict[str, np.ndarray]:
+    """Arrays shared by the parent, as seen from inside a pool worker"""
+    return _worker_arrays
+
+
+def process_pool(shared: SharedArrays, max_workers: int, preload: str) -> ProcessPoolExecutor:
+    """Pool whose workers map the shared block on startup
+
+    forkserver never forks the multi-threaded Streamlit server, and preloading
+    keeps numpy/pandas imports out of every worker's startup.
+    """
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([preload])
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                               initializer=_attach, initargs=(shared.shm.name, shared.layout))
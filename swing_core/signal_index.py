@@ -0,0 +1,160 @@
+"""Signal and trade results indexed by data fingerprint and strategy parameters, extended incrementally"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.backtest import build_trade_table, simulate_trades, trade_parameters
+from swing_core.config import TradeConfig
+from swing_core.signals import (
+    INPUT_COLUMNS,
+    MOMENTUM_LOOKBACK,
+    WARMUP_BARS,
+    align_vix,
+    compute_signals,
+    signal_frame,
+    vix_below,
+)
+from swing_core.snapshots import history_fingerprint
+from swing_core.spans import span, traced
+
+TRADE_KEYS = ('entry_pos', 'exit_pos', 'signal_exit', 'exit_reason', 'entry_price', 'exit_price', 'hold_days',
+              'stop_loss', 'target1', 'target2', 'target1_hit', 'target2_hit', 'scale_pos', 'scale_shares', 'shares')
+
+
+def strategy_params(config: TradeConfig) -> tuple:
+    """Every setting the signal frame and trade table depend on, as a hashable key"""
+    return (config.atr_entry_multiplier, config.vix_threshold) + tuple(trade_parameters(config).items())
+
+
+@dataclass
+class IndexedSignals:
+    """Signal frame and trade table for one series as of one data fingerprint"""
+    fingerprint: tuple
+    dates: np.ndarray
+    columns: Dict[str, np.ndarray]
+    criteria: Dict[str, np.ndarray]
+    trades: Dict[str, np.ndarray]
+    signals: pd.DataFrame
+    trade_table: pd.DataFrame
+    # Position of the first bar recomputed when this entry was built, 0 for a full pass
+    recomputed_from: int = 0
+
+
+def first_change(old: IndexedSignals, dates: np.ndarray, columns: Dict[str, np.ndarray]) -> int:
+    """First bar position where the new series differs from the indexed one (NaN equals NaN)"""
+    n = min(len(old.dates), len(dates))
+    differs = old.dates[:n] != dates[:n]
+    for name, values in columns.items():
+        before, after = old.columns[name][:n], values[:n]
+        differs |= ~((before == after) | (np.isnan(before) & np.isnan(after)))
+    changed = np.flatnonzero(differs)
+    return int(changed[0]) if len(changed) else n
+
+
+def _concat(head: Dict[str, np.ndarray], tail: Dict[str, np.ndarray], keys, start: int) -> Dict[str, np.ndarray]:
+    return {key: np.concatenate([head[key][:start], tail[key]]) for key in keys}
+
+
+class SignalIndex:
+    """Per (series, strategy params) signal and trade results, reused while the data fingerprint matches
+
+    series is any caller key for one evolving bar series (e.g. symbol and
+    period). When new bars arrive, criteria are recomputed only from the
+    first changed bar, and trades only from the first entry that had not
+    fully closed before it - earlier trades cannot change.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[Hashable, tuple], IndexedSignals]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @traced('signal_index.lookup')
+    def lookup(self, series: Hashable, data: pd.DataFrame, config: TradeConfig,
+               vix: Optional[pd.Series] = None) -> IndexedSignals:
+        """Signals and trades for data, from the index when nothing changed"""
+        key = (series, strategy_params(config))
+        fingerprint = history_fingerprint(data, vix)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous.fingerprint == fingerprint:
+                self._entries.move_to_end(key)
+                return previous
+
+            with span('signal_index.build'):
+                indexed = self._build(previous, fingerprint, data, config, vix)
+            self._entries[key] = indexed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return indexed
+
+    def _build(self, previous: Optional[IndexedSignals], fingerprint: tuple, data: pd.DataFrame,
+               config: TradeConfig, vix: Optional[pd.Series]) -> IndexedSignals:
+        n = len(data)
+        dates = data.index.as_unit('ns').asi8
+        columns = {name: data[name].to_numpy(dtype=np.float64) for name in INPUT_COLUMNS}
+        # VIX is an input like any bar column, so a revised VIX close is a change too
+        columns['VIX'] = align_vix(data.index, vix)
+
+        start = 0 if previous is None else first_change(previous, dates, columns)
+        if n <= WARMUP_BARS or start <= WARMUP_BARS:
+            start = 0
+
+        # Criteria look back at most MOMENTUM_LOOKBACK bars
+        lo = max(start - MOMENTUM_LOOKBACK, 0)
+        tail = compute_signals({name: values[lo:] for name, values in columns.items()},
+                               config.atr_entry_multiplier,
+                               vix_below(columns['VIX'][lo:], config.vix_threshold), first_bar=lo)
+        tail = {key: values[start - lo:] for key, values in tail.items()}
+        criteria = tail if start == 0 else _concat(previous.criteria, tail, tail.keys(), start)
+
+        signals = signal_frame(data.index, columns, criteria, columns['VIX']) if n > WARMUP_BARS else pd.DataFrame()
+        if signals.empty:
+            return IndexedSignals(fingerprint, dates, columns, criteria, {}, signals, pd.DataFrame(), start)
+
+        keep, trades = self._trades(previous if start else None, start, dates, columns, criteria, config)
+        # Only the re-simulated trades are formatted, the closed ones keep their rows
+        trade_dates = data.index[WARMUP_BARS:]
+        tail = {key: values[keep:] for key, values in trades.items()}
+        trade_table = build_trade_table(trade_dates, tail)
+        if keep:
+            head = previous.trade_table.iloc[:keep]
+            trade_table = pd.concat([head, trade_table], ignore_index=True) if len(trade_table) else head
+        return IndexedSignals(fingerprint, dates, columns, criteria, trades, signals, trade_table, start)
+
+    @staticmethod
+    def _trades(previous: Optional[IndexedSignals], start: int, dates: np.ndarray,
+                columns: Dict[str, np.ndarray], criteria: Dict[str, np.ndarray],
+                config: TradeConfig) -> Tuple[int, Dict[str, np.ndarray]]:
+        """Number of trades kept from previous, and all trades"""
+        # Trades live in signal-frame rows, which start after warmup
+        rows = slice(WARMUP_BARS, None)
+        entry_signal = criteria['entry_signal'][rows]
+        changed = max(start - WARMUP_BARS, 0)
+
+        # Every entry before the first one whose trade had not closed before the change stays as is
+        cut = 0
+        if previous is not None and previous.trades:
+            old = previous.trades
+            closed = old['entry_pos'][old['exit_pos'] < changed]
+            pending = np.setdiff1d(np.flatnonzero(entry_signal[:changed]), closed)
+            cut = int(pending[0]) if len(pending) else changed
+
+        tail = simulate_trades(
+            dates[rows][cut:], columns['Open'][rows][cut:], columns['High'][rows][cut:], columns['Low'][rows][cut:],
+            columns['Close'][rows][cut:], entry_signal[cut:],
+            criteria['exit_signal'][rows][cut:], columns['EMA_5'][rows][cut:], columns['ATR'][rows][cut:],
+            **trade_parameters(config),
+        )
+        tail['entry_pos'] = tail['entry_pos'] + cut
+        tail['exit_pos'] = tail['exit_pos'] + cut
+        tail['scale_pos'] = np.where(tail['scale_pos'] >= 0, tail['scale_pos'] + cut, -1)
+        if previous is None or not previous.trades:
+            return 0, tail
+        keep = int(np.searchsorted(previous.trades['entry_pos'], cut))
+        return keep, _concat(previous.trades, tail, TRADE_KEYS, keep)
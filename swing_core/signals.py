@@ -0,0 +1,172 @@
+"""Vectorized entry/exit signal engine - EXACT STRATEGY IMPLEMENTATION"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Bars needed before the 50 EMA is meaningful
+WARMUP_BARS = 50
+
+# Momentum filter compares against the close this many bars ago
+MOMENTUM_LOOKBACK = 5
+
+# Bar columns the signal engine reads
+INPUT_COLUMNS = ('Open', 'Close', 'High', 'Low', 'Volume', 'EMA_5', 'EMA_10', 'EMA_21', 'EMA_50', 'ATR',
+                 'Volume_Avg')
+
+CRITERIA_KEYS = (
+    'ema_alignment',
+    'price_above_50ema',
+    'price_touch_entry',
+    'volume_above_avg',
+    'vix_below_threshold',
+    'momentum_positive',
+)
+
+SIGNAL_COLUMNS = [
+    'Date', 'Open', 'Close', 'High', 'Low', 'Entry_Signal', 'Exit_Signal',
+    'EMA_Alignment', 'Price_Above_50EMA', 'Entry_Level_Touch', 'Volume_Above_Avg', 'VIX_Below_Threshold',
+    'Momentum_Positive', 'Entry_Level', 'EMA_5', 'EMA_10', 'EMA_21', 'EMA_50', 'ATR', 'Volume', 'Volume_Avg', 'VIX',
+]
+
+
+def entry_criteria(close, low, volume, ema_5, ema_10, ema_21, ema_50, atr, volume_avg,
+                   close_5_ago, vix_below_threshold, entry_multiplier: float = 1.5) -> Dict:
+    """Evaluate the six entry criteria on scalars or whole arrays at once"""
+    # 3. Entry Trigger level: 5 EMA - 1.5×ATR
+    entry_level = ema_5 - (entry_multiplier * atr)
+
+    return {
+        # 1. EMA Stack: 10 EMA > 21 EMA > 50 EMA (bullish momentum)
+        'ema_alignment': (ema_10 > ema_21) & (ema_21 > ema_50),
+        # 2. Price Position: Current price must be above 50 EMA (trend confirmation)
+        'price_above_50ema': close > ema_50,
+        # 3. Entry Trigger: Price touches or dips below (5 EMA - 1.5×ATR)
+        'price_touch_entry': (close <= entry_level) | (low <= entry_level),
+        # 4. Volume Confirmation: Entry day volume > 20-day average volume
+        'volume_above_avg': volume > volume_avg,
+        # 5. Market Environment: VIX below threshold
+        'vix_below_threshold': vix_below_threshold,
+        # 6. Momentum Filter: Price must be higher than 5 days ago
+        'momentum_positive': close > close_5_ago,
+        'entry_level': entry_level,
+    }
+
+
+def exit_criteria(close, prev_close, ema_21):
+    """Simplified historical exit: trend break below 21 EMA or a > 3% down day"""
+    # Exit if price breaks below 21 EMA significantly (3% below indicates trend break)
+    trend_break = close < ema_21 * 0.97
+
+    # Or if we have a significant down day (> 3% drop from previous close)
+    daily_return = (close - prev_close) / prev_close
+    return trend_break | (daily_return < -0.03)
+
+
+def session_dates(index: pd.DatetimeIndex) -> np.ndarray:
+    """Wall-clock session dates as datetime64, so exchanges in different time zones line up"""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize().to_numpy()
+
+
+def align_vix(index: pd.DatetimeIndex, vix: Optional[pd.Series]) -> np.ndarray:
+    """As-of join of daily VIX closes onto bar dates: the latest VIX session on or before each bar"""
+    # Bars before the first VIX session (or without any VIX series) get NaN
+    aligned = np.full(len(index), np.nan)
+    if vix is None:
+        return aligned
+    vix = vix.dropna()
+    position = np.searchsorted(session_dates(vix.index), session_dates(index), side='right') - 1
+    has_vix = position >= 0
+    aligned[has_vix] = vix.to_numpy(dtype=np.float64)[position[has_vix]]
+    return aligned
+
+
+def vix_below(vix: np.ndarray, threshold: float) -> np.ndarray:
+    """5. Market Environment per bar - bars without a VIX reading pass, as before history was joined"""
+    return ~(vix >= threshold)
+
+
+def compute_signals(columns: Dict[str, np.ndarray], entry_multiplier: float = 1.5,
+                    vix_below_threshold=None, first_bar: int = 0) -> Dict[str, np.ndarray]:
+    """Entry/exit masks and criteria for every bar from raw indicator columns
+
+    first_bar is the position of the first column row in the full series,
+    for computing just the tail of a longer one.
+    """
+    close = columns['Close']
+    n = len(close)
+
+    close_5_ago = np.full(n, np.nan)
+    close_5_ago[MOMENTUM_LOOKBACK:] = close[:-MOMENTUM_LOOKBACK]
+    prev_close = np.full(n, np.nan)
+    prev_close[1:] = close[:-1]
+
+    if vix_below_threshold is None:
+        # Historical VIX is not available here - assume a good environment
+        vix_below_threshold = np.ones(n, dtype=bool)
+
+    criteria = entry_criteria(
+        close, columns['Low'], columns['Volume'],
+        columns['EMA_5'], columns['EMA_10'], columns['EMA_21'], columns['EMA_50'],
+        columns['ATR'], columns['Volume_Avg'], close_5_ago, vix_below_threshold,
+        entry_multiplier=entry_multiplier,
+    )
+
+    # Momentum needs 5 bars of history past warmup, otherwise it passes
+    bar_number = first_bar + np.arange(n)
+    criteria['momentum_positive'] = np.where(
+        bar_number >= WARMUP_BARS + MOMENTUM_LOOKBACK, criteria['momentum_positive'], True
+    )
+
+    # ENTRY SIGNAL: ALL 6 CRITERIA MUST BE MET
+    criteria['entry_signal'] = np.logical_and.reduce([criteria[key] for key in CRITERIA_KEYS])
+    criteria['exit_signal'] = exit_criteria(close, prev_close, columns['EMA_21'])
+    return criteria
+
+
+def calculate_signal_frame(data: pd.DataFrame, entry_multiplier: float = 1.5, vix: Optional[pd.Series] = None,
+                           vix_threshold: float = 30.0) -> pd.DataFrame:
+    """Calculate entry and exit signals for every bar after warmup in one columnar pass"""
+    n = len(data)
+    if n <= WARMUP_BARS:
+        return pd.DataFrame()
+
+    columns = {
+        name: data[name].to_numpy(dtype=np.float64)
+        for name in INPUT_COLUMNS
+    }
+    vix_values = align_vix(data.index, vix)
+    criteria = compute_signals(columns, entry_multiplier, vix_below(vix_values, vix_threshold))
+    return signal_frame(data.index, columns, criteria, vix_values)
+
+
+def signal_frame(index: pd.DatetimeIndex, columns: Dict[str, np.ndarray],
+                 criteria: Dict[str, np.ndarray], vix_values: np.ndarray) -> pd.DataFrame:
+    """Signal table for every bar after warmup from computed criteria arrays"""
+    rows = slice(WARMUP_BARS, len(index))
+    return pd.DataFrame({
+        'Date': index[rows],
+        'Open': columns['Open'][rows],
+        'Close': columns['Close'][rows],
+        'High': columns['High'][rows],
+        'Low': columns['Low'][rows],
+        'Entry_Signal': criteria['entry_signal'][rows],
+        'Exit_Signal': criteria['exit_signal'][rows],
+        'EMA_Alignment': criteria['ema_alignment'][rows],
+        'Price_Above_50EMA': criteria['price_above_50ema'][rows],
+        'Entry_Level_Touch': criteria['price_touch_entry'][rows],
+        'Volume_Above_Avg': criteria['volume_above_avg'][rows],
+        'VIX_Below_Threshold': criteria['vix_below_threshold'][rows],
+        'Momentum_Positive': criteria['momentum_positive'][rows],
+        'Entry_Level': criteria['entry_level'][rows],
+        'EMA_5': columns['EMA_5'][rows],
+        'EMA_10': columns['EMA_10'][rows],
+        'EMA_21': columns['EMA_21'][rows],
+        'EMA_50': columns['EMA_50'][rows],
+        'ATR': columns['ATR'][rows],
+        'Volume': columns['Volume'][rows],
+        'Volume_Avg': columns['Volume_Avg'][rows],
+        'VIX': vix_values[rows],
+    })
@@ -0,0 +1,144 @@
+"""Process-wide market data with indicators, shared read-only by every session"""
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from swing_core.bar_store import slice_period
+from swing_core.indicators import IndicatorState
+from swing_core.refresh import SnapshotKey
+from swing_core.spans import span
+
+# Sessions share one frame per key, which is only safe with copy-on-write:
+# always on from pandas 3, opt-in on the pandas 2 releases pyproject allows
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# (ema_periods, atr_period, volume_period)
+IndicatorPeriods = Tuple[Tuple[int, ...], int, int]
+
+
+@dataclass(frozen=True)
+class SharedSnapshot:
+    """Bars with indicator columns for one key, never mutated once published
+
+    Every caller gets a shallow copy of the published frame; with
+    copy-on-write (switched on above for pandas 2) a session that modifies
+    its copy gets its own columns and the shared ones never change.
+    """
+    data: pd.DataFrame
+    vix: Optional[pd.Series]
+    fingerprint: tuple
+
+
+@dataclass
+class _Entry:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    indicators: Dict[IndicatorPeriods, IndicatorState] = field(default_factory=dict)
+    snapshots: Dict[IndicatorPeriods, SharedSnapshot] = field(default_factory=dict)
+    idle_since: Optional[float] = None
+
+
+def history_fingerprint(history: pd.DataFrame, vix: Optional[pd.Series] = None) -> tuple:
+    """Cheap identity of a bar frame: length, end points and the last (possibly forming) bar"""
+    if history.empty:
+        return (0,)
+    last = tuple(history[['Open', 'High', 'Low', 'Close', 'Volume']].iloc[-1])
+    vix_last = None if vix is None or vix.empty else (vix.index[-1], vix.iloc[-1])
+    return (len(history), history.index[0], history.index[-1], last, vix_last)
+
+
+class SnapshotRegistry:
+    """One shared snapshot per (symbol, interval, data_period), reference counted by session
+
+    A holder (one browser session) holds a single key at a time; switching
+    symbol releases the old one. Holders that stop renewing for ttl_seconds
+    are treated as closed, and keys nobody has held for ttl_seconds are
+    evicted, so memory follows the number of distinct keys, not sessions.
+    subscription maps a key to the refresh subscription its bars come from
+    (several keys may share one); on_evict is called with a subscription
+    once the last key built on it is evicted, e.g. to stop refreshing it.
+    """
+
+    def __init__(self, ttl_seconds: float = 600, on_evict: Optional[Callable[[SnapshotKey], None]] = None,
+                 subscription: Callable[[SnapshotKey], SnapshotKey] = lambda key: key):
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self.subscription = subscription
+        self._entries: Dict[SnapshotKey, _Entry] = {}
+        self._subscribers: Counter = Counter()  # subscription -> keys with an entry built on it
+        self._holders: Dict[str, Tuple[SnapshotKey, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, holder: str, key: SnapshotKey):
+        """Hold key for holder (renewing its lease), releasing whatever it held before"""
+        now = time.monotonic()
+        with self._lock:
+            self._holders[holder] = (key, now)
+            self._entry(key).idle_since = None
+            self._evict(now)
+
+    def release(self, holder: str):
+        with self._lock:
+            self._holders.pop(holder, None)
+            self._evict(time.monotonic())
+
+    def refcount(self, key: SnapshotKey) -> int:
+        with self._lock:
+            return sum(held == key for held, _ in self._holders.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self, key: SnapshotKey, periods: IndicatorPeriods,
+                 history: pd.DataFrame, vix: Optional[pd.Series] = None) -> SharedSnapshot:
+        """The shared frame for history, computing indicators only when its bars changed"""
+        with self._lock:
+            entry = self._entry(key)
+
+        fingerprint = history_fingerprint(history, vix)
+        with entry.lock:
+            current = entry.snapshots.get(periods)
+            if current is not None and current.fingerprint == fingerprint:
+                return replace(current, data=current.data.copy(deep=False))
+
+            # New bars update the shared indicator state in O(1) per bar
+            state = entry.indicators.get(periods)
+            if state is None:
+                state = entry.indicators[periods] = IndicatorState(*periods)
+            with span('indicators'):
+                data = slice_period(history.join(state.update(history)), key[2])
+            snapshot = SharedSnapshot(data, vix, fingerprint)
+            entry.snapshots[periods] = snapshot
+            return replace(snapshot, data=data.copy(deep=False))
+
+    def _entry(self, key: SnapshotKey) -> _Entry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+            self._subscribers[self.subscription(key)] += 1
+        return entry
+
+    def _evict(self, now: float):
+        expired = [holder for holder, (_, seen) in self._holders.items() if now - seen > self.ttl_seconds]
+        for holder in expired:
+            del self._holders[holder]
+
+        held = {key for key, _ in self._holders.values()}
+        for key in list(self._entries):
+            entry = self._entries[key]
+            if key in held:
+                continue
+            if entry.idle_since is None:
+                entry.idle_since = now
+            elif now - entry.idle_since > self.ttl_seconds:
+                del self._entries[key]
+                subscription = self.subscription(key)
+                self._subscribers[subscription] -= 1
+                if self._subscribers[subscription] == 0:
+                    del self._subscribers[subscription]
+                    if self.on_evict is not None:
+                        self.on_evict(subscription)
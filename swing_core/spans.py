@@ -0,0 +1,176 @@
+"""Lightweight timing spans for the hot paths: per-run breakdowns and Prometheus-style counters
+
+Spans cost two global reads while nothing is listening. A run is
+recorded by wrapping it in recording(); process-wide counters start once
+enable_metrics() is called.
+"""
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Local(threading.local):
+    # A class default keeps the lookup cheap on threads that never record
+    recorder = None
+
+
+_local = _Local()
+_metrics = None
+# Recordings open on any thread; zero lets span() skip the thread-local lookup
+_recordings = 0
+_counter_lock = threading.Lock()
+
+
+@dataclass
+class SpanRecord:
+    """One finished span; start is milliseconds after the recording began"""
+    name: str
+    depth: int
+    start_ms: float
+    duration_ms: float = 0.0
+
+
+class SpanRecorder:
+    """Spans finished during one script run, in start order"""
+
+    def __init__(self):
+        self.records: List[SpanRecord] = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def _open(self, name: str, start: float) -> SpanRecord:
+        record = SpanRecord(name, self._depth, (start - self._origin) * 1000)
+        self.records.append(record)
+        self._depth += 1
+        return record
+
+    def _close(self, record: SpanRecord, seconds: float):
+        record.duration_ms = seconds * 1000
+        self._depth -= 1
+
+    def log(self, **fields):
+        """Emit the run as one structured JSON log line"""
+        logger.info(json.dumps({
+            **fields,
+            'spans': [{'name': r.name, 'depth': r.depth, 'start_ms': round(r.start_ms, 3),
+                       'duration_ms': round(r.duration_ms, 3)} for r in self.records],
+        }))
+
+
+class SpanMetrics:
+    """Process-wide call counts and cumulative seconds per span name"""
+
+    def __init__(self, prefix: str = 'swing'):
+        self.prefix = prefix
+        self._calls: Dict[str, int] = {}
+        self._seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def exposition(self) -> str:
+        """Counters in the Prometheus text format"""
+        with self._lock:
+            calls, seconds = dict(self._calls), dict(self._seconds)
+        lines = [
+            f'# HELP {self.prefix}_span_calls_total Completed spans by name.',
+            f'# TYPE {self.prefix}_span_calls_total counter',
+        ]
+        lines += [f'{self.prefix}_span_calls_total{{span="{name}"}} {count}' for name, count in sorted(calls.items())]
+        lines += [
+            f'# HELP {self.prefix}_span_seconds_total Time spent in spans by name.',
+            f'# TYPE {self.prefix}_span_seconds_total counter',
+        ]
+        lines += [f'{self.prefix}_span_seconds_total{{span="{name}"}} {total:.6f}'
+                  for name, total in sorted(seconds.items())]
+        return '\n'.join(lines) + '\n'
+
+
+def enable_metrics(metrics: Optional[SpanMetrics]):
+    """Feed every span in the process into metrics, or stop with None"""
+    global _metrics
+    _metrics = metrics
+
+
+class _Span:
+    __slots__ = ('name', 'recorder', 'record', 'start')
+
+    def __init__(self, name: str, recorder: Optional[SpanRecorder]):
+        self.name = name
+        self.recorder = recorder
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        if self.recorder is not None:
+            self.record = self.recorder._open(self.name, self.start)
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        if self.recorder is not None:
+            self.recorder._close(self.record, seconds)
+        metrics = _metrics
+        if metrics is not None:
+            metrics.observe(self.name, seconds)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Context manager timing a block under name, a shared no-op when nothing is listening"""
+    if not _recordings and _metrics is None:
+        return _NULL_SPAN
+    recorder = _local.recorder
+    if recorder is None and _metrics is None:
+        return _NULL_SPAN
+    return _Span(name, recorder)
+
+
+def traced(name: str):
+    """Decorator form of span"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def recording(recorder: Optional[SpanRecorder] = None):
+    """Record spans started on this thread into recorder for the duration of the block"""
+    global _recordings
+    recorder = recorder or SpanRecorder()
+    previous = _local.recorder
+    _local.recorder = recorder
+    with _counter_lock:
+        _recordings += 1
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
+        with _counter_lock:
+            _recordings -= 1
@@ -0,0 +1,172 @@
+"""Walk-forward analysis: rolling in-sample selection, out-of-sample evaluation"""
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from swing_core.backtest import build_trade_table, simulate_trades, trade_parameters
+from swing_core.config import TradeConfig
+from swing_core.indicators import INDICATOR_COLUMNS
+from swing_core.optimizer import BAR_COLUMNS, indicator_columns, indicator_key, summarize_trades
+from swing_core.shared import SharedArrays, process_pool, worker_arrays
+from swing_core.signals import WARMUP_BARS, align_vix, compute_signals, vix_below
+
+# (train_start, test_start, test_end) bar positions
+Window = Tuple[int, int, int]
+
+
+@dataclass
+class WalkForwardResult:
+    """Per-window selections, out-of-sample trades and the stitched equity curve"""
+    windows: pd.DataFrame
+    trades: pd.DataFrame
+    equity: pd.Series
+
+
+def walk_forward_windows(n_bars: int, train_bars: int, test_bars: int, start: int = WARMUP_BARS) -> List[Window]:
+    """Rolling windows that step forward by one test period at a time"""
+    windows = []
+    train_start = start
+    while train_start + train_bars < n_bars:
+        test_start = train_start + train_bars
+        windows.append((train_start, test_start, min(test_start + test_bars, n_bars)))
+        train_start += test_bars
+    return windows
+
+
+def precompute_signals(data: pd.DataFrame, configs: Sequence[TradeConfig], vix: Optional[pd.Series] = None,
+                       indicators: Optional[TradeConfig] = None) -> Dict[str, np.ndarray]:
+    """Indicators once per indicator group and signals once per config, over the full history
+
+    Both are causal, so slicing them per window gives the same values as
+    recomputing inside the window, without re-running any EMA. indicators
+    is the config data's own indicator columns were computed with, if any,
+    as in run_sweep.
+    """
+    warmed = None if indicators is None else indicator_key(indicators)
+    bars = {name: data[name].to_numpy(dtype=np.float64)
+            for name in BAR_COLUMNS + (INDICATOR_COLUMNS if warmed is not None else ())}
+    keys = list(dict.fromkeys(indicator_key(config) for config in configs))
+    columns = {key: indicator_columns(bars, next(c for c in configs if indicator_key(c) == key), warmed)
+               for key in keys}
+
+    n = len(data)
+    vix_values = align_vix(data.index, vix)
+    entry = np.zeros((len(configs), n), dtype=bool)
+    exit_ = np.zeros((len(configs), n), dtype=bool)
+    for i, config in enumerate(configs):
+        signals = compute_signals(columns[indicator_key(config)], config.atr_entry_multiplier,
+                                  vix_below(vix_values, config.vix_threshold))
+        entry[i], exit_[i] = signals['entry_signal'], signals['exit_signal']
+
+    return {
+        'dates': data.index.as_unit('ns').asi8,
+        'open': bars['Open'],
+        'high': bars['High'],
+        'low': bars['Low'],
+        'close': bars['Close'],
+        'ema_5': np.stack([columns[key]['EMA_5'] for key in keys]),
+        'atr': np.stack([columns[key]['ATR'] for key in keys]),
+        'group': np.array([keys.index(indicator_key(config)) for config in configs]),
+        'entry': entry,
+        'exit': exit_,
+    }
+
+
+def _simulate(arrays: Dict[str, np.ndarray], config_index: int, config: TradeConfig,
+              rows: slice, entry: np.ndarray) -> Dict[str, np.ndarray]:
+    group = arrays['group'][config_index]
+    return simulate_trades(
+        arrays['dates'][rows], arrays['open'][rows], arrays['high'][rows], arrays['low'][rows],
+        arrays['close'][rows], entry, arrays['exit'][config_index, rows],
+        arrays['ema_5'][group, rows], arrays['atr'][group, rows], **trade_parameters(config)
+    )
+
+
+def evaluate_window(arrays: Dict[str, np.ndarray], configs: Sequence[TradeConfig], window: Window,
+                    objective: str = 'Total_PnL') -> Tuple[int, Dict[str, float], Dict[str, np.ndarray]]:
+    """Pick the best config in-sample, then trade it out-of-sample"""
+    train_start, test_start, test_end = window
+
+    # In-sample: entries and exits confined to the training window
+    train = slice(train_start, test_start)
+    best, best_metrics = 0, None
+    for i, config in enumerate(configs):
+        metrics = summarize_trades(_simulate(arrays, i, config, train, arrays['entry'][i, train]))
+        if best_metrics is None or metrics[objective] > best_metrics[objective]:
+            best, best_metrics = i, metrics
+
+    # Out-of-sample: only test-window entries, but open trades may exit after it
+    test = slice(test_start, None)
+    entry = arrays['entry'][best, test].copy()
+    entry[test_end - test_start:] = False
+    trades = _simulate(arrays, best, configs[best], test, entry)
+    trades['entry_pos'] = trades['entry_pos'] + test_start
+    trades['exit_pos'] = trades['exit_pos'] + test_start
+    trades['scale_pos'] = np.where(trades['scale_pos'] >= 0, trades['scale_pos'] + test_start, -1)
+    return best, best_metrics, trades
+
+
+def _evaluate_window_shared(configs: Sequence[TradeConfig], window: Window, objective: str):
+    return evaluate_window(worker_arrays(), configs, window, objective)
+
+
+def run_walk_forward(data: pd.DataFrame, configs: Sequence[TradeConfig], train_bars: int = 252,
+                     test_bars: int = 63, objective: str = 'Total_PnL',
+                     max_workers: Optional[int] = None, vix: Optional[pd.Series] = None,
+                     indicators: Optional[TradeConfig] = None) -> Optional[WalkForwardResult]:
+    """Walk-forward over rolling train/test windows with windows evaluated in parallel
+
+    indicators names the config data's indicator columns were computed with, as in run_sweep.
+    """
+    configs = list(configs)
+    windows = walk_forward_windows(len(data), train_bars, test_bars)
+    if not configs or not windows:
+        return None
+
+    arrays = precompute_signals(data, configs, vix, indicators)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(windows) == 1:
+        results = [evaluate_window(arrays, configs, window, objective) for window in windows]
+    else:
+        shared = SharedArrays(arrays)
+        try:
+            with process_pool(shared, min(max_workers, len(windows)), __name__) as pool:
+                futures = [pool.submit(_evaluate_window_shared, configs, window, objective) for window in windows]
+                results = [future.result() for future in futures]
+        finally:
+            shared.close()
+
+    params = pd.DataFrame([vars(config) for config in configs])
+    varying = [column for column in params.columns if params[column].nunique() > 1]
+
+    dates = data.index
+    rows, tables = [], []
+    realized = np.zeros(len(data))
+    for number, ((train_start, test_start, test_end), (best, train_metrics, trades)) in enumerate(
+            zip(windows, results), start=1):
+        profit = (trades['exit_price'] - trades['entry_price']) * trades['shares']
+        np.add.at(realized, trades['exit_pos'], profit)
+
+        rows.append({
+            'Window': number,
+            'Train_Start': dates[train_start].strftime('%Y-%m-%d'),
+            'Test_Start': dates[test_start].strftime('%Y-%m-%d'),
+            'Test_End': dates[test_end - 1].strftime('%Y-%m-%d'),
+            **{column: getattr(configs[best], column) for column in varying},
+            f'Train_{objective}': train_metrics[objective],
+            'Test_Trades': len(profit),
+            'Test_PnL': profit.sum(),
+        })
+        table = build_trade_table(dates, trades)
+        if not table.empty:
+            tables.append(table.assign(Window=number))
+
+    # Out-of-sample equity is realized P&L stitched across test windows, at exit dates
+    first_test = windows[0][1]
+    equity = pd.Series(np.cumsum(realized)[first_test:], index=dates[first_test:], name='OOS_Equity')
+    trades_df = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+    return WalkForwardResult(pd.DataFrame(rows), trades_df, equity)
+
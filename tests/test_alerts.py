@@ -0,0 +1,35 @@
+"""Alert ring and its JSON-lines file"""
+from datetime import datetime, timedelta
+
+from swing_core.alerts import AlertStore, TradingAlert
+
+START = datetime(2024, 1, 2, 9, 30)
+
+
+def alert(i: int) -> TradingAlert:
+    return TradingAlert(START + timedelta(minutes=i), 'info', f'alert {i}', 100.0 + i)
+
+
+def file_lines(path) -> int:
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+def test_file_is_compacted_at_twice_capacity(tmp_path):
+    path = str(tmp_path / 'alerts.jsonl')
+    store = AlertStore(capacity=5, path=path)
+    for i in range(9):
+        store.add(alert(i))
+    assert file_lines(path) == 9
+
+    # The tenth line triggers the rewrite down to the five held alerts
+    store.add(alert(9))
+    assert file_lines(path) == 5
+    for i in range(10, 23):
+        store.add(alert(i))
+    assert file_lines(path) <= 10
+    assert len(store) == 5
+
+    reloaded = AlertStore(capacity=5, path=path)
+    assert [a.message for a in reloaded.latest(5)] == [f'alert {i}' for i in range(22, 17, -1)]
+    assert reloaded.count(START.date()) == 5
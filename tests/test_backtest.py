@@ -0,0 +1,82 @@
+"""Exit resolution along the bar path in the trade kernel"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from swing_core.backtest import EXIT_STOP, EXIT_TIME, simulate_trades
+
+N_BARS = 15
+
+
+def path(**overrides) -> dict:
+    """Flat 100 bars with one entry on the first: stop 98, Target 1 at 102, Target 2 at 103"""
+    arrays = {
+        'dates_ns': pd.date_range('2024-01-01', periods=N_BARS, freq='D').as_unit('ns').asi8,
+        'open_': np.full(N_BARS, 100.0),
+        'high': np.full(N_BARS, 100.5),
+        'low': np.full(N_BARS, 99.5),
+        'close': np.full(N_BARS, 100.0),
+        'entry_signal': np.arange(N_BARS) == 0,
+        'exit_signal': np.zeros(N_BARS, dtype=bool),
+        'ema_5': np.full(N_BARS, 100.0),
+        'atr': np.full(N_BARS, 1.0),
+    }
+    arrays.update(overrides)
+    return arrays
+
+
+def scaled_path() -> dict:
+    """Target 1 on bar 2, then the rest drifts at 101 above breakeven until the 10-day exit"""
+    arrays = path()
+    arrays['high'][2] = 102.5
+    arrays['open_'][3:], arrays['high'][3:], arrays['low'][3:], arrays['close'][3:] = 101.0, 101.5, 100.5, 101.0
+    return arrays
+
+
+@pytest.mark.parametrize('account_value, risk_percent, shares', [(100000, 1.0, 500), (1000, 0.1, 0)])
+def test_scale_out_exit_price_does_not_depend_on_shares(account_value, risk_percent, shares):
+    trades = simulate_trades(**scaled_path(), account_value=account_value, risk_percent=risk_percent)
+
+    assert trades['shares'].tolist() == [shares]
+    assert trades['target1_hit'].tolist() == [True]
+    assert trades['exit_reason'].tolist() == [EXIT_TIME]
+    # Half at Target 1 (102), half at the 10-day close (101)
+    np.testing.assert_allclose(trades['exit_price'], [101.5])
+
+
+def test_zero_shares_without_scale_out_exit_at_close():
+    arrays = path()
+    arrays['close'][1:] = 101.0
+    trades = simulate_trades(**arrays, account_value=1000, risk_percent=0.1)
+
+    assert trades['shares'].tolist() == [0]
+    np.testing.assert_allclose(trades['exit_price'], [101.0])
+
+
+def test_stop_gapped_through_fills_at_open():
+    arrays = path()
+    arrays['open_'][2], arrays['high'][2], arrays['low'][2] = 96.0, 97.0, 95.5
+    trades = simulate_trades(**arrays)
+
+    assert trades['exit_reason'].tolist() == [EXIT_STOP]
+    np.testing.assert_allclose(trades['exit_price'], [96.0])
+
+
+def test_target_gapped_through_fills_at_open():
+    arrays = scaled_path()
+    arrays['open_'][2], arrays['high'][2], arrays['low'][2] = 102.6, 102.9, 102.4
+    trades = simulate_trades(**arrays)
+
+    assert trades['target1_hit'].tolist() == [True]
+    np.testing.assert_allclose(trades['exit_price'], [(102.6 + 101.0) / 2])
+
+
+@pytest.mark.parametrize('open_, stopped', [(100.0, True), (102.5, False)])
+def test_stop_and_target_on_one_bar(open_, stopped):
+    # The stop is taken first unless the bar opened through Target 1
+    arrays = scaled_path()
+    arrays['open_'][2], arrays['low'][2] = open_, 97.5
+    trades = simulate_trades(**arrays)
+
+    assert trades['target1_hit'].tolist() == [not stopped]
+    np.testing.assert_allclose(trades['exit_price'], [98.0 if stopped else (102.5 + 101.0) / 2])
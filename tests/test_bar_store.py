@@ -0,0 +1,78 @@
+"""Bar store fetch, merge and per-key locking"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core.bar_store import OVERLAP_BARS, BarStore
+
+BARS = random_walk_bars(300, seed=3)
+
+
+class SlowProvider:
+    """Serves BARS[:available] after a fixed delay, recording every call"""
+
+    def __init__(self, delay: float = 0.0, available: int = 250):
+        self.delay = delay
+        self.available = available
+        self.bars = BARS
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def history(self, symbol, interval, period=None, start=None):
+        with self._lock:
+            self.calls.append((symbol, period, start))
+        time.sleep(self.delay)
+        bars = self.bars.iloc[:self.available]
+        return bars if start is None else bars[bars.index >= start]
+
+
+def test_refresh_appends_new_bars(tmp_path):
+    provider = SlowProvider()
+    store = BarStore(tmp_path, provider, min_refresh_seconds=0)
+    assert len(store.load_history('QQQ', period='max')) == 250
+
+    provider.available = 260
+    bars = store.load_history('QQQ', period='max')
+    assert provider.calls[-1][2] == BARS.index[250 - OVERLAP_BARS]
+    pd.testing.assert_frame_equal(bars, BARS.iloc[:260], check_freq=False)
+    pd.testing.assert_frame_equal(store.read('QQQ')[0], BARS.iloc[:260], check_freq=False)
+
+
+def test_adjusted_history_replaces_stored_bars(tmp_path):
+    provider = SlowProvider()
+    store = BarStore(tmp_path, provider, min_refresh_seconds=0)
+    store.load_history('QQQ', period='max')
+
+    # A 10:1 split: the source now reports every past price divided by ten
+    split = BARS.copy()
+    split[['Open', 'High', 'Low', 'Close']] /= 10
+    provider.bars, provider.available = split, 260
+    bars = store.load_history('QQQ', period='max')
+    pd.testing.assert_frame_equal(bars, split.iloc[:260], check_freq=False)
+    pd.testing.assert_frame_equal(store.read('QQQ')[0], split.iloc[:260], check_freq=False)
+    assert provider.calls[-1][1] == 'max'
+
+
+def test_fresh_store_skips_the_provider(tmp_path):
+    provider = SlowProvider()
+    BarStore(tmp_path, provider).load_history('QQQ', period='max')
+    BarStore(tmp_path, provider, min_refresh_seconds=3600).load_history('QQQ', period='max')
+    assert len(provider.calls) == 1
+
+
+def test_keys_fetch_concurrently(tmp_path):
+    provider = SlowProvider(delay=0.5)
+    store = BarStore(tmp_path, provider, min_refresh_seconds=0)
+    symbols = [f'S{i}' for i in range(8)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(len(symbols)) as pool:
+        results = list(pool.map(lambda symbol: store.load_history(symbol, period='max'), symbols))
+    elapsed = time.perf_counter() - started
+
+    assert all(len(bars) == 250 for bars in results)
+    # One provider delay, not eight back to back
+    assert elapsed < 2.0
@@ -0,0 +1,21 @@
+"""Backtest windows of a symbol's history"""
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core.batch import window_bounds
+
+HISTORY = random_walk_bars(300, seed=5)
+
+
+@pytest.mark.parametrize('start, end', [
+    ('2000-03-01', '2000-06-30'),
+    (pd.Timestamp('2000-03-01', tz='America/New_York'), pd.Timestamp('2000-06-30', tz='America/New_York')),
+    # Midnight in New York, given in UTC
+    (pd.Timestamp('2000-03-01 05:00', tz='UTC'), pd.Timestamp('2000-06-30 04:00', tz='UTC')),
+])
+def test_window_bounds_accepts_naive_and_aware_dates(start, end):
+    lo, hi = window_bounds(HISTORY, 'max', start, end)
+    window = HISTORY.index[lo:hi]
+    assert window[0] == pd.Timestamp('2000-03-01', tz='America/New_York')
+    assert window[-1] == pd.Timestamp('2000-06-30', tz='America/New_York')
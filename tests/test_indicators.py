@@ -0,0 +1,112 @@
+"""Batch ATR kernel and streaming indicator state against the pandas definitions"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core.indicators import INDICATOR_COLUMNS, AtrState, IndicatorState, add_indicators, atr_kernel
+
+BARS = random_walk_bars(400, seed=4)
+
+
+def pandas_true_range(bars: pd.DataFrame) -> pd.Series:
+    prev_close = bars['Close'].shift()
+    return pd.concat([bars['High'] - bars['Low'], (bars['High'] - prev_close).abs(),
+                      (bars['Low'] - prev_close).abs()], axis=1).max(axis=1, skipna=False)
+
+
+def with_gaps(bars: pd.DataFrame) -> pd.DataFrame:
+    """Bars with a few missing highs, lows and closes"""
+    bars = bars.copy()
+    for column, rows in (('High', [30, 31]), ('Low', [120]), ('Close', [200])):
+        bars.iloc[rows, bars.columns.get_loc(column)] = np.nan
+    return bars
+
+
+def kernel_atr(bars: pd.DataFrame, period: int, smoothing: str = 'sma') -> np.ndarray:
+    return atr_kernel(*(bars[c].to_numpy() for c in ('High', 'Low', 'Close')), period, smoothing)
+
+
+def batch_indicators(bars: pd.DataFrame) -> pd.DataFrame:
+    return add_indicators(bars[['High', 'Low', 'Close', 'Volume']].copy())[list(INDICATOR_COLUMNS)]
+
+
+@pytest.mark.parametrize('period, rtol', [(1, 0.0), (2, 0.0), (5, 0.0), (14, 0.0), (50, 1e-14), (100, 1e-14)])
+@pytest.mark.parametrize('gaps', [False, True])
+def test_sma_matches_rolling_mean(period, rtol, gaps):
+    # Exact at short periods; long windows differ from pandas' running sum only in the last bits
+    bars = with_gaps(BARS) if gaps else BARS
+    expected = pandas_true_range(bars).rolling(period).mean().to_numpy()
+    np.testing.assert_allclose(kernel_atr(bars, period), expected, rtol=rtol, atol=0.0)
+
+
+@pytest.mark.parametrize('period', [2, 14, 30])
+@pytest.mark.parametrize('gaps', [False, True])
+def test_wilder_matches_ewm(period, gaps):
+    bars = with_gaps(BARS) if gaps else BARS
+    tr = pandas_true_range(bars)
+    sma = tr.rolling(period).mean()
+
+    # Seeded with the first full window's mean, then alpha = 1/period, carried over bars without a true range
+    seeded = tr.copy()
+    seeded.iloc[:period + 1] = np.nan
+    seeded.iloc[period] = sma.iloc[period]
+    expected = seeded.ewm(alpha=1 / period, adjust=False, ignore_na=True).mean()
+    expected.iloc[:period] = np.nan
+    np.testing.assert_allclose(kernel_atr(bars, period, 'wilder'), expected.to_numpy(), rtol=1e-12)
+
+
+@pytest.mark.parametrize('smoothing', ['sma', 'wilder'])
+def test_rows_match_single_series(smoothing):
+    symbols = [with_gaps(BARS), random_walk_bars(400, seed=5), random_walk_bars(400, seed=6)]
+    stacked = [np.stack([bars[c].to_numpy() for bars in symbols]) for c in ('High', 'Low', 'Close')]
+    out = atr_kernel(*stacked, 14, smoothing)
+    for row, bars in zip(out, symbols):
+        np.testing.assert_array_equal(row, kernel_atr(bars, 14, smoothing))
+
+
+@pytest.mark.parametrize('smoothing, rtol', [('sma', 0.0), ('wilder', 1e-12)])
+def test_streaming_atr_matches_kernel(smoothing, rtol):
+    bars = with_gaps(BARS)
+    state = AtrState(14, smoothing)
+    pushed = [state.push(*row) for row in bars[['High', 'Low', 'Close']].itertuples(index=False)]
+    np.testing.assert_allclose(pushed, kernel_atr(bars, 14, smoothing), rtol=rtol, atol=0.0)
+
+
+def test_appended_bars_match_batch():
+    state = IndicatorState()
+    state.update(BARS.iloc[:300])
+    for end in (301, 310, 400):
+        actual = state.update(BARS.iloc[:end])
+        pd.testing.assert_frame_equal(actual, batch_indicators(BARS.iloc[:end]), rtol=1e-9)
+
+
+def test_revised_last_bar_matches_batch():
+    state = IndicatorState()
+    state.update(BARS.iloc[:300])
+
+    revised = BARS.iloc[:300].copy()
+    revised.iloc[-1, revised.columns.get_loc('Close')] *= 1.02
+    revised.iloc[-1, revised.columns.get_loc('High')] *= 1.02
+    revised.iloc[-1, revised.columns.get_loc('Volume')] += 1000
+    pd.testing.assert_frame_equal(state.update(revised), batch_indicators(revised), rtol=1e-9)
+
+    # Revising again and then appending starts from the revised bar
+    appended = pd.concat([revised, BARS.iloc[300:305]])
+    pd.testing.assert_frame_equal(state.update(appended), batch_indicators(appended), rtol=1e-9)
+
+
+@pytest.mark.parametrize('frame', [
+    BARS.iloc[1:310],                                   # first timestamp moved
+    pd.concat([BARS.iloc[:299], BARS.iloc[300:310]]),   # last known timestamp gone
+    BARS.iloc[:250],                                    # shorter than before
+])
+def test_other_changes_cold_start(monkeypatch, frame):
+    state = IndicatorState()
+    state.update(BARS.iloc[:300])
+    cold_starts = []
+    cold_start = state.cold_start
+    monkeypatch.setattr(state, 'cold_start', lambda data: (cold_starts.append(len(data)), cold_start(data)))
+
+    pd.testing.assert_frame_equal(state.update(frame), batch_indicators(frame), rtol=1e-9)
+    assert cold_starts == [len(frame)]
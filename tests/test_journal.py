@@ -0,0 +1,74 @@
+"""Trade journal filters and the CSV export/import round trip"""
+from dataclasses import replace
+
+import pytest
+
+from swing_core.journal import Trade, TradeJournal
+
+
+def trade(entry_date: str, symbol: str = 'QQQ', **fields) -> Trade:
+    return Trade(entry_date, '09:45', 400.0, 25, 395.0, 410.0, 415.0, symbol=symbol, **fields)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = TradeJournal(str(tmp_path / 'journal.db'))
+    open_trade = trade('2024-03-04', notes='pullback, "EMA 21"', tags=['swing', 'earnings'])
+    closed = trade('2024-03-01', 'SPY')
+    untagged = trade('2024-03-08', tags=[])
+    journal.add_many([open_trade, closed, untagged])
+    journal.close_trade(closed, '2024-03-06', '15:55', 404.5, 'Target 1')
+    yield journal
+    journal.close()
+
+
+def test_filters_and_counts(journal):
+    assert journal.count() == 3
+    assert journal.count(active=True) == 2
+    assert journal.count(active=False) == 1
+    assert journal.count(symbol='QQQ', active=True) == 2
+    # start and end are inclusive entry dates
+    assert [t.entry_date for t in journal.trades(start='2024-03-04', end='2024-03-08')] == ['2024-03-04',
+                                                                                           '2024-03-08']
+    assert journal.count(start='2024-03-02', end='2024-03-07') == 1
+    assert journal.count(end='2024-02-29') == 0
+    assert [t.symbol for t in journal.active_trades()] == ['QQQ', 'QQQ']
+
+
+def test_csv_round_trip(journal, tmp_path):
+    path = str(tmp_path / 'trades.csv')
+    assert journal.export_csv(path) == 3
+
+    copy = TradeJournal(str(tmp_path / 'copy.db'))
+    assert copy.import_csv(path) == 3
+    original, imported = list(journal.trades()), list(copy.trades())
+    copy.close()
+    # New ids, numbered in export order; everything else as stored
+    assert [t.id for t in imported] == [1, 2, 3]
+    assert [replace(t, id=None) for t in imported] == [replace(t, id=None) for t in original]
+
+    # Empty CSV cells come back as NULL exits, not empty strings
+    open_trade = imported[1]
+    assert open_trade.exit_date is open_trade.exit_price is open_trade.pnl is open_trade.exit_reason is None
+    assert open_trade.tags == ['swing', 'earnings'] and open_trade.notes == 'pullback, "EMA 21"'
+    assert imported[2].tags == []
+    assert imported[0].pnl == pytest.approx(112.5)
+
+
+def test_import_keeps_or_renumbers_ids(journal, tmp_path):
+    path = str(tmp_path / 'trades.csv')
+    assert journal.export_csv(path, active=False) == 1
+    closed = next(journal.trades(active=False))
+
+    # Without keep_ids the row is appended under a new id
+    journal.import_csv(path)
+    assert journal.count() == 4
+    assert [t.id for t in journal.trades(active=False)] == [closed.id, 4]
+
+    # With keep_ids it replaces the row with the same id, restoring it in place
+    closed.notes = 'edited'
+    journal.update(closed)
+    assert journal.import_csv(path, keep_ids=True) == 1
+    assert journal.count() == 4
+    restored = next(t for t in journal.trades() if t.id == closed.id)
+    assert restored.notes == '' and restored.exit_price == 404.5 and not restored.is_active
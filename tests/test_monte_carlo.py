@@ -0,0 +1,51 @@
+"""Monte Carlo resampling: seeding, shuffle invariants and ruin"""
+import numpy as np
+import pytest
+
+from swing_core.monte_carlo import run_monte_carlo
+
+R_MULTIPLES = np.random.default_rng(0).normal(0.3, 1.5, size=40)
+
+
+@pytest.mark.parametrize('method', ['bootstrap', 'shuffle'])
+def test_seeded_results_do_not_depend_on_workers(method):
+    # 400 cells per chunk - 40 chunks of 10 paths
+    runs = [run_monte_carlo(R_MULTIPLES, n_paths=400, method=method, seed=7, max_workers=workers, chunk_cells=400)
+            for workers in (1, 3)]
+    for field in ('final_equity', 'max_drawdown_pct', 'ruined'):
+        np.testing.assert_array_equal(getattr(runs[0], field), getattr(runs[1], field), err_msg=field)
+
+    other = run_monte_carlo(R_MULTIPLES, n_paths=400, method=method, seed=8, max_workers=1, chunk_cells=400)
+    assert not np.array_equal(other.max_drawdown_pct, runs[0].max_drawdown_pct)
+
+
+def test_shuffle_keeps_final_equity():
+    result = run_monte_carlo(R_MULTIPLES, risk_percent=2.0, account_value=50000, n_paths=200, method='shuffle',
+                             seed=1)
+    expected = 50000 * np.prod(1 + R_MULTIPLES * 2.0 / 100)
+    np.testing.assert_allclose(result.final_equity, expected, rtol=1e-12)
+    # Only the order, and so the path, changes
+    assert len(np.unique(result.max_drawdown_pct)) > 1
+
+
+@pytest.mark.parametrize('ruin_percent, ruined', [(50.0, True), (55.0, False)])
+def test_ruin_percent_threshold(ruin_percent, ruined):
+    # Seven straight 1R losses at 10% risk bottom out at 0.9 ** 7 = 47.8% of the account
+    result = run_monte_carlo(np.full(7, -1.0), risk_percent=10.0, n_paths=20, method='shuffle',
+                             ruin_percent=ruin_percent, seed=0)
+    np.testing.assert_allclose(result.final_equity, 100000 * 0.9 ** 7)
+    assert result.ruined.tolist() == [ruined] * 20
+    assert result.risk_of_ruin_pct == (100.0 if ruined else 0.0)
+
+
+@pytest.mark.parametrize('r_multiples, kwargs', [([], {}), (R_MULTIPLES, {'n_paths': 0}),
+                                                  (R_MULTIPLES, {'n_trades': 0})])
+def test_nothing_to_simulate(r_multiples, kwargs):
+    result = run_monte_carlo(r_multiples, seed=0, **kwargs)
+    assert len(result.final_equity) == len(result.max_drawdown_pct) == len(result.ruined) == 0
+    assert result.risk_of_ruin_pct == 0.0
+
+
+def test_shuffle_needs_every_trade():
+    with pytest.raises(ValueError):
+        run_monte_carlo(R_MULTIPLES, n_trades=10, method='shuffle')
@@ -0,0 +1,43 @@
+"""Parameter sweep and walk-forward on the dashboard's warmed indicator frame"""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core.backtest import match_trades
+from swing_core.config import TradeConfig
+from swing_core.indicators import add_indicators
+from swing_core.optimizer import grid_configs, run_sweep
+from swing_core.signals import calculate_signal_frame
+from swing_core.walk_forward import precompute_signals
+
+CONFIG = TradeConfig()
+
+
+def dashboard_data(seed: int):
+    """Indicators warmed on the whole history, then the trailing window the dashboard shows"""
+    history = random_walk_bars(1200, seed=seed)
+    return add_indicators(history, CONFIG.ema_periods, CONFIG.atr_period, CONFIG.volume_period).iloc[-500:]
+
+
+# Seed 1 trades once more when the indicators start cold on the window's first bar
+@pytest.mark.parametrize('seed, max_workers', [(1, 1), (11, 1), (11, 2)])
+def test_sweep_matches_dashboard_backtest(seed, max_workers):
+    data = dashboard_data(seed)
+    configs = grid_configs(CONFIG, {'atr_entry_multiplier': [CONFIG.atr_entry_multiplier, 2.0]})
+    results = run_sweep(data, configs, max_workers=max_workers, chunk_size=1, indicators=CONFIG)
+
+    trades = match_trades(calculate_signal_frame(data, CONFIG.atr_entry_multiplier), CONFIG)
+    row = results[results['atr_entry_multiplier'] == CONFIG.atr_entry_multiplier].iloc[0]
+    assert row['Trades'] == len(trades)
+    assert row['Total_PnL'] == pytest.approx(trades['Total_Profit'].sum() if len(trades) else 0.0,
+                                             abs=max(len(trades), 1))
+
+
+def test_walk_forward_uses_warmed_columns():
+    data = dashboard_data(11)
+    arrays = precompute_signals(data, [CONFIG], indicators=CONFIG)
+    np.testing.assert_array_equal(arrays['ema_5'][0], data['EMA_5'])
+    np.testing.assert_array_equal(arrays['atr'][0], data['ATR'])
+
+    cold = precompute_signals(data, [CONFIG])
+    assert not np.array_equal(cold['ema_5'][0][:50], data['EMA_5'].to_numpy()[:50])
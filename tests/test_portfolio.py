@@ -0,0 +1,58 @@
+"""Capital and risk limits in the portfolio walk over hand-built candidates"""
+import numpy as np
+import pytest
+
+from swing_core.portfolio import DAILY_LOSS, FULL, HELD, NO_CASH, TAKEN, simulate_portfolio
+
+
+def run(trades, **limits) -> dict:
+    """trades are (symbol, entry, exit, entry_price, exit_price, stop_loss), one bar per session"""
+    symbol, entry, exit_, entry_price, exit_price, stop_loss = (np.array(column) for column in zip(*trades))
+    return simulate_portfolio(symbol, entry, exit_, entry, exit_, entry_price, exit_price, stop_loss, **limits)
+
+
+def test_max_positions_caps_open_trades():
+    result = run([(0, 0, 10, 10.0, 11.0, 9.0), (1, 1, 10, 10.0, 11.0, 9.0), (2, 2, 10, 10.0, 11.0, 9.0),
+                  (3, 10, 12, 10.0, 11.0, 9.0)], max_positions=2)
+    assert result['skip'].tolist() == [TAKEN, TAKEN, FULL, TAKEN]
+
+
+def test_symbol_already_held_is_skipped():
+    result = run([(0, 0, 5, 10.0, 11.0, 9.0), (0, 2, 8, 10.0, 11.0, 9.0), (0, 5, 8, 10.0, 11.0, 9.0)])
+    # Free again on the bar it exited
+    assert result['skip'].tolist() == [TAKEN, HELD, TAKEN]
+    assert result['shares'][1] == 0 and result['profit'][1] == 0
+
+
+def test_daily_loss_limit_skips_the_rest_of_the_session():
+    # 1000 shares stopped out 5 lower is 5% of the account, past the 3% limit
+    result = run([(0, 0, 1, 100.0, 95.0, 99.0), (1, 1, 3, 10.0, 11.0, 9.0), (2, 2, 3, 10.0, 11.0, 9.0)],
+                 daily_loss_limit=3.0)
+    assert result['skip'].tolist() == [TAKEN, DAILY_LOSS, TAKEN]
+    np.testing.assert_allclose(result['profit'], [-5000.0, 0.0, 950.0])
+
+    # Turned off, the same candidate is taken
+    assert run([(0, 0, 1, 100.0, 95.0, 99.0), (1, 1, 3, 10.0, 11.0, 9.0)],
+               daily_loss_limit=0)['skip'].tolist() == [TAKEN, TAKEN]
+
+
+def test_size_is_capped_by_cash_and_skipped_without_it():
+    # A 0.10 stop wants 10000 shares but the account only pays for 1000
+    result = run([(0, 0, 10, 100.0, 101.0, 99.9), (1, 1, 10, 100.0, 101.0, 99.0)])
+    assert result['shares'].tolist() == [1000, 0]
+    assert result['skip'].tolist() == [TAKEN, NO_CASH]
+
+
+def test_same_bar_exit_is_realized_before_the_entry():
+    # The first trade ties up all the cash and the only slot until bar 5
+    result = run([(0, 0, 5, 100.0, 101.0, 99.9), (1, 5, 8, 100.0, 101.0, 99.0)], max_positions=1)
+    assert result['skip'].tolist() == [TAKEN, TAKEN]
+    # Sized from equity after the first exit: 1% of 101000 over a 1.00 stop
+    assert result['shares'].tolist() == [1000, 1010]
+
+
+@pytest.mark.parametrize('first_exit, shares', [(3, 1100), (20, 1000)])
+def test_risk_is_sized_from_realized_equity(first_exit, shares):
+    # A 10-point winner on 1000 shares counts only once it has exited
+    result = run([(0, 0, first_exit, 10.0, 20.0, 9.0), (1, 5, 30, 50.0, 51.0, 49.0)])
+    assert result['shares'].tolist() == [1000, shares]
@@ -0,0 +1,71 @@
+"""Refresh worker poll intervals across subscribers"""
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core import refresh
+from swing_core.refresh import RefreshWorker
+
+KEY = ('QQQ', '1d', '2y')
+
+
+class StaticStore:
+    def load_history(self, symbol, interval, period, force=False):
+        return random_walk_bars(50, seed=1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(refresh.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def worker(clock):
+    return RefreshWorker(StaticStore(), vix_symbol=None, subscriber_ttl=100)
+
+
+def test_polls_at_the_smallest_interval(worker, clock):
+    worker.subscribe(*KEY, 60, subscriber='a')
+    worker.subscribe(*KEY, 10, subscriber='b')
+    # A later rerun of the slower session does not slow the key down again
+    worker.subscribe(*KEY, 60, subscriber='a')
+    assert worker.poll_interval(KEY) == 10
+    assert worker._due[KEY] == 10
+
+    clock[0] = 10
+    worker.refresh(KEY)
+    assert worker._due[KEY] == 20
+
+
+def test_unsubscribe_drops_one_interval(worker):
+    worker.subscribe(*KEY, 60, subscriber='a')
+    worker.subscribe(*KEY, 10, subscriber='b')
+    worker.refresh(KEY)
+
+    worker.unsubscribe(KEY, 'b')
+    assert worker.poll_interval(KEY) == 60
+    assert worker.snapshot(KEY) is not None
+
+    worker.unsubscribe(KEY, 'a')
+    assert worker.poll_interval(KEY) is None
+    assert worker.snapshot(KEY) is None
+
+
+def test_unsubscribe_everyone(worker):
+    worker.subscribe(*KEY, 60, subscriber='a')
+    worker.subscribe(*KEY, 10, subscriber='b')
+    worker.unsubscribe(KEY)
+    assert worker.poll_interval(KEY) is None
+    assert KEY not in worker._due
+
+
+def test_quiet_subscribers_stop_counting(worker, clock):
+    worker.subscribe(*KEY, 10, subscriber='a')
+    clock[0] = 50
+    worker.subscribe(*KEY, 60, subscriber='b')
+    assert worker.poll_interval(KEY) == 10
+
+    # 'a' has not rerun for longer than subscriber_ttl
+    clock[0] = 120
+    assert worker.poll_interval(KEY) == 60
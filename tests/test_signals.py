@@ -0,0 +1,152 @@
+"""The vectorized signal engine and trade kernel against the original per-bar loops"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core.backtest import build_trade_table, simulate_trades
+from swing_core.indicators import add_indicators
+from swing_core.signals import WARMUP_BARS, calculate_signal_frame
+
+SEEDS = (0, 1, 2, 3)
+CRITERIA_COLUMNS = ('EMA_Alignment', 'Price_Above_50EMA', 'Entry_Level_Touch', 'Volume_Above_Avg',
+                    'Momentum_Positive')
+
+
+def loop_signals(data: pd.DataFrame) -> pd.DataFrame:
+    """The dashboard's original calculate_historical_signals, one bar at a time"""
+    signals_history = []
+    for i in range(50, len(data)):
+        current_data = data.iloc[:i + 1]
+        latest = current_data.iloc[-1]
+
+        ema_alignment = latest['EMA_10'] > latest['EMA_21'] > latest['EMA_50']
+        price_above_50ema = latest['Close'] > latest['EMA_50']
+        entry_level = latest['EMA_5'] - (1.5 * latest['ATR'])
+        price_touch_entry = latest['Close'] <= entry_level or latest['Low'] <= entry_level
+        volume_above_avg = latest['Volume'] > latest['Volume_Avg']
+        vix_below_threshold = True
+        if i >= 55:
+            momentum_positive = latest['Close'] > current_data['Close'].iloc[-6]
+        else:
+            momentum_positive = True
+
+        entry_signal = all([ema_alignment, price_above_50ema, price_touch_entry, volume_above_avg,
+                            vix_below_threshold, momentum_positive])
+
+        prev_close = data['Close'].iloc[i - 1]
+        current_close = latest['Close']
+        exit_signal = current_close < latest['EMA_21'] * 0.97 or (current_close - prev_close) / prev_close < -0.03
+
+        signals_history.append({
+            'Date': data.index[i],
+            'Close': latest['Close'],
+            'Entry_Signal': entry_signal,
+            'Exit_Signal': exit_signal,
+            'EMA_Alignment': ema_alignment,
+            'Price_Above_50EMA': price_above_50ema,
+            'Entry_Level_Touch': price_touch_entry,
+            'Volume_Above_Avg': volume_above_avg,
+            'Momentum_Positive': momentum_positive,
+            'Entry_Level': entry_level,
+            'EMA_5': latest['EMA_5'],
+            'ATR': latest['ATR'],
+        })
+    return pd.DataFrame(signals_history)
+
+
+def loop_trades(signals_df: pd.DataFrame) -> pd.DataFrame:
+    """The dashboard's original match_entry_exit_signals, one entry at a time, without its target heuristics"""
+    trades = []
+    entry_signals = signals_df[signals_df['Entry_Signal']]
+    exit_signals = signals_df[signals_df['Exit_Signal']]
+    for _, entry in entry_signals.iterrows():
+        entry_date = entry['Date']
+        entry_price = entry['Close']
+        stop_loss = max(entry_price - (2.0 * entry['ATR']), entry_price * 0.98)
+        target1 = entry['EMA_5'] + (2.0 * entry['ATR'])
+        target2 = entry['EMA_5'] + (3.0 * entry['ATR'])
+        risk_per_share = entry_price - stop_loss
+        shares = int(1000 / risk_per_share) if risk_per_share > 0 else 100
+
+        ten_days_later = entry_date + pd.Timedelta(days=10)
+        future_exits = exit_signals[(exit_signals['Date'] > entry_date) & (exit_signals['Date'] <= ten_days_later)]
+        if not future_exits.empty:
+            exit_row = future_exits.iloc[0]
+        else:
+            time_exit_data = signals_df[signals_df['Date'] >= ten_days_later]
+            if time_exit_data.empty:
+                continue
+            exit_row = time_exit_data.iloc[0]
+
+        profit_loss = exit_row['Close'] - entry_price
+        trades.append({
+            'Entry_Date': entry_date.strftime('%Y-%m-%d'),
+            'Entry_Price': round(entry_price, 2),
+            'Exit_Date': exit_row['Date'].strftime('%Y-%m-%d'),
+            'Exit_Price': round(exit_row['Close'], 2),
+            'Hold_Days': (exit_row['Date'] - entry_date).days,
+            'Stop_Loss': round(stop_loss, 2),
+            'Target_1': round(target1, 2),
+            'Target_2': round(target2, 2),
+            'Price_Change': round(profit_loss, 2),
+            'Profit_Pct': round((profit_loss / entry_price) * 100, 2),
+            'Shares': shares,
+            'Total_Profit': round(profit_loss * shares, 0),
+        })
+    return pd.DataFrame(trades)
+
+
+def bars(n_bars: int, seed: int) -> pd.DataFrame:
+    return add_indicators(random_walk_bars(n_bars, seed=seed))
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_signal_frame_matches_loop(seed):
+    data = bars(600, seed)
+    expected = loop_signals(data)
+    actual = calculate_signal_frame(data)
+
+    assert len(actual) == len(expected) == len(data) - WARMUP_BARS
+    assert (pd.DatetimeIndex(actual['Date']) == pd.DatetimeIndex(expected['Date'])).all()
+    assert expected['Entry_Signal'].any() and expected['Exit_Signal'].any()
+    for column in ('Entry_Signal', 'Exit_Signal') + CRITERIA_COLUMNS:
+        np.testing.assert_array_equal(actual[column].to_numpy(dtype=bool), expected[column].to_numpy(dtype=bool),
+                                      err_msg=column)
+    np.testing.assert_array_equal(actual['Entry_Level'], expected['Entry_Level'])
+    np.testing.assert_array_equal(actual['Close'], expected['Close'])
+
+
+@pytest.mark.parametrize('n_bars', [WARMUP_BARS, WARMUP_BARS + 1, WARMUP_BARS + 5, WARMUP_BARS + 6, WARMUP_BARS + 7])
+def test_warmup_boundary(n_bars):
+    data = bars(n_bars, seed=7)
+    expected = loop_signals(data)
+    actual = calculate_signal_frame(data)
+    if expected.empty:
+        assert actual.empty
+        return
+
+    # The first signal bar is WARMUP_BARS; momentum passes until five closes back exist past it
+    assert actual['Date'].iloc[0] == data.index[WARMUP_BARS]
+    for column in ('Entry_Signal', 'Exit_Signal') + CRITERIA_COLUMNS:
+        np.testing.assert_array_equal(actual[column].to_numpy(dtype=bool), expected[column].to_numpy(dtype=bool),
+                                      err_msg=column)
+    assert actual['Momentum_Positive'].iloc[:5].all()
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_trade_table_matches_loop(seed):
+    signals = calculate_signal_frame(bars(1500, seed))
+    expected = loop_trades(signals)
+    assert not expected.empty
+
+    # Bars that never reach the stop or targets leave only the signal and 10-day exits of the original
+    n = len(signals)
+    dates = pd.DatetimeIndex(signals['Date'])
+    trades = simulate_trades(
+        dates.as_unit('ns').asi8, signals['Open'].to_numpy(), np.zeros(n), np.full(n, 1e12),
+        signals['Close'].to_numpy(), signals['Entry_Signal'].to_numpy(), signals['Exit_Signal'].to_numpy(),
+        signals['EMA_5'].to_numpy(), signals['ATR'].to_numpy(),
+    )
+    actual = build_trade_table(dates, trades)
+    pd.testing.assert_frame_equal(actual[list(expected.columns)], expected, check_dtype=False)
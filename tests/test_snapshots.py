@@ -0,0 +1,66 @@
+"""Shared snapshot eviction and refresh subscriptions"""
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import random_walk_bars
+from swing_core import snapshots
+from swing_core.snapshots import SnapshotRegistry
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(snapshots.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def daily(key):
+    return (key[0], '1d', key[2])
+
+
+def test_subscription_outlives_keys_still_using_it(clock):
+    evicted = []
+    registry = SnapshotRegistry(ttl_seconds=10, on_evict=evicted.append, subscription=daily)
+    registry.acquire('a', ('QQQ', '1d', '2y'))
+    registry.acquire('b', ('QQQ', '1d+1m', '2y'))
+
+    # The daily key goes idle and is evicted while the intraday key is still held
+    registry.release('a')
+    clock[0] = 11
+    registry.acquire('b', ('QQQ', '1d+1m', '2y'))
+    assert len(registry) == 1
+    assert evicted == []
+
+    registry.release('b')
+    clock[0] = 22
+    registry.release('b')
+    assert len(registry) == 0
+    assert evicted == [('QQQ', '1d', '2y')]
+
+
+def test_recreated_key_subscribes_again(clock):
+    evicted = []
+    registry = SnapshotRegistry(ttl_seconds=10, on_evict=evicted.append, subscription=daily)
+    for _ in range(2):
+        registry.acquire('a', ('SPY', '1d+5m', '1y'))
+        registry.release('a')
+        clock[0] += 11
+        registry.release('a')
+    assert evicted == [('SPY', '1d', '1y')] * 2
+
+
+def test_session_changes_stay_out_of_the_shared_frame():
+    history = random_walk_bars(120, seed=2)
+    key, periods = ('QQQ', '1d', 'max'), ((5, 10, 21, 50), 14, 20)
+    registry = SnapshotRegistry()
+    registry.acquire('a', key)
+    data = registry.snapshot(key, periods, history).data
+    close = data['Close'].copy()
+
+    data.loc[data.index[-1], 'Close'] = -1.0
+    data['Close'] *= 2
+    data['Mine'] = 1.0
+
+    shared = registry.snapshot(key, periods, history).data
+    pd.testing.assert_series_equal(shared['Close'], close)
+    assert 'Mine' not in shared